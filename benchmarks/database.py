@@ -0,0 +1,213 @@
+"""
+Throughput and latency benchmark of the RocksDB data layer, on synthetic documents.
+
+Each operation is measured at one of three layers: `collection` (the Cython
+`Collection`, synchronous), `store` (the async `Store`, through the `db` executor)
+or `model` (`RocksDBModel` classmethods, including pydantic hydration).
+
+    python -m benchmarks.database --size 1000 --size 100000 --dim 512 --dim 4096
+    python -m benchmarks.database --layer model --op find_all --output run.json
+"""
+
+import asyncio
+import inspect
+import shutil
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+
+import click
+import numpy as np
+import orjson
+
+from src.data.database import RocksDBModel, Store
+
+OPS = ("create", "update", "find_one", "find_many", "find_all", "count", "cosim")
+WORDS = np.array(
+    "the quick brown fox jumps over lazy dog lorem ipsum dolor sit amet".split()
+)
+
+
+class Document(RocksDBModel):
+    value: list[float]
+    content: str
+    namespace: str
+
+
+def synthetic(
+    size: int, dim: int, seed: int = 0, namespaces: int = 100
+) -> Iterator[Document]:
+    """
+    Generates `size` documents with random unit vectors of `dim` dimensions, a
+    random sentence and one of `namespaces` namespaces.
+    """
+    rng = np.random.default_rng(seed)
+    for i in range(size):
+        vector = rng.standard_normal(dim, dtype=np.float32)
+        vector /= np.linalg.norm(vector)
+        yield Document(
+            id=f"doc-{i:08d}",
+            value=vector.tolist(),
+            content=" ".join(rng.choice(WORDS, 16)),
+            namespace=f"ns-{i % namespaces}",
+        )
+
+
+def summary(latencies: list[int]) -> dict[str, Any]:
+    samples = np.array(latencies) / 1e3
+    elapsed = samples.sum() / 1e6
+    return {
+        "calls": len(latencies),
+        "seconds": float(elapsed),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_us": {
+            "p50": float(np.percentile(samples, 50)),
+            "p90": float(np.percentile(samples, 90)),
+            "p99": float(np.percentile(samples, 99)),
+            "max": float(samples.max()),
+        },
+    }
+
+
+async def measure(
+    call: Callable[..., Any], calls: Iterable[tuple[Any, ...]]
+) -> dict[str, Any]:
+    """
+    Times every call, awaiting it when the layer is asynchronous. Generating the
+    arguments is not timed.
+    """
+    latencies: list[int] = []
+    for args in calls:
+        begin = time.perf_counter_ns()
+        result = call(*args)
+        if inspect.isawaitable(result):
+            await result
+        latencies.append(time.perf_counter_ns() - begin)
+    return summary(latencies)
+
+
+def operations(
+    layer: str, store: Store[Document]
+) -> dict[str, Callable[..., Any | Awaitable[Any]]]:
+    if layer == "collection":
+        col = store.col
+        return {
+            "create": lambda doc: col.create(doc.id, doc.model_dump()),
+            "update": lambda doc: col.update(doc.id, doc.model_dump()),
+            "find_one": col.find_one,
+            "find_many": lambda ns: col.find_many({"namespace": ns}),
+            "find_all": col.find_all,
+            "count": col.count,
+        }
+    if layer == "store":
+        return {
+            "create": store.create,
+            "update": store.update,
+            "find_one": store.find_one,
+            "find_many": lambda ns: store.find_many(namespace=ns),
+            "find_all": store.find_all,
+            "count": store.count,
+            "cosim": lambda vector: store.cosim(vector, 10),
+        }
+    return {
+        "create": lambda doc: doc.save(),
+        "update": lambda doc: doc.save(),
+        "find_one": Document.find_one,
+        "find_many": lambda ns: Document.find_many(namespace=ns),
+        "find_all": Document.find_all,
+        "count": Document.count,
+        "cosim": lambda vector: Document.cosim(vector, 10),
+    }
+
+
+async def run(
+    layer: str,
+    size: int,
+    dim: int,
+    ops: list[str],
+    samples: int,
+    scans: int,
+    path: str,
+    seed: int,
+) -> list[dict[str, Any]]:
+    store = Store[Document](f"{path}/{layer}-{size}-{dim}")
+    Document.store = store  # type: ignore
+    calls = operations(layer, store)
+    rng = np.random.default_rng(seed + 1)
+    keys = rng.integers(0, size, samples)
+    inputs: dict[str, Callable[[], Iterable[tuple[Any, ...]]]] = {
+        "create": lambda: ((doc,) for doc in synthetic(size, dim, seed)),
+        "update": lambda: [
+            (doc.model_copy(update={"id": f"doc-{k:08d}"}),)
+            for k, doc in zip(keys, synthetic(samples, dim, seed + 2))
+        ],
+        "find_one": lambda: [(f"doc-{k:08d}",) for k in keys],
+        "find_many": lambda: [(f"ns-{k % 100}",) for k in keys[:scans]],
+        "find_all": lambda: [()] * scans,
+        "count": lambda: [()] * scans,
+        "cosim": lambda: [
+            (rng.standard_normal(dim, dtype=np.float32).tolist(),)
+            for _ in range(scans)
+        ],
+    }
+    results = []
+    for op in ("create", *[op for op in ops if op != "create"]):
+        if op not in calls:
+            continue
+        result = await measure(calls[op], inputs[op]())
+        if op != "create" or "create" in ops:
+            results.append(
+                {"layer": layer, "size": size, "dim": dim, "op": op, **result}
+            )
+    return results
+
+
+@click.command()
+@click.option(
+    "--layer",
+    "layers",
+    multiple=True,
+    default=["store"],
+    type=click.Choice(["collection", "store", "model"]),
+)
+@click.option("--size", "sizes", multiple=True, default=[1_000, 10_000], type=int)
+@click.option("--dim", "dims", multiple=True, default=[512], type=int)
+@click.option("--op", "ops", multiple=True, default=OPS, type=click.Choice(OPS))
+@click.option("--samples", default=1_000, help="Calls of the point operations.")
+@click.option("--scans", default=5, help="Calls of the full scan operations.")
+@click.option("--seed", default=0)
+@click.option("--path", default=None, help="Directory of the databases.")
+@click.option("--output", default=None, help="Write the results to a JSON file.")
+def main(
+    layers: list[str],
+    sizes: list[int],
+    dims: list[int],
+    ops: list[str],
+    samples: int,
+    scans: int,
+    seed: int,
+    path: str | None,
+    output: str | None,
+) -> None:
+    directory = path or tempfile.mkdtemp(prefix="bench-db-")
+    results: list[dict[str, Any]] = []
+    try:
+        for layer in layers:
+            for size in sizes:
+                for dim in dims:
+                    coro = run(
+                        layer, size, dim, list(ops), samples, scans, directory, seed
+                    )
+                    for result in asyncio.run(coro):
+                        click.echo(orjson.dumps(result))
+                        results.append(result)
+    finally:
+        if path is None:
+            shutil.rmtree(directory, ignore_errors=True)
+    if output:
+        with open(output, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=E1120
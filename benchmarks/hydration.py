@@ -0,0 +1,103 @@
+"""
+Cost of building `RocksDBModel` instances from stored documents, on synthetic
+threads with long conversations.
+
+Documents are compared as decoded by the collection, built with validation
+(`Thread(**data)`), validated straight from the stored bytes
+(`Thread.model_validate_json`) and built with `construct`, the trusted read path of
+`RocksDBModel.hydrate`.
+
+    python -m benchmarks.hydration --messages 10 --messages 100 --messages 1000
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import orjson
+
+from src.data.database import construct
+from src.schemas.conversation import Thread
+
+WORDS = np.array(
+    "the quick brown fox jumps over lazy dog lorem ipsum dolor sit amet".split()
+)
+
+
+def synthetic(docs: int, messages: int, seed: int = 0) -> list[bytes]:
+    """
+    Generates `docs` stored threads of `messages` messages, as the collection
+    stores them. Built as plain dicts, since dumping a `Thread` would load the
+    tokenizer for its `token_count`.
+    """
+    rng = np.random.default_rng(seed)
+    return [
+        orjson.dumps(
+            {
+                "id": f"thread-{i:08d}",
+                "namespace": f"ns-{i % 100}",
+                "title": " ".join(rng.choice(WORDS, 4)),
+                "conversation": {
+                    "instructions": " ".join(rng.choice(WORDS, 32)),
+                    "messages": [
+                        {
+                            "role": ("user", "assistant")[j % 2],
+                            "content": " ".join(rng.choice(WORDS, 48)),
+                        }
+                        for j in range(messages)
+                    ],
+                },
+                "token_count": messages * 48,
+            }
+        )
+        for i in range(docs)
+    ]
+
+
+def measure(build: Callable[[Any], Any], inputs: list[Any], rounds: int) -> float:
+    """
+    Returns the best per-document time in microseconds over `rounds` rounds.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        begin = time.perf_counter_ns()
+        for value in inputs:
+            build(value)
+        best = min(best, (time.perf_counter_ns() - begin) / len(inputs))
+    return best / 1e3
+
+
+@click.command()
+@click.option("--messages", "sizes", multiple=True, default=[10, 100, 1_000], type=int)
+@click.option("--docs", default=200, help="Documents per round.")
+@click.option("--rounds", default=5)
+@click.option("--seed", default=0)
+def main(sizes: list[int], docs: int, rounds: int, seed: int) -> None:
+    for messages in sizes:
+        raw = synthetic(docs, messages, seed)
+        decoded = [orjson.loads(doc) for doc in raw]
+        validated = [Thread(**data) for data in decoded]
+        trusted = [construct(Thread, data) for data in decoded]
+        fields = set(Thread.model_fields)
+        assert all(
+            a.model_dump(include=fields) == b.model_dump(include=fields)
+            for a, b in zip(validated, trusted)
+        )
+        result = {
+            "messages": messages,
+            "docs": docs,
+            "per_doc_us": {
+                "decode": measure(orjson.loads, raw, rounds),
+                "validate": measure(lambda data: Thread(**data), decoded, rounds),
+                "validate_json": measure(Thread.model_validate_json, raw, rounds),
+                "construct": measure(
+                    lambda data: construct(Thread, data), decoded, rounds
+                ),
+            },
+        }
+        click.echo(orjson.dumps(result))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=E1120
@@ -0,0 +1,7 @@
+"""
+End-to-end load test of the API served by `create_app()`, against local stand-ins
+for the upstream services (OpenAI-compatible LLM, RunPod image runsync, Auth0
+userinfo and S3).
+
+    python -m benchmarks.loadtest --scenario thread --concurrency 64 --requests 2000
+"""
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import httpx
+import orjson
+
+from .fakes import Settings, create_fakes, serve
+from .scenarios import SCENARIOS, run
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def start_app(port: int, fakes_url: str, cwd: str) -> subprocess.Popen:
+    """
+    Starts the real app with its upstreams pointed at the fakes, in a scratch
+    directory so its RocksDB collections do not touch the repository.
+
+    The app runs a single worker process: RocksDB locks its collections for the
+    process opening them, so further uvicorn workers would fail to start.
+    """
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(ROOT),
+        "OPENAI_API_BASE": f"{fakes_url}/v1",
+        "OPENAI_API_KEY": "loadtest",
+        "IMAGE_API_URL": f"{fakes_url}/runsync",
+        "AUTH0_URL": fakes_url,
+        "S3_ENDPOINT_URL": fakes_url,
+        "MINIO_ROOT_USER": "loadtest",
+        "MINIO_ROOT_PASSWORD": "loadtest",
+        "JOB_WORKERS": "0",
+    }
+    app = subprocess.Popen(  # pylint: disable=R1732
+        [
+            sys.executable,
+            *("-m", "uvicorn", "src:create_app", "--factory"),
+            *("--port", str(port)),
+            *("--log-level", "warning"),
+        ],
+        env=env,
+        cwd=cwd,
+    )
+    for _ in range(300):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/openapi.json").raise_for_status()
+            return app
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    app.terminate()
+    raise RuntimeError("The app did not start")
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "scenarios",
+    multiple=True,
+    default=list(SCENARIOS),
+    type=click.Choice(list(SCENARIOS)),
+)
+@click.option("--concurrency", default=32)
+@click.option("--requests", default=500, help="Requests per scenario.")
+@click.option("--port", default=8765)
+@click.option("--fakes-port", default=8766)
+@click.option("--token-rate", default=50.0, help="Tokens per second of the fake LLM.")
+@click.option("--tokens", default=64, help="Tokens per fake completion.")
+@click.option("--first-token-delay", default=0.2)
+@click.option("--image-delay", default=1.0)
+@click.option("--object-size", default=1024 * 1024, help="Bytes of the S3 object.")
+@click.option("--timeout", default=60.0)
+def main(
+    scenarios: list[str],
+    concurrency: int,
+    requests: int,
+    port: int,
+    fakes_port: int,
+    token_rate: float,
+    tokens: int,
+    first_token_delay: float,
+    image_delay: float,
+    object_size: int,
+    timeout: float,
+) -> None:
+    settings = Settings(
+        token_rate=token_rate,
+        tokens=tokens,
+        first_token_delay=first_token_delay,
+        image_delay=image_delay,
+    )
+    settings.objects["tera/loadtest/object.bin"] = (
+        os.urandom(object_size),
+        "application/octet-stream",
+    )
+    fakes = serve(create_fakes(settings), fakes_port)
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as cwd:
+        app = start_app(port, f"http://127.0.0.1:{fakes_port}", cwd)
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            for name in scenarios:
+                result = asyncio.run(
+                    run(name, base_url, concurrency, requests, timeout)
+                )
+                click.echo(orjson.dumps(result))
+        finally:
+            app.terminate()
+            app.wait()
+            fakes.should_exit = True
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=E1120
@@ -0,0 +1,129 @@
+"""
+Local stand-ins for the upstream services used by the API.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+
+
+@dataclass
+class Settings:
+    """
+    Behaviour of the fake upstreams.
+
+    Attributes:
+            token_rate (float): Tokens per second streamed by the fake LLM.
+            tokens (int): Tokens per completion.
+            first_token_delay (float): Seconds before the first token.
+            image_delay (float): Seconds taken by the fake image runsync.
+            objects (dict): Objects of the fake S3, by `bucket/key`.
+    """
+
+    token_rate: float = 50
+    tokens: int = 64
+    first_token_delay: float = 0.2
+    image_delay: float = 1.0
+    objects: dict[str, tuple[bytes, str]] = field(default_factory=dict)
+
+
+def chunk(model: str, delta: dict[str, Any], finish: str | None = None) -> bytes:
+    data = {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+    }
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+def create_fakes(settings: Settings) -> FastAPI:
+    fakes = FastAPI()
+
+    @fakes.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake")
+
+        async def stream():
+            await asyncio.sleep(settings.first_token_delay)
+            yield chunk(model, {"role": "assistant", "content": ""})
+            for i in range(settings.tokens):
+                yield chunk(model, {"content": f"token{i} "})
+                await asyncio.sleep(1 / settings.token_rate)
+            yield chunk(model, {}, "stop")
+            yield b"data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    @fakes.post("/runsync")
+    async def runsync(request: Request):
+        body = await request.json()
+        await asyncio.sleep(settings.image_delay)
+        return {
+            "delayTime": 0,
+            "executionTime": int(settings.image_delay * 1000),
+            "id": str(uuid4()),
+            "output": {
+                "image_url": "https://example.com/image.png",
+                "images": ["https://example.com/image.png"],
+                "seed": body.get("seed", 42),
+            },
+            "status": "COMPLETED",
+        }
+
+    @fakes.get("/userinfo")
+    async def userinfo(request: Request):
+        token = request.headers.get("Authorization", "")
+        return {"sub": f"fake|{abs(hash(token))}", "name": "Load Test"}
+
+    @fakes.put("/{bucket}/{key:path}")
+    async def put_object(bucket: str, key: str, request: Request):
+        content_type = request.headers.get("Content-Type", "binary/octet-stream")
+        settings.objects[f"{bucket}/{key}"] = (await request.body(), content_type)
+        return Response(headers={"ETag": '"fake"'})
+
+    @fakes.get("/{bucket}/{key:path}")
+    @fakes.head("/{bucket}/{key:path}")
+    async def get_object(bucket: str, key: str, request: Request):
+        found = settings.objects.get(f"{bucket}/{key}")
+        if found is None:
+            return Response(
+                content=b"<Error><Code>NoSuchKey</Code></Error>",
+                status_code=404,
+                media_type="application/xml",
+            )
+        data, content_type = found
+        headers = {"Content-Length": str(len(data)), "ETag": '"fake"'}
+        if request.method == "HEAD":
+            return Response(headers=headers, media_type=content_type)
+        return Response(content=data, headers=headers, media_type=content_type)
+
+    @fakes.delete("/{bucket}/{key:path}")
+    async def delete_object(bucket: str, key: str):
+        settings.objects.pop(f"{bucket}/{key}", None)
+        return Response(status_code=204)
+
+    return fakes
+
+
+def serve(app: FastAPI, port: int) -> uvicorn.Server:
+    """
+    Serves an app on a background thread, returning once it accepts connections.
+    """
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, name="fakes", daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
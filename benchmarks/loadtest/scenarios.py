@@ -0,0 +1,132 @@
+"""
+Scenarios driving the API, and the closed-loop runner measuring them.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import httpx
+import numpy as np
+
+
+@dataclass
+class Result:
+    status: int
+    latency: float
+    ttft: float | None = None
+
+
+Scenario = Callable[[httpx.AsyncClient], Awaitable[Result]]
+
+
+async def stream(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> Result:
+    """
+    Sends a request and reads its body, timing the first server-sent event.
+    """
+    start = time.perf_counter()
+    ttft = None
+    async with client.stream(method, url, **kwargs) as response:
+        async for line in response.aiter_lines():
+            if ttft is None and line.startswith("data:"):
+                ttft = time.perf_counter() - start
+    return Result(response.status_code, time.perf_counter() - start, ttft)
+
+
+async def thread(client: httpx.AsyncClient) -> Result:
+    return await stream(
+        client,
+        "POST",
+        f"/api/thread/{uuid4()}",
+        json={
+            "instructions": "You are a helpful assistant.",
+            "messages": [{"role": "user", "content": "Tell me a story."}],
+        },
+    )
+
+
+async def thread_history(client: httpx.AsyncClient) -> Result:
+    return await stream(client, "GET", "/api/thread/loadtest")
+
+
+async def image(client: httpx.AsyncClient) -> Result:
+    return await stream(client, "POST", "/api/image", json={"prompt": "A cat"})
+
+
+async def auth(client: httpx.AsyncClient) -> Result:
+    return await stream(
+        client, "POST", "/api/auth", headers={"Authorization": "Bearer loadtest"}
+    )
+
+
+async def storage(client: httpx.AsyncClient) -> Result:
+    return await stream(
+        client,
+        "GET",
+        "/api/storage/loadtest/object.bin",
+        headers={"Authorization": "Bearer loadtest"},
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "thread": thread,
+    "thread_history": thread_history,
+    "image": image,
+    "auth": auth,
+    "storage": storage,
+}
+
+
+def percentiles(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    samples = np.array(values) * 1e3
+    return {
+        "p50": float(np.percentile(samples, 50)),
+        "p99": float(np.percentile(samples, 99)),
+        "max": float(samples.max()),
+    }
+
+
+async def run(
+    name: str, base_url: str, concurrency: int, requests: int, timeout: float
+) -> dict[str, Any]:
+    """
+    Runs `requests` calls of a scenario with `concurrency` concurrent clients.
+    """
+    scenario = SCENARIOS[name]
+    results: list[Result] = []
+    errors: Counter[str] = Counter()
+    remaining = requests
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            try:
+                results.append(await scenario(client))
+            except httpx.HTTPError as e:
+                errors[e.__class__.__name__] += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=timeout
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    ok = [r for r in results if r.status < 400]
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": requests,
+        "seconds": elapsed,
+        "throughput": len(ok) / elapsed,
+        "status": dict(Counter(str(r.status) for r in results)),
+        "errors": dict(errors),
+        "latency_ms": percentiles([r.latency for r in ok]),
+        "ttft_ms": percentiles([r.ttft for r in ok if r.ttft is not None]),
+    }
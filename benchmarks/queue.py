@@ -0,0 +1,79 @@
+"""
+Throughput and latency benchmark of the `IQueue` backends.
+
+    python -m benchmarks.queue --backend local --backend unix --messages 100000
+"""
+
+import asyncio
+import time
+
+import click
+import numpy as np
+import orjson
+
+from src.interfaces.queue import IQueue
+
+
+async def run(
+    backend: str, messages: int, size: int, subscribers: int
+) -> dict[str, object]:
+    queue = IQueue[list[object]](maxsize=messages, overflow="block", backend=backend)  # type: ignore
+    payload = "x" * size
+    latencies: list[list[int]] = [[] for _ in range(subscribers)]
+    ready = asyncio.Event()
+    subscribed = 0
+
+    async def consume(index: int):
+        nonlocal subscribed
+        stream = queue.sub(key="bench")
+        pending = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.1)
+        subscribed += 1
+        if subscribed == subscribers:
+            ready.set()
+        received = 0
+        while True:
+            sent_at, _ = await pending
+            latencies[index].append(time.monotonic_ns() - sent_at)  # type: ignore
+            received += 1
+            if received == messages:
+                await stream.aclose()
+                return
+            pending = asyncio.ensure_future(stream.__anext__())
+
+    consumers = [asyncio.create_task(consume(i)) for i in range(subscribers)]
+    await ready.wait()
+    start = time.perf_counter()
+    for _ in range(messages):
+        await queue.pub(key="bench", data=[time.monotonic_ns(), payload])
+    await asyncio.gather(*consumers)
+    elapsed = time.perf_counter() - start
+    samples = np.array([l for ls in latencies for l in ls]) / 1e3
+    return {
+        "backend": backend,
+        "messages": messages,
+        "size": size,
+        "subscribers": subscribers,
+        "seconds": elapsed,
+        "throughput": messages * subscribers / elapsed,
+        "latency_us": {
+            "p50": float(np.percentile(samples, 50)),
+            "p99": float(np.percentile(samples, 99)),
+            "max": float(samples.max()),
+        },
+    }
+
+
+@click.command()
+@click.option("--backend", "backends", multiple=True, default=["local", "unix"])
+@click.option("--messages", default=100_000)
+@click.option("--size", default=64, help="Payload size in bytes.")
+@click.option("--subscribers", default=1)
+def main(backends: list[str], messages: int, size: int, subscribers: int) -> None:
+    for backend in backends:
+        result = asyncio.run(run(backend, messages, size, subscribers))
+        click.echo(orjson.dumps(result))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=E1120
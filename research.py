@@ -1,4 +1,5 @@
 import tempfile
+from functools import lru_cache
 from typing import Generator
 
 import click
@@ -8,16 +9,19 @@ import pytube
 import torch
 from whisper import load_model, transcribe
 
-print("Loading model...")
-
 SAMPLE_RATE = 16000
 CHUNK_DURATION = 6
 CHUNKSIZE = SAMPLE_RATE * CHUNK_DURATION
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 MODEL = "large" if torch.cuda.is_available() else "small"
-model = load_model(MODEL).to(DEVICE)
 
-print(f"Using model: {MODEL} on device: {DEVICE}")
+
+@lru_cache(maxsize=1)
+def get_model():
+    print("Loading model...")
+    model = load_model(MODEL).to(DEVICE)
+    print(f"Using model: {MODEL} on device: {DEVICE}")
+    return model
 
 
 def transcribe_youtube(url: str) -> Generator[str, None, None]:
@@ -36,7 +40,7 @@ def transcribe_youtube(url: str) -> Generator[str, None, None]:
 
             if len(chunk) < CHUNKSIZE:
                 chunk = np.pad(chunk, (0, CHUNKSIZE - len(chunk)), mode="constant")
-            text = transcribe(model, chunk)  # type: ignore
+            text = transcribe(get_model(), chunk)  # type: ignore
             yield text["text"]  # type: ignore
 
 
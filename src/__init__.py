@@ -1,7 +1,18 @@
-from fastapi import FastAPI
+import os
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from .admin import ADMIN_TOKEN, admin
 from .api import api
+from .tasks.jobs import jobs
+from .interfaces import IQueue
+from .utils import executors, metrics
+from .utils.handlers import run_in_executor
+from .utils.http import close_http_client
+from .utils.models import models
+from .utils.monitor import monitor
 
 
 def create_app():
@@ -9,8 +20,16 @@ def create_app():
         title="Llama-3-QuipuBase",
         description="A clone of the OpenAI API",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
     app.include_router(api)
+    if ADMIN_TOKEN:
+        app.include_router(admin)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint():
+        return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -18,4 +37,40 @@ def create_app():
         allow_methods=["*"],
         allow_headers=["*"],
     )
+
+    @app.on_event("startup")
+    async def start_monitor():
+        if os.getenv("LOOP_MONITOR", "0") != "0":
+            monitor.start()
+
+    @app.on_event("startup")
+    async def warmup():
+        await run_in_executor("model", models.warmup)
+
+    @app.on_event("startup")
+    async def broker():
+        if os.getenv("QUEUE_BACKEND") == "unix":
+            await IQueue.get_broker().connect()
+
+    @app.on_event("startup")
+    async def start_jobs():
+        if os.getenv("JOB_WORKERS", "1") != "0":
+            await jobs.start()
+
+    @app.on_event("shutdown")
+    async def stop_jobs():
+        await jobs.stop()
+
+    @app.on_event("shutdown")
+    async def stop_monitor():
+        await monitor.stop()
+
+    @app.on_event("shutdown")
+    async def close_client():
+        await close_http_client()
+
+    @app.on_event("shutdown")
+    async def stop_executors():
+        await run_in_executor(None, executors.shutdown)
+
     return app
@@ -0,0 +1,93 @@
+import asyncio
+import hmac
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from typing_extensions import Literal
+
+from .utils import executors
+from .utils.admission import gates
+from .utils.circuit import breakers
+from .utils.models import models
+from .utils.monitor import monitor
+from .utils.profiler import collapsed, loop_lag, sample
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+MAX_PROFILE_SECONDS = float(os.getenv("ADMIN_MAX_PROFILE_SECONDS", "60"))
+
+profiling = asyncio.Lock()
+
+
+async def verify_token(request: Request):
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not ADMIN_TOKEN or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+admin = APIRouter(
+    prefix="/admin", dependencies=[Depends(verify_token)], include_in_schema=False
+)
+
+
+@admin.get("/models")
+async def models_endpoint():
+    return models.stats()
+
+
+@admin.get("/tasks")
+async def tasks_endpoint():
+    return {name: gate.stats() for name, gate in gates.items()}
+
+
+@admin.get("/breakers")
+async def breakers_endpoint():
+    return {name: breaker.stats() for name, breaker in breakers.items()}
+
+
+@admin.get("/loop")
+async def loop_endpoint():
+    return monitor.stats()
+
+
+@admin.get("/executors")
+async def executors_endpoint():
+    return executors.stats()
+
+
+@admin.get("/profile")
+async def profile_endpoint(
+    seconds: float = 10,
+    mode: Literal["wall", "cpu"] = "wall",
+    interval: float = 0.005,
+    format: Literal["json", "collapsed"] = "json",  # pylint: disable=W0622
+):
+    """
+    Profiles the worker for `seconds` and returns its collapsed stacks together with
+    the event loop lag measured meanwhile.
+    """
+    if not 0 < seconds <= MAX_PROFILE_SECONDS or interval < 0.001:
+        raise HTTPException(status_code=422, detail="Invalid profile duration")
+    if profiling.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    async with profiling:
+        (stacks, ticks), lag = await asyncio.gather(
+            asyncio.to_thread(sample, seconds, interval, mode),
+            loop_lag(seconds),
+        )
+    if format == "collapsed":
+        return PlainTextResponse(
+            collapsed(stacks),
+            headers={
+                "X-Loop-Lag-Max": str(lag["max"]),
+                "X-Loop-Lag-P99": str(lag["p99"]),
+            },
+        )
+    return {
+        "mode": mode,
+        "seconds": seconds,
+        "ticks": ticks,
+        "samples": sum(stacks.values()),
+        "loop_lag": lag,
+        "stacks": collapsed(stacks),
+    }
@@ -1,17 +1,24 @@
-import os
+from pathlib import Path
+from typing import Any
 
-import httpx
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from typing_extensions import Literal
 
+from .auth import current_user
+from .data import ObjectStorage
 from .schemas import User
 from .tasks import LanguageModel
 from .tasks.image import ImageGeneration, ImageRequest
+from .tasks.jobs import Job, jobs
 from .tasks.llm import IRequest, LLMConversation, Thread
-from .tasks.music import Music, MusicRequest
+from .tasks.music import Music, MusicRequest, MusicStreamRequest
 from .tasks.tts import YoutubeToText, YoutubeVideoRequest
+from .utils.handlers import run_in_executor
+from .utils.responses import NegotiatedRoute, RawJSONResponse
 
-api = APIRouter(prefix="/api")
-AUTH0_URL = os.getenv("AUTH0_URL")
+api = APIRouter(prefix="/api", route_class=NegotiatedRoute)
 
 
 @api.post("/thread/{namespace}")
@@ -27,7 +34,7 @@ async def llm_endpoint_post(conversation: LLMConversation, namespace: str):
 
 @api.get("/thread/{namespace}")
 async def llm_endpoint_get(namespace: str):
-    return await Thread.find_many(namespace=namespace)
+    return RawJSONResponse(await Thread.store.find_many_raw(namespace=namespace))
 
 
 @api.post("/image")
@@ -42,6 +49,49 @@ async def music_endpoint(request: MusicRequest):
     return await Music().handler(request=IRequest[MusicRequest](input=request))
 
 
+@api.post("/music/binary")
+async def music_binary_endpoint(
+    request: Request,
+    text: str,
+    dtype: Literal["float32", "pcm16"] = "float32",
+    sample_rate: int = 44100,
+    response: Literal["json", "binary", "wav", "url"] = "binary",
+):
+    return await Music().binary_handler(
+        request=IRequest[MusicRequest](
+            input=MusicRequest(text=text, response=response)
+        ),
+        data=await request.body(),
+        dtype=dtype,
+        sample_rate=sample_rate,
+    )
+
+
+@api.post("/music/upload")
+async def music_upload_endpoint(
+    text: str = Form(...),
+    file: UploadFile = File(...),
+    dtype: Literal["float32", "pcm16"] = Form("float32"),
+    sample_rate: int = Form(44100),
+    response: Literal["json", "binary", "wav", "url"] = Form("binary"),
+):
+    return await Music().binary_handler(
+        request=IRequest[MusicRequest](
+            input=MusicRequest(text=text, response=response)
+        ),
+        data=await file.read(),
+        dtype=dtype,
+        sample_rate=sample_rate,
+    )
+
+
+@api.post("/music/stream")
+async def music_stream_endpoint(request: MusicStreamRequest):
+    return await Music().stream_handler(
+        request=IRequest[MusicStreamRequest](input=request)
+    )
+
+
 @api.post("/ytt")
 async def ytt_endpoint(request: YoutubeVideoRequest):
     return await YoutubeToText().handler(
@@ -54,29 +104,41 @@ async def ytt_endpoint_get(query: str):
     return await YoutubeToText().search(query=query)
 
 
-@api.post("/auth")
-async def auth_endpoint(request: Request):
-    token = request.headers.get("Authorization")
-    if not token:
-        raise HTTPException(status_code=401, detail="Unauthorized")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{AUTH0_URL}/userinfo",
-            headers={"Authorization": token},
+@api.post("/jobs/{task}")
+async def job_submit_endpoint(task: str, payload: dict[str, Any], priority: int = 0):
+    if task not in jobs.workers:
+        raise HTTPException(status_code=404, detail=f"Unknown task {task}")
+    if not jobs.running(task):
+        raise HTTPException(
+            status_code=503, detail=f"Jobs of {task} are not run by this server"
         )
-        response.raise_for_status()
-        user = User(**response.json())
-        sub = user.sub
-        existing_user_wrapped = await User.find_many(sub=sub)
-        if existing_user_wrapped:
-            assert len(existing_user_wrapped) == 1, "Multiple users with same sub"
-            existing_user = existing_user_wrapped[0]
-            return existing_user
-        await user.save()
-        return user
+    try:
+        return await jobs.submit(task, payload, priority=priority)
+    except ValidationError as e:
+        raise RequestValidationError(
+            e.errors(include_url=False, include_context=False), body=payload
+        ) from e
+
+
+@api.get("/jobs/{key}")
+async def job_endpoint(key: str):
+    data = await Job.store.find_one_raw(key)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"Job {key} not found")
+    return RawJSONResponse(data)
+
+
+@api.get("/storage/{key:path}", dependencies=[Depends(current_user)])
+async def storage_endpoint(key: str):
+    return await ObjectStorage().download(key=key)
+
+
+@api.post("/auth")
+async def auth_endpoint(user: User = Depends(current_user)):
+    return user
 
 
 @api.post("/twilio")
 async def twiml_webhook(request: Request):
-    with open("src/twiml.xml", "wb") as f:
-        f.write(await request.body())
+    body = await request.body()
+    await run_in_executor("io", Path("src/twiml.xml").write_bytes, body)
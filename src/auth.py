@@ -0,0 +1,228 @@
+"""
+This module contains the authentication of API users against Auth0.
+
+Access tokens are resolved to a `User` in three tiers, cheapest first:
+
+1. A process-wide cache keyed by the SHA-256 of the token (never the token itself),
+   holding each user until `AUTH_CACHE_TTL` seconds or the token's expiry, whichever
+   comes first, for at most `AUTH_CACHE_SIZE` tokens.
+2. Local verification of JWT access tokens against the tenant's JWKS, fetched once
+   and cached for `AUTH0_JWKS_TTL` seconds, when `AUTH0_AUDIENCE` is set.
+3. The Auth0 `/userinfo` endpoint, for opaque tokens and for the first sight of a
+   user, through the shared HTTP client.
+
+Concurrent requests carrying the same uncached token share a single resolution.
+Use the `current_user` dependency to authenticate an endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+import jwt
+from fastapi import HTTPException, Request
+
+from .schemas import User
+from .utils.handlers import get_logger
+from .utils.http import get_http_client
+from .utils.metrics import Sample, collector
+
+logger = get_logger(__name__)
+
+AUTH0_URL = os.getenv("AUTH0_URL")
+AUTH0_AUDIENCE = os.getenv("AUTH0_AUDIENCE")
+AUTH0_JWKS_TTL = float(os.getenv("AUTH0_JWKS_TTL", "3600"))
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "300"))
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+
+
+def unauthorized(detail: str = "Unauthorized") -> HTTPException:
+    return HTTPException(
+        status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+class JWKS:
+    """
+    The signing keys of the Auth0 tenant, refreshed every `ttl` seconds or when a
+    token is signed with an unknown key, at most once every 30 seconds.
+    """
+
+    def __init__(self, url: str, ttl: float = AUTH0_JWKS_TTL) -> None:
+        self.url = url
+        self.ttl = ttl
+        self.keys: dict[str, Any] = {}
+        self.fetched_at = 0.0
+        self.lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        response = await get_http_client().get(self.url)
+        response.raise_for_status()
+        self.keys = {
+            key["kid"]: jwt.PyJWK(key).key
+            for key in response.json()["keys"]
+            if key.get("use", "sig") == "sig"
+        }
+        self.fetched_at = time.monotonic()
+
+    async def get(self, kid: str) -> Any:
+        age = time.monotonic() - self.fetched_at
+        if age > self.ttl or (kid not in self.keys and age > 30):
+            async with self.lock:
+                age = time.monotonic() - self.fetched_at
+                if age > self.ttl or (kid not in self.keys and age > 30):
+                    await self.refresh()
+        key = self.keys.get(kid)
+        if key is None:
+            raise unauthorized("Unknown signing key")
+        return key
+
+
+class Authenticator:
+    """
+    Resolves access tokens to users, see the module documentation.
+    """
+
+    def __init__(
+        self, maxsize: int = AUTH_CACHE_SIZE, ttl: float = AUTH_CACHE_TTL
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.tokens: OrderedDict[str, tuple[User, float]] = OrderedDict()
+        self.users: OrderedDict[str, User] = OrderedDict()
+        self.inflight: dict[str, asyncio.Future[tuple[User, float]]] = {}
+        self.jwks = JWKS(f"{AUTH0_URL}/.well-known/jwks.json")
+        self.hits = 0
+        self.misses = 0
+
+    async def authenticate(self, token: str) -> User:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        cached = self.tokens.get(key)
+        if cached is not None and cached[1] > time.time():
+            self.tokens.move_to_end(key)
+            self.hits += 1
+            return cached[0]
+        self.misses += 1
+        future = self.inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.resolve(token))
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        user, expires_at = await asyncio.shield(future)
+        self.tokens[key] = (user, expires_at)
+        self.tokens.move_to_end(key)
+        while len(self.tokens) > self.maxsize:
+            self.tokens.popitem(last=False)
+        return user
+
+    async def resolve(self, token: str) -> tuple[User, float]:
+        """
+        Resolves an uncached token to its user and the time the cache entry expires.
+        """
+        expires_at = time.time() + self.ttl
+        claims = await self.verify(token)
+        if claims is not None:
+            expires_at = min(expires_at, claims["exp"])
+            user = await self.find_user(claims["sub"])
+            if user is not None:
+                return user, expires_at
+        elif token.count(".") == 2:
+            try:
+                unverified = jwt.decode(token, options={"verify_signature": False})
+                expires_at = min(expires_at, unverified.get("exp", expires_at))
+            except jwt.InvalidTokenError:
+                pass
+        user = await self.userinfo(token)
+        existing = await self.find_user(user.sub)
+        if existing is not None:
+            return existing, expires_at
+        await user.save()
+        self.remember(user)
+        return user, expires_at
+
+    async def verify(self, token: str) -> dict[str, Any] | None:
+        """
+        Verifies a JWT access token locally, returning its claims, or None when the
+        token cannot be verified locally (opaque token or no audience configured).
+        """
+        if not AUTH0_AUDIENCE or token.count(".") != 2:
+            return None
+        try:
+            header = jwt.get_unverified_header(token)
+            key = await self.jwks.get(header.get("kid", ""))
+            return jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=AUTH0_AUDIENCE,
+                issuer=f"{AUTH0_URL}/",
+                options={"require": ["exp", "sub"]},
+            )
+        except jwt.InvalidTokenError as e:
+            raise unauthorized(str(e)) from e
+
+    async def userinfo(self, token: str) -> User:
+        response = await get_http_client().get(
+            f"{AUTH0_URL}/userinfo", headers={"Authorization": f"Bearer {token}"}
+        )
+        if response.status_code in (401, 403):
+            raise unauthorized()
+        response.raise_for_status()
+        return User(**response.json())
+
+    def remember(self, user: User) -> None:
+        self.users[user.sub] = user
+        self.users.move_to_end(user.sub)
+        while len(self.users) > self.maxsize:
+            self.users.popitem(last=False)
+
+    async def find_user(self, sub: str) -> User | None:
+        user = self.users.get(sub)
+        if user is not None:
+            return user
+        existing = await User.find_many(sub=sub)
+        if not existing:
+            return None
+        if len(existing) > 1:
+            logger.warning("Multiple users with sub %s", sub)
+        self.remember(existing[0])
+        return existing[0]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tokens": len(self.tokens),
+            "users": len(self.users),
+            "inflight": len(self.inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+authenticator = Authenticator()
+
+
+@collector
+def auth_samples() -> list[Sample]:
+    stats = authenticator.stats()
+    return [
+        ("auth_cached_tokens", {}, stats["tokens"]),
+        ("auth_cached_users", {}, stats["users"]),
+        ("auth_cache_hits_total", {}, stats["hits"]),
+        ("auth_cache_misses_total", {}, stats["misses"]),
+    ]
+
+
+async def current_user(request: Request) -> User:
+    """
+    Dependency returning the user authenticated by the request's bearer token.
+    """
+    authorization = request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise unauthorized()
+    return await authenticator.authenticate(token)
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from functools import cached_property
-from typing import Any, Generic, Type, TypeVar
+from functools import cached_property, lru_cache, partial
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Generic,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 from uuid import uuid4
 
 import hnswlib
 import orjson
-from pydantic import BaseModel, Field  # pylint: disable=E0401
+from pydantic import BaseModel, Field, TypeAdapter  # pylint: disable=E0401
 from typing_extensions import Self
 
 from ..integration.rocksdb import Collection  # type: ignore
@@ -84,7 +96,20 @@ class Store(Generic[T]):
         """
         return Collection(self.path)  # type: ignore
 
-    @asyncify
+    @asyncify("db")
+    def exists(self, key: str) -> bool:
+        """
+        Checks whether an instance exists in the store.
+
+        Args:
+                key (str): The key of the instance.
+
+        Returns:
+                bool: Whether the instance exists.
+        """
+        return self.col.exists(key)
+
+    @asyncify("db")
     def create(self, instance: T) -> None:
         """
         Creates a new instance in the store.
@@ -97,7 +122,7 @@ class Store(Generic[T]):
         """
         self.col.create(instance.id, instance.model_dump())
 
-    @asyncify
+    @asyncify("db")
     def update(self: Store[T], instance: T) -> None:
         """
         Update the document in the collection with the given instance.
@@ -108,11 +133,9 @@ class Store(Generic[T]):
         Returns:
                 None
         """
-        kwargs = instance.model_dump()
-        _id = kwargs.pop("id")
-        self.col.update(_id, kwargs)
+        self.col.update(instance.id, instance.model_dump())
 
-    @asyncify
+    @asyncify("db")
     def delete_(self, key: str) -> None:
         """
         Deletes the item with the specified key from the store.
@@ -125,7 +148,7 @@ class Store(Generic[T]):
         """
         self.col.delete(key)
 
-    @asyncify
+    @asyncify("db")
     def find_one(self, key: str) -> T:
         """
         Finds and returns a single document from the collection based on the given key.
@@ -138,7 +161,7 @@ class Store(Generic[T]):
         """
         return self.col.find_one(key)
 
-    @asyncify
+    @asyncify("db")
     def find_many(self, **kwargs: Any) -> list[T]:
         """
         Find multiple documents in the collection based on the given key-value pairs.
@@ -147,21 +170,43 @@ class Store(Generic[T]):
             doc for doc in self.col.find_many(kwargs)  # pylint: disable=E1101
         ]  # pylint: disable=E1101
 
-    @asyncify
+    @asyncify("db")
+    def find_one_raw(self, key: str) -> bytes | None:
+        """
+        Returns the stored JSON bytes of a document, or None if the key is missing.
+        """
+        return self.col.get_raw(key)
+
+    @asyncify("db")
+    def find_many_raw(self, **kwargs: Any) -> list[bytes]:
+        """
+        Returns the stored JSON bytes of the documents matching the given key-value
+        pairs, without decoding them.
+        """
+        return self.col.find_many_raw(kwargs)
+
+    @asyncify("db")
+    def find_all_raw(self) -> list[bytes]:
+        """
+        Returns the stored JSON bytes of every document in the collection.
+        """
+        return self.col.find_all_raw()
+
+    @asyncify("db")
     def find_first(self) -> T:
         """
         Find the first document in the collection based on the given key-value pairs.
         """
         return orjson.loads(self.col.find_first())  # pylint: disable=E1101
 
-    @asyncify
+    @asyncify("db")
     def find_last(self) -> T:
         """
         Find the last document in the collection based on the given key-value pairs.
         """
         return orjson.loads(self.col.find_last())  # pylint: disable=E1101
 
-    @asyncify
+    @asyncify("db")
     def find_all(self) -> list[T]:
         """
         Retrieves all items from the collection.
@@ -171,7 +216,7 @@ class Store(Generic[T]):
         """
         return [doc for doc in self.col.find_all()]
 
-    @asyncify
+    @asyncify("db")
     def count(self) -> int:
         """
         Returns the number of items in the collection.
@@ -181,7 +226,7 @@ class Store(Generic[T]):
         """
         return self.col.count()
 
-    @asyncify
+    @asyncify("db")
     def _cosim_search(
         self, vector: list[float], world: list[Properties], top_k: int
     ) -> list[CosimResult]:
@@ -202,7 +247,6 @@ class Store(Generic[T]):
         dim = len(vector)
         p = hnswlib.Index(space="cosine", dim=dim)  # type: ignore
         p.init_index(max_elements=len(world), ef_construction=200, M=16)
-        world = [orjson.loads(doc) for doc in world]  # pylint: disable=E1101
         items = [doc["value"] for doc in world]
         p.add_items(items)
         labels, distances = p.knn_query(vector, k=top_k)
@@ -235,7 +279,6 @@ class Store(Generic[T]):
             world = await self.find_many(**kwargs)
         else:
             world = await self.find_all()
-        print(len(vector))
         return [
             CosimResult(**item)
             for item in await self._cosim_search(vector, world, top_k)
@@ -243,6 +286,72 @@ class Store(Generic[T]):
 
 
 R = TypeVar("R", bound="RocksDBModel")
+M = TypeVar("M", bound=BaseModel)
+
+TRUSTED_READS = os.getenv("DB_TRUSTED_READS", "1") != "0"
+
+
+def _has_models(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_has_models(arg) for arg in get_args(annotation))
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """
+    Returns a function building the nested models of a field from decoded JSON, or
+    None if the field holds no models. Shapes other than models, lists, dicts and
+    optionals of them fall back to validation.
+    """
+    if not _has_models(annotation):
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return partial(construct, annotation)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is Annotated:
+        return _converter(args[0])
+    if origin is list and args:
+        item = _converter(args[0])
+        return lambda value: [item(v) for v in value]  # type: ignore
+    if origin is dict and len(args) == 2 and not _has_models(args[0]):
+        item = _converter(args[1])
+        return lambda value: {k: item(v) for k, v in value.items()}  # type: ignore
+    if origin in (Union, UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1:
+            return _converter(options[0])
+    return TypeAdapter(annotation).validate_python
+
+
+@lru_cache(maxsize=None)
+def _plan(model: Type[BaseModel]) -> list[tuple[str, Callable[[Any], Any] | None]]:
+    return [
+        (name, _converter(field.annotation))
+        for name, field in model.model_fields.items()
+    ]
+
+
+def construct(model: Type[M], data: dict[str, Any]) -> M:
+    """
+    Builds a model and its nested models from trusted decoded JSON, without
+    validation. Keys that are not fields of the model, like stored computed fields,
+    are ignored.
+
+    Args:
+            model (Type[M]): The model to build.
+            data (dict[str, Any]): The decoded document.
+
+    Returns:
+            M: The model instance.
+    """
+    if not isinstance(data, dict):
+        return data
+    values: dict[str, Any] = {}
+    for name, convert in _plan(model):
+        if name in data:
+            value = data[name]
+            values[name] = value if convert is None or value is None else convert(value)
+    return model.model_construct(**values)
 
 
 class RocksDBModel(Base):
@@ -267,8 +376,23 @@ class RocksDBModel(Base):
     def store(self) -> Store[Self]:
         return Store[Self]("db/" + self.__class__.__name__.lower())
 
+    @classmethod
+    def hydrate(
+        cls: Type[Self], data: dict[str, Any], *, trusted: bool = TRUSTED_READS
+    ) -> Self:
+        """
+        Builds an instance from a document read from the collection.
+
+        Documents were validated when they were written, so unless `DB_TRUSTED_READS`
+        is `0` they are built with `construct`, skipping validation of the document
+        and of its nested models.
+        """
+        if trusted and "id" in data:
+            return construct(cls, data)
+        return cls(**data)
+
     async def save(self: Self) -> None:
-        if not self.store.col.exists(self.id):
+        if not await self.store.exists(self.id):
             await self.store.create(self)
         else:
             await self.store.update(self)
@@ -279,24 +403,24 @@ class RocksDBModel(Base):
     @classmethod
     async def find_one(cls: Type[Self], key: str) -> Self:
         data = await cls.store.find_one(key)
-        return cls(**data)
+        return cls.hydrate(data)
 
     @classmethod
     async def find_many(cls: Type[Self], **kwargs: Any) -> list[Self]:
         res = await cls.store.find_many(**kwargs)
-        return [cls(**data) for data in res]
+        return [cls.hydrate(data) for data in res]
 
     @classmethod
     async def find_first(cls: Type[Self]) -> Self:
-        return cls(**await cls.store.find_first())
+        return cls.hydrate(await cls.store.find_first())
 
     @classmethod
     async def find_last(cls: Type[Self]) -> Self:
-        return cls(**await cls.store.find_last())
+        return cls.hydrate(await cls.store.find_last())
 
     @classmethod
     async def find_all(cls: Type[Self]) -> list[Self]:
-        return [cls(**data) for data in await cls.store.find_all()]
+        return [cls.hydrate(data) for data in await cls.store.find_all()]
 
     @classmethod
     async def count(cls) -> int:
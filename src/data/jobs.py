@@ -0,0 +1,287 @@
+"""
+This module contains a durable job queue persisted in RocksDB and the worker pool
+that runs its jobs.
+
+A worker claims a job before running it by compare-and-set on its stored status and
+lease: only a queued job, or a running job whose lease expired, can be claimed, and
+the claim records the queue as its `owner` for `JOB_LEASE` seconds, renewed while the
+job runs. A job is therefore never run twice at once, even when several queues pick
+it up, and jobs of a crashed worker are run again once their lease expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Literal, Optional
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from ..utils.handlers import asyncify, get_logger
+from .database import RocksDBModel
+
+logger = get_logger(__name__)
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+Runner = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+class Job(RocksDBModel):
+    """
+    A unit of work for a registered task, persisted on every state change so that
+    queued and interrupted jobs are picked up again after a restart.
+    """
+
+    task: str = Field(..., description="The name of the task running the job.")
+    payload: dict[str, Any] = Field(default_factory=dict)
+    status: JobStatus = Field(default="queued")
+    priority: int = Field(
+        default=0, description="Jobs with higher priority run first."
+    )
+    attempts: int = Field(default=0)
+    max_attempts: int = Field(default=3)
+    result: Optional[Any] = Field(default=None)
+    error: Optional[str] = Field(default=None)
+    owner: Optional[str] = Field(
+        default=None, description="The queue running the job, while it runs."
+    )
+    lease_until: float = Field(
+        default=0, description="The job cannot be claimed again before this time."
+    )
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+
+
+_transitions = threading.Lock()
+
+
+@asyncify("db")
+def transition(key: str, update: Callable[[Job], bool]) -> tuple[Job, bool] | None:
+    """
+    Atomically applies `update` to a stored job, persisting the job only if `update`
+    returns True.
+
+    Returns:
+            tuple[Job, bool] | None: The job and whether it was updated, or None if
+            the job does not exist.
+    """
+    with _transitions:
+        data = Job.store.col.get(key)
+        if not data:
+            return None
+        job = Job.hydrate(data)
+        updated = update(job)
+        if updated:
+            job.updated_at = time.time()
+            Job.store.col.update(key, job.model_dump())
+        return job, updated
+
+
+@dataclass
+class Worker:
+    """
+    A registered task with its runner and concurrency limit.
+    """
+
+    runner: Runner
+    concurrency: int
+    model: type[BaseModel] | None = None
+    queue: asyncio.PriorityQueue[tuple[int, float, str]] | None = None
+
+
+class JobQueue:
+    """
+    A worker pool running persisted `Job`s.
+
+    Each task gets its own priority queue and `concurrency` workers, so a burst of
+    jobs for one model never delays the others. Failed jobs are retried with
+    exponential backoff (`JOB_BACKOFF` seconds, doubled per attempt) until they reach
+    `max_attempts`.
+    """
+
+    def __init__(self) -> None:
+        self.workers: dict[str, Worker] = {}
+        self.tasks: list[asyncio.Task[None]] = []
+        self.backoff = float(os.getenv("JOB_BACKOFF", "2"))
+        self.lease = float(os.getenv("JOB_LEASE", "60"))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+    def register(
+        self,
+        task: str,
+        *,
+        concurrency: int = 1,
+        model: type[BaseModel] | None = None,
+    ) -> Callable[[Runner], Runner]:
+        """
+        Decorator to register the runner of a task.
+
+        :param task: The name of the task.
+        :param concurrency: Number of jobs of this task running at once, overridden
+            by `JOB_CONCURRENCY_<TASK>`.
+        :param model: The request model validating the payloads of the task.
+        :return: Decorator returning the runner unchanged.
+        """
+
+        def decorator(runner: Runner) -> Runner:
+            limit = int(os.getenv(f"JOB_CONCURRENCY_{task.upper()}", concurrency))
+            self.workers[task] = Worker(runner=runner, concurrency=limit, model=model)
+            return runner
+
+        return decorator
+
+    async def start(self, tasks: list[str] | None = None) -> None:
+        """
+        Starts the workers of the given tasks, by default those in `JOB_TASKS` or
+        every registered task, and re-enqueues their unfinished jobs. Jobs still
+        leased by another worker are only claimed if that lease expires.
+        """
+        if tasks is None:
+            names = os.getenv("JOB_TASKS", "")
+            tasks = [n.strip() for n in names.split(",") if n.strip()] or list(
+                self.workers
+            )
+        for task in tasks:
+            worker = self.workers[task]
+            worker.queue = asyncio.PriorityQueue()
+            for _ in range(worker.concurrency):
+                self.tasks.append(asyncio.create_task(self.work(task, worker)))
+        for job in await Job.find_all():
+            if job.task in tasks and job.status in ("queued", "running"):
+                self.enqueue(job)
+        logger.info("Started job workers for %s", ", ".join(tasks))
+
+    async def stop(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks.clear()
+
+    def running(self, task: str) -> bool:
+        """
+        Tells whether the workers of a task run in this process. Jobs of other tasks
+        would only be picked up by the next start of a process running them.
+        """
+        worker = self.workers.get(task)
+        return worker is not None and worker.queue is not None
+
+    async def submit(
+        self, task: str, payload: dict[str, Any], *, priority: int = 0
+    ) -> Job:
+        """
+        Persists a new job and queues it.
+
+        :raises KeyError: If the task is not registered.
+        :raises RuntimeError: If the workers of the task do not run in this process.
+        :raises ValidationError: If the payload is not a valid request of the task.
+        """
+        if task not in self.workers:
+            raise KeyError(f"Task {task} is not registered")
+        if not self.running(task):
+            raise RuntimeError(f"No workers run task {task}")
+        model = self.workers[task].model
+        if model is not None:
+            model.model_validate(payload)
+        job = Job(task=task, payload=payload, priority=priority)
+        await job.save()
+        self.enqueue(job)
+        return job
+
+    def enqueue(self, job: Job) -> None:
+        queue = self.workers[job.task].queue
+        if queue is not None:
+            queue.put_nowait((-job.priority, job.created_at, job.id))
+
+    def enqueue_at(self, job: Job, when: float) -> None:
+        delay = max(when - time.time(), 0)
+        asyncio.get_running_loop().call_later(delay, self.enqueue, job)
+
+    async def work(self, task: str, worker: Worker) -> None:
+        assert worker.queue is not None
+        while True:
+            _, _, key = await worker.queue.get()
+            try:
+                await self.run(task, worker, key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pylint: disable=W0718
+                logger.exception("Worker of %s could not run job %s", task, key)
+
+    def claim(self, job: Job) -> bool:
+        if job.status not in ("queued", "running") or job.lease_until > time.time():
+            return False
+        job.status, job.owner = "running", self.owner
+        job.attempts += 1
+        job.lease_until = time.time() + self.lease
+        return True
+
+    def extend(self, job: Job) -> bool:
+        if job.status != "running" or job.owner != self.owner:
+            return False
+        job.lease_until = time.time() + self.lease
+        return True
+
+    async def renew(self, key: str) -> None:
+        """
+        Extends the lease of a running job until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            await transition(key, self.extend)
+
+    async def run(self, task: str, worker: Worker, key: str) -> None:
+        """
+        Claims a queued job and runs it, persisting its state before and after.
+        Jobs that cannot be claimed yet, because they are leased or backing off, are
+        queued again for when they can be.
+        """
+        claimed = await transition(key, self.claim)
+        if claimed is None:
+            return
+        job, ok = claimed
+        if not ok:
+            if job.status == "queued" or (
+                job.status == "running" and job.owner != self.owner
+            ):
+                self.enqueue_at(job, job.lease_until)
+            return
+        renewal = asyncio.create_task(self.renew(key))
+        result: Any = None
+        error: str | None = None
+        try:
+            result = await worker.runner(job.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=W0718
+            error = f"{e.__class__.__name__}: {e}"
+            logger.error("Job %s of %s failed: %s", job.id, task, error)
+        finally:
+            renewal.cancel()
+        delay = self.backoff * 2 ** (job.attempts - 1)
+        retry = error is not None and job.attempts < job.max_attempts
+
+        def finish(stored: Job) -> bool:
+            if stored.owner != self.owner or stored.status != "running":
+                return False
+            stored.result, stored.error, stored.owner = result, error, None
+            if error is None:
+                stored.status, stored.lease_until = "succeeded", 0
+            elif retry:
+                stored.status, stored.lease_until = "queued", time.time() + delay
+            else:
+                stored.status, stored.lease_until = "failed", 0
+            return True
+
+        finished = await transition(key, finish)
+        if finished is None or not finished[1]:
+            logger.warning("Job %s of %s lost its lease while running", job.id, task)
+        elif retry:
+            self.enqueue_at(finished[0], finished[0].lease_until)
+
+
+jobs = JobQueue()
@@ -1,17 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import os
-from functools import cached_property
-from typing import Any
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Any, AsyncIterator
 from uuid import uuid4
 
 from boto3 import client
-from fastapi import UploadFile
+from botocore.config import Config
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..interfaces import IProxy
 from ..utils.handlers import asyncify, get_logger, handle
+from ..utils.metrics import Sample, collector, histogram
+from .database import RocksDBModel
 
 logger = get_logger(__name__)
 
+ENDPOINT_URL = os.environ.get("S3_ENDPOINT_URL", "https://storage.indiecloud.co")
+PART_SIZE = int(os.environ.get("S3_PART_SIZE", 8 * 1024 * 1024))
+UPLOAD_CONCURRENCY = int(os.environ.get("S3_UPLOAD_CONCURRENCY", 4))
+MAX_POOL_CONNECTIONS = int(os.environ.get("S3_MAX_POOL_CONNECTIONS", 64))
+PRESIGNED_CACHE_SIZE = int(os.environ.get("S3_PRESIGNED_CACHE_SIZE", 10000))
+LIST_CONCURRENCY = int(os.environ.get("S3_LIST_CONCURRENCY", 8))
+CHUNKSIZE = 1024 * 1024
+
+
+class StorageMetrics:
+    """
+    Latency and connection pool statistics of the shared S3 client, collected from
+    botocore `before-call`/`after-call` events.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.operations: dict[str, dict[str, float]] = {}
+
+    def before_call(self, model: Any, context: dict[str, Any], **_: Any) -> None:
+        context["started_at"] = time.perf_counter()
+        context["operation"] = model.name
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def after_call(
+        self,
+        context: dict[str, Any],
+        model: Any = None,
+        http_response: Any = None,
+        event_name: str = "",
+        error: bool = False,
+        **_: Any,
+    ) -> None:
+        """
+        Records a finished call. `after-call-error` passes neither `model` nor
+        `http_response`, so the operation comes from the context or the event name;
+        `after-call` responses with an error status count as errors.
+        """
+        if "started_at" not in context:
+            return
+        elapsed = time.perf_counter() - context.pop("started_at")
+        operation = context.pop("operation", None) or (
+            model.name if model is not None else event_name.rsplit(".", 1)[-1]
+        )
+        status = getattr(http_response, "status_code", 0) or 0
+        error = error or status >= 400
+        call_duration.observe(int(elapsed * 1e9), operation)
+        with self.lock:
+            self.in_flight -= 1
+            stats = self.operations.setdefault(
+                operation, {"count": 0, "errors": 0, "total": 0.0, "max": 0.0}
+            )
+            stats["count"] += 1
+            stats["errors"] += error
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+
+    def after_call_error(self, context: dict[str, Any], **kwargs: Any) -> None:
+        kwargs.pop("error", None)
+        self.after_call(context, error=True, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "max_pool_connections": MAX_POOL_CONNECTIONS,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "operations": {
+                    name: {**stats, "mean": stats["total"] / stats["count"]}
+                    for name, stats in self.operations.items()
+                    if stats["count"]
+                },
+            }
+
+
+metrics = StorageMetrics()
+call_duration = histogram(
+    "storage_call_duration_seconds", "Duration of S3 API calls.", ("operation",)
+)
+
+
+@collector
+def storage_samples() -> list[Sample]:
+    stats = metrics.stats()
+    return [
+        ("storage_max_pool_connections", {}, stats["max_pool_connections"]),
+        ("storage_in_flight", {}, stats["in_flight"]),
+        ("storage_peak_in_flight", {}, stats["peak_in_flight"]),
+        *(
+            (f"storage_{name}_total", {"operation": op}, values[name])
+            for op, values in stats["operations"].items()
+            for name in ("count", "errors")
+        ),
+        ("presigned_cache_size", {}, len(presigned.entries)),
+    ]
+
+
+class PresignedCache:
+    """
+    LRU cache of presigned URLs keyed by (bucket, key, ttl).
+
+    A URL is reused for half of its `ttl`, so a cached URL is always handed out with
+    at least half of its signature lifetime left.
+    """
+
+    def __init__(self, maxsize: int = PRESIGNED_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[tuple[str, str, int], tuple[str, float]] = (
+            OrderedDict()
+        )
+
+    def get(self, bucket: str, key: str, ttl: int) -> str | None:
+        with self.lock:
+            entry = self.entries.get((bucket, key, ttl))
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self.entries[(bucket, key, ttl)]
+                return None
+            self.entries.move_to_end((bucket, key, ttl))
+            return url
+
+    def set(self, bucket: str, key: str, ttl: int, url: str) -> None:
+        with self.lock:
+            self.entries[(bucket, key, ttl)] = (url, time.monotonic() + ttl / 2)
+            self.entries.move_to_end((bucket, key, ttl))
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def discard(self, bucket: str, key: str) -> None:
+        with self.lock:
+            for entry in [e for e in self.entries if e[:2] == (bucket, key)]:
+                del self.entries[entry]
+
+
+presigned = PresignedCache()
+
+
+class Blob(RocksDBModel):
+    """
+    A content-addressed object, identified by the SHA-256 of its content.
+    """
+
+    key: str
+    size: int
+    content_type: str
+    refcount: int = 0
+
+
+class BlobRef(RocksDBModel):
+    """
+    A logical key, as its `id`, pointing to the hash of the `Blob` holding its content.
+    """
+
+    blob: str
+
+
+_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def _lock(name: str) -> asyncio.Lock:
+    """
+    Returns the lock of a blob (`blob/<sha>`) or logical key (`ref/<key>`), kept
+    only while someone holds or waits for it.
+    """
+    lock = _locks.get(name)
+    if lock is None:
+        lock = _locks[name] = asyncio.Lock()
+    return lock
+
+
+def _not_found(e: Exception) -> bool:
+    """
+    Tells whether an S3 client error is about a missing object.
+    """
+    code = getattr(e, "response", {}).get("Error", {}).get("Code")
+    return code in ("404", "NoSuchKey", "NotFound")
+
+
+async def _find(model: type[RocksDBModel], key: str) -> dict[str, Any] | None:
+    data = await model.store.find_one(key)
+    return data if data and data.get("id") else None
+
+
+@lru_cache(maxsize=1)
+def get_client() -> Any:
+    """
+    Returns the process-wide S3 client.
+
+    boto3 clients are thread safe, so a single client with a keep-alive connection
+    pool sized by `S3_MAX_POOL_CONNECTIONS` is shared by every `ObjectStorage`.
+    """
+    s3 = client(
+        service_name="s3",
+        endpoint_url=ENDPOINT_URL,
+        aws_access_key_id=os.environ.get("MINIO_ROOT_USER"),
+        aws_secret_access_key=os.environ.get("MINIO_ROOT_PASSWORD"),
+        region_name="us-east-1",
+        config=Config(
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "standard"},
+        ),
+    )
+    s3.meta.events.register("before-call.s3.*", metrics.before_call)
+    s3.meta.events.register("after-call.s3.*", metrics.after_call)
+    s3.meta.events.register("after-call-error.s3.*", metrics.after_call_error)
+    return s3
+
 
 def _det_content_type(filename: str) -> str:
     ext = filename.split(".")[-1]
@@ -53,15 +280,13 @@ class ObjectStorage(BaseModel, IProxy[Any]):
     """
 
     bucket: str = Field(default="tera")
+    dedup: bool = Field(
+        default=False,
+        description="Store files under content-addressed keys, one copy per content.",
+    )
 
     def __load__(self):
-        return client(
-            service_name="s3",
-            endpoint_url="https://storage.indiecloud.co",
-            aws_access_key_id=os.environ.get("MINIO_ROOT_USER"),
-            aws_secret_access_key=os.environ.get("MINIO_ROOT_PASSWORD"),
-            region_name="us-east-1",
-        )
+        return get_client()
 
     @cached_property
     def minio(self):
@@ -70,7 +295,14 @@ class ObjectStorage(BaseModel, IProxy[Any]):
         """
         return self.__load__()
 
-    @asyncify
+    @staticmethod
+    def stats() -> dict[str, Any]:
+        """
+        Get the latency and connection pool statistics of the shared client.
+        """
+        return metrics.stats()
+
+    @asyncify("io")
     def put_object(self, *, key: str, data: bytes, content_type: str):
         """
         Put an object in the storage.
@@ -83,16 +315,185 @@ class ObjectStorage(BaseModel, IProxy[Any]):
             ACL="public-read",
         )
 
-    @asyncify
-    def generate_presigned_url(self, *, key: str, ttl: int = 3600):
+    @asyncify("io")
+    def create_multipart_upload(self, *, key: str, content_type: str) -> str:
         """
-        Generate a presigned URL for the object.
+        Start a multipart upload and return its id.
+        """
+        return self.minio.create_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            ContentType=content_type,
+            ACL="public-read",
+        )["UploadId"]
+
+    @asyncify("io")
+    def upload_part(
+        self, *, key: str, upload_id: str, number: int, data: bytes
+    ) -> dict[str, Any]:
+        """
+        Upload a part of a multipart upload.
         """
-        return self.minio.generate_presigned_url(
-            ClientMethod="get_object",
-            Params={"Bucket": self.bucket, "Key": key},
-            ExpiresIn=ttl,
+        response = self.minio.upload_part(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=data,
         )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    @asyncify("io")
+    def complete_multipart_upload(
+        self, *, key: str, upload_id: str, parts: list[dict[str, Any]]
+    ):
+        """
+        Complete a multipart upload from its uploaded parts.
+        """
+        self.minio.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    @asyncify("io")
+    def abort_multipart_upload(self, *, key: str, upload_id: str):
+        """
+        Abort a multipart upload, discarding its uploaded parts.
+        """
+        self.minio.abort_multipart_upload(
+            Bucket=self.bucket, Key=key, UploadId=upload_id
+        )
+
+    async def upload(
+        self,
+        *,
+        key: str,
+        file: UploadFile,
+        content_type: str,
+    ) -> int:
+        """
+        Upload a file reading it in parts of `PART_SIZE` bytes.
+
+        Files smaller than a part are uploaded with a single `put_object`, larger
+        ones with a multipart upload whose parts are uploaded concurrently, with at
+        most `UPLOAD_CONCURRENCY` parts read into memory at once.
+
+        A failed part aborts the upload as soon as it is noticed, without reading the
+        rest of the file.
+
+        Returns:
+                int: The size of the file in bytes.
+        """
+        data = await file.read(PART_SIZE)
+        size = len(data)
+        if len(data) < PART_SIZE:
+            await self.put_object(key=key, data=data, content_type=content_type)
+            return size
+        upload_id = await self.create_multipart_upload(
+            key=key, content_type=content_type
+        )
+        semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+        failures: list[BaseException] = []
+
+        async def _upload_part(number: int, part: bytes) -> dict[str, Any]:
+            try:
+                return await self.upload_part(
+                    key=key, upload_id=upload_id, number=number, data=part
+                )
+            except Exception as e:
+                failures.append(e)
+                raise
+            finally:
+                semaphore.release()
+
+        tasks: list[asyncio.Task[dict[str, Any]]] = []
+        try:
+            number = 1
+            while data:
+                await semaphore.acquire()
+                if failures:
+                    raise failures[0]
+                tasks.append(asyncio.create_task(_upload_part(number, data)))
+                number += 1
+                data = await file.read(PART_SIZE)
+                size += len(data)
+            parts = await asyncio.gather(*tasks)
+            await self.complete_multipart_upload(
+                key=key, upload_id=upload_id, parts=parts
+            )
+            return size
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.abort_multipart_upload(key=key, upload_id=upload_id)
+            raise
+
+    @asyncify("io")
+    def get_object(self, *, key: str) -> bytes:
+        """
+        Get the content of an object from the storage.
+        """
+        return self.minio.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    @asyncify("io")
+    def get_object_stream(self, *, key: str) -> dict[str, Any]:
+        """
+        Get an object from the storage without reading its streaming body.
+        """
+        return self.minio.get_object(Bucket=self.bucket, Key=key)
+
+    async def iter_body(
+        self, body: Any, chunk_size: int = CHUNKSIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Iterate over a streaming body in chunks of `chunk_size` bytes.
+        """
+        read = asyncify("io")(body.read)
+        try:
+            while chunk := await read(chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def stream(
+        self, *, key: str, chunk_size: int = CHUNKSIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the content of an object in chunks of `chunk_size` bytes.
+        """
+        response = await self.get_object_stream(key=key)
+        body = self.iter_body(response["Body"], chunk_size)
+        try:
+            async for chunk in body:
+                yield chunk
+        finally:
+            await body.aclose()
+
+    def presign(self, *, key: str, ttl: int = 3600) -> str:
+        """
+        Get a presigned URL for the object from the cache, or sign a new one.
+
+        Signing is a local HMAC computation, so it runs inline rather than in a
+        worker thread.
+        """
+        url = presigned.get(self.bucket, key, ttl)
+        if url is None:
+            url = self.minio.generate_presigned_url(
+                ClientMethod="get_object",
+                Params={"Bucket": self.bucket, "Key": key},
+                ExpiresIn=ttl,
+            )
+            presigned.set(self.bucket, key, ttl, url)
+        return url
+
+    async def generate_presigned_url(self, *, key: str, ttl: int = 3600) -> str:
+        """
+        Generate a presigned URL for the object.
+        """
+        return self.presign(key=key, ttl=ttl)
 
     @handle
     async def put(self, *, key: str, file: UploadFile) -> str:
@@ -107,44 +508,276 @@ class ObjectStorage(BaseModel, IProxy[Any]):
             content_type = file.content_type
         else:
             content_type = "application/octet-stream"
+        if self.dedup:
+            key = f"{key}_{file.filename}" if file.filename else f"{key}.wav"
+            return await self.generate_presigned_url(
+                key=await self.put_blob(key=key, file=file, content_type=content_type)
+            )
         key = (
             f"{key}_{uuid4().hex}_{file.filename}"
             if file.filename
             else f"{key}_{uuid4().hex}.wav"
         )
-        data = await file.read()
-        await self.put_object(key=key, data=data, content_type=content_type)
+        await self.upload(key=key, file=file, content_type=content_type)
         return await self.generate_presigned_url(key=key)
 
-    @handle
+    @asyncify("io")
+    def head_object(self, *, key: str) -> bool:
+        """
+        Check whether an object exists in the storage.
+        """
+        try:
+            self.minio.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except self.minio.exceptions.ClientError as e:
+            if _not_found(e):
+                return False
+            raise
+
+    async def checksum(self, file: UploadFile) -> tuple[str, int]:
+        """
+        Hash a file with SHA-256 in parts of `PART_SIZE` bytes, then rewind it.
+
+        Returns:
+                tuple[str, int]: The hex digest and the size of the file in bytes.
+        """
+        digest = hashlib.sha256()
+        update = asyncify("io")(digest.update)
+        size = 0
+        while data := await file.read(PART_SIZE):
+            size += len(data)
+            await update(data)
+        await file.seek(0)
+        return digest.hexdigest(), size
+
+    async def put_blob(self, *, key: str, file: UploadFile, content_type: str) -> str:
+        """
+        Store a file under the SHA-256 of its content and point `key` to it.
+
+        The spooled file is hashed first, and only uploaded, straight to its
+        content-addressed key, when no blob with the same content exists already.
+        Blobs are reference counted so that `remove` only deletes the object once no
+        logical key points to it; the references of a logical key are updated under
+        its lock.
+
+        Returns:
+                str: The content-addressed key of the blob.
+        """
+        sha, size = await self.checksum(file)
+        blob_key = f"blobs/{sha[:2]}/{sha}"
+        async with _lock(f"ref/{key}"):
+            previous = await _find(BlobRef, key)
+            if previous and previous["blob"] == sha:
+                return blob_key
+            async with _lock(f"blob/{sha}"):
+                data = await _find(Blob, sha)
+                blob = Blob.hydrate(data) if data else None
+                if blob is None:
+                    if not await self.head_object(key=blob_key):
+                        await self.upload(
+                            key=blob_key, file=file, content_type=content_type
+                        )
+                    else:
+                        logger.info("Blob %s already uploaded, skipping", sha)
+                    blob = Blob(
+                        id=sha, key=blob_key, size=size, content_type=content_type
+                    )
+                else:
+                    logger.info("Blob %s already stored, skipping upload", sha)
+                blob.refcount += 1
+                await blob.save()
+            await BlobRef(id=key, blob=sha).save()
+            if previous:
+                await self.release_blob(sha=previous["blob"])
+        return blob_key
+
+    async def release_blob(self, *, sha: str) -> None:
+        """
+        Drop a reference to a blob, deleting it once it is no longer referenced.
+        """
+        async with _lock(f"blob/{sha}"):
+            data = await _find(Blob, sha)
+            if not data:
+                return
+            blob = Blob.hydrate(data)
+            blob.refcount -= 1
+            if blob.refcount > 0:
+                await blob.save()
+                return
+            await self.remove_object(key=blob.key)
+            await Blob.delete(sha)
+
+    async def resolve(self, *, key: str) -> str:
+        """
+        Resolve a logical key to the key of the object holding its content.
+        """
+        if not self.dedup:
+            return key
+        ref = await _find(BlobRef, key)
+        return f"blobs/{ref['blob'][:2]}/{ref['blob']}" if ref else key
+
+    @handle(idempotent=True)
+    async def download(self, *, key: str) -> StreamingResponse:
+        """
+        Proxy a file from the storage, streaming its body in chunks.
+        """
+        try:
+            response = await self.get_object_stream(key=await self.resolve(key=key))
+        except self.minio.exceptions.ClientError as e:
+            if _not_found(e):
+                raise HTTPException(status_code=404, detail=f"{key} not found") from e
+            raise
+        return StreamingResponse(
+            self.iter_body(response["Body"]),
+            media_type=response.get("ContentType") or _det_content_type(key),
+            headers={"Content-Length": str(response["ContentLength"])},
+        )
+
+    @handle(idempotent=True)
     async def get(self, *, key: str) -> str:
         """
         Get a file from the storage.
         """
-        return await self.generate_presigned_url(key=key)
+        return await self.generate_presigned_url(key=await self.resolve(key=key))
 
-    @asyncify
+    @handle(idempotent=True)
+    async def get_many(self, *, keys: list[str], ttl: int = 3600) -> dict[str, str]:
+        """
+        Get presigned URLs for many files at once.
+        """
+        if self.dedup:
+            return {
+                key: self.presign(key=await self.resolve(key=key), ttl=ttl)
+                for key in keys
+            }
+        return {key: self.presign(key=key, ttl=ttl) for key in keys}
+
+    @asyncify("io")
     def remove_object(self, *, key: str):
         """
         Remove an object from the storage.
         """
         self.minio.delete_object(Bucket=self.bucket, Key=key)
+        presigned.discard(self.bucket, key)
 
     @handle
     async def remove(self, *, key: str):
         """
         Remove a file from the storage.
+
+        Not retried: with `dedup` it releases a reference to the blob, which must
+        happen exactly once.
         """
+        if self.dedup:
+            async with _lock(f"ref/{key}"):
+                ref = await _find(BlobRef, key)
+                if ref:
+                    await BlobRef.delete(key)
+                    await self.release_blob(sha=ref["blob"])
+                    return
         await self.remove_object(key=key)
 
-    @asyncify
+    @asyncify("io")
     def list_objects(self, *, key: str):
         """
         List objects in the storage.
         """
         return self.minio.list_objects(Bucket=self.bucket, Prefix=key)
 
-    @handle
+    @asyncify("io")
+    def list_objects_page(
+        self,
+        *,
+        prefix: str,
+        token: str | None = None,
+        delimiter: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        List a page of up to 1000 objects in the storage.
+        """
+        kwargs: dict[str, Any] = {"Bucket": self.bucket, "Prefix": prefix}
+        if token:
+            kwargs["ContinuationToken"] = token
+        if delimiter:
+            kwargs["Delimiter"] = delimiter
+        return self.minio.list_objects_v2(**kwargs)
+
+    async def iter_pages(
+        self, *, prefix: str, delimiter: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over the pages of objects under `prefix`, following continuation
+        tokens until the listing is exhausted.
+        """
+        token: str | None = None
+        while True:
+            page = await self.list_objects_page(
+                prefix=prefix, token=token, delimiter=delimiter
+            )
+            yield page
+            if not page.get("IsTruncated"):
+                return
+            token = page["NextContinuationToken"]
+
+    async def iter_objects(
+        self,
+        prefix: str = "",
+        *,
+        shard: bool = False,
+        delimiter: str = "/",
+        concurrency: int = LIST_CONCURRENCY,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over every object under `prefix`, one page in memory at a time.
+
+        With `shard`, the prefix is first listed by `delimiter` and the resulting
+        common prefixes are listed concurrently, at most `concurrency` at once, with
+        their objects yielded as they arrive (in no particular order).
+        """
+        if not shard:
+            async for page in self.iter_pages(prefix=prefix):
+                for obj in page.get("Contents", []):
+                    yield obj
+            return
+        queue: asyncio.Queue[dict[str, Any] | Exception | None] = asyncio.Queue(
+            maxsize=1000
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _list(shard_prefix: str):
+            async with semaphore:
+                async for obj in self.iter_objects(shard_prefix):
+                    await queue.put(obj)
+
+        async def _produce():
+            tasks: list[asyncio.Task[None]] = []
+            try:
+                async for page in self.iter_pages(prefix=prefix, delimiter=delimiter):
+                    for obj in page.get("Contents", []):
+                        await queue.put(obj)
+                    for common in page.get("CommonPrefixes", []):
+                        tasks.append(asyncio.create_task(_list(common["Prefix"])))
+                await asyncio.gather(*tasks)
+                await queue.put(None)
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                raise
+            except Exception as e:  # pylint: disable=W0718
+                for task in tasks:
+                    task.cancel()
+                await queue.put(e)
+
+        producer = asyncio.create_task(_produce())
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    @handle(idempotent=True)
     async def list(self, *, key: str):
         """
         List files in the storage.
@@ -1529,8 +1529,9 @@ static const char *__pyx_f[] = {
 struct __pyx_obj_7rocksdb_RocksDBWrapper;
 struct __pyx_obj_7rocksdb_Collection;
 struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__;
-struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many;
+struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw;
 struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr;
+struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr;
 
 /* "rocksdb.pyx":81
  *         void Destroy()
@@ -1584,29 +1585,45 @@ struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ {
 };
 
 
-/* "rocksdb.pyx":184
+/* "rocksdb.pyx":202
  *         return results
  * 
- *     def find_many(self, object kwargs):             # <<<<<<<<<<<<<<
- *         cdef list results = []
- *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ *     def find_many_raw(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the stored bytes of the documents matching `kwargs`. String filters
  */
-struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many {
+struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw {
   PyObject_HEAD
+  PyObject *__pyx_v_value;
   PyObject *__pyx_v_value_dict;
 };
 
 
-/* "rocksdb.pyx":193
+/* "rocksdb.pyx":222
  *                 value = (<bytes>it.value().data())[:it.value().size()]
- *                 value_dict = orjson.loads(value)  # Parse bytes to dict
- *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):             # <<<<<<<<<<<<<<
- *                     results.append(value_dict)
  *                 it.Next()
+ *                 if not all(needle in value for needle in needles):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 value_dict = orjson.loads(value)  # Parse bytes to dict
  */
 struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr {
   PyObject_HEAD
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *__pyx_outer_scope;
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *__pyx_outer_scope;
+  PyObject *__pyx_genexpr_arg_0;
+  PyObject *__pyx_v_needle;
+};
+
+
+/* "rocksdb.pyx":225
+ *                     continue
+ *                 value_dict = orjson.loads(value)  # Parse bytes to dict
+ *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):             # <<<<<<<<<<<<<<
+ *                     results.append(value)
+ *         finally:
+ */
+struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr {
+  PyObject_HEAD
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *__pyx_outer_scope;
   PyObject *__pyx_genexpr_arg_0;
   PyObject *__pyx_v_k;
   PyObject *__pyx_v_v;
@@ -2062,6 +2079,39 @@ static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
 #define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
 #endif
 
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* RaiseUnboundLocalError.proto */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
+
+/* RaiseClosureNameError.proto */
+static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname);
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
 /* IterFinish.proto */
 static CYTHON_INLINE int __Pyx_IterFinish(void);
 
@@ -2107,11 +2157,11 @@ static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict,
 static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
                                               PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
 
-/* RaiseUnboundLocalError.proto */
-static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
-
-/* RaiseClosureNameError.proto */
-static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname);
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
 
 /* IncludeStructmemberH.proto */
 #include <structmember.h>
@@ -2532,10 +2582,12 @@ int __pyx_module_is_main_rocksdb = 0;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_TypeError;
 /* #### Code section: string_decls ### */
-static const char __pyx_k__2[] = "*";
+static const char __pyx_k_k[] = "k";
+static const char __pyx_k_v[] = "v";
+static const char __pyx_k__3[] = "*";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_it[] = "it";
-static const char __pyx_k__30[] = "?";
+static const char __pyx_k__36[] = "?";
 static const char __pyx_k_get[] = "get";
 static const char __pyx_k_key[] = "key";
 static const char __pyx_k_put[] = "put";
@@ -2571,6 +2623,8 @@ static const char __pyx_k_update[] = "update";
 static const char __pyx_k_db_path[] = "db_path";
 static const char __pyx_k_disable[] = "disable";
 static const char __pyx_k_genexpr[] = "genexpr";
+static const char __pyx_k_get_raw[] = "get_raw";
+static const char __pyx_k_needles[] = "needles";
 static const char __pyx_k_results[] = "results";
 static const char __pyx_k_rocksdb[] = "rocksdb";
 static const char __pyx_k_find_all[] = "find_all";
@@ -2589,9 +2643,11 @@ static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_find_first[] = "find_first";
 static const char __pyx_k_value_dict[] = "value_dict";
 static const char __pyx_k_rocksdb_pyx[] = "rocksdb.pyx";
+static const char __pyx_k_find_all_raw[] = "find_all_raw";
 static const char __pyx_k_initializing[] = "_initializing";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
 static const char __pyx_k_stringsource[] = "<stringsource>";
+static const char __pyx_k_find_many_raw[] = "find_many_raw";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_Collection_get[] = "Collection.get";
 static const char __pyx_k_Object_with_id[] = "Object with id ";
@@ -2603,6 +2659,7 @@ static const char __pyx_k_Collection_create[] = "Collection.create";
 static const char __pyx_k_Collection_delete[] = "Collection.delete";
 static const char __pyx_k_Collection_exists[] = "Collection.exists";
 static const char __pyx_k_Collection_update[] = "Collection.update";
+static const char __pyx_k_Collection_get_raw[] = "Collection.get_raw";
 static const char __pyx_k_RocksDBWrapper_get[] = "RocksDBWrapper.get";
 static const char __pyx_k_RocksDBWrapper_put[] = "RocksDBWrapper.put";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
@@ -2615,10 +2672,12 @@ static const char __pyx_k_Collection_find_many[] = "Collection.find_many";
 static const char __pyx_k_Collection_find_first[] = "Collection.find_first";
 static const char __pyx_k_RocksDBWrapper___iter[] = "RocksDBWrapper.__iter__";
 static const char __pyx_k_RocksDBWrapper_delete[] = "RocksDBWrapper.delete";
+static const char __pyx_k_Collection_find_all_raw[] = "Collection.find_all_raw";
+static const char __pyx_k_Collection_find_many_raw[] = "Collection.find_many_raw";
 static const char __pyx_k_db_path_must_be_provided[] = "db_path must be provided";
-static const char __pyx_k_find_many_locals_genexpr[] = "find_many.<locals>.genexpr";
 static const char __pyx_k_Collection___reduce_cython[] = "Collection.__reduce_cython__";
 static const char __pyx_k_Collection___setstate_cython[] = "Collection.__setstate_cython__";
+static const char __pyx_k_find_many_raw_locals_genexpr[] = "find_many_raw.<locals>.genexpr";
 static const char __pyx_k_RocksDBWrapper___reduce_cython[] = "RocksDBWrapper.__reduce_cython__";
 static const char __pyx_k_RocksDBWrapper___setstate_cython[] = "RocksDBWrapper.__setstate_cython__";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
@@ -2639,18 +2698,23 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_8update(struct __pyx_obj_7rocksd
 static PyObject *__pyx_pf_7rocksdb_10Collection_10delete(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
 static PyObject *__pyx_pf_7rocksdb_10Collection_12find_one(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
 static PyObject *__pyx_pf_7rocksdb_10Collection_14find_all(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7rocksdb_10Collection_9find_many_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0); /* proto */
 static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_kwargs); /* proto */
-static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7rocksdb_10Collection_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7rocksdb_10Collection_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_18get_raw(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_20find_all_raw(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_13find_many_raw_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_13find_many_raw_3genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_22find_many_raw(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_kwargs); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_24count(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_26find_first(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_28find_last(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_30__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7rocksdb_10Collection_32__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_7rocksdb_RocksDBWrapper(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_7rocksdb_Collection(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct____iter__(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many_raw(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_3_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static __Pyx_CachedCFunction __pyx_umethod_PyString_Type_encode = {0, 0, 0, 0, 0};
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
@@ -2689,14 +2753,16 @@ typedef struct {
   PyObject *__pyx_type_7rocksdb_RocksDBWrapper;
   PyObject *__pyx_type_7rocksdb_Collection;
   PyObject *__pyx_type_7rocksdb___pyx_scope_struct____iter__;
-  PyObject *__pyx_type_7rocksdb___pyx_scope_struct_1_find_many;
+  PyObject *__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw;
   PyObject *__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr;
+  PyObject *__pyx_type_7rocksdb___pyx_scope_struct_3_genexpr;
   #endif
   PyTypeObject *__pyx_ptype_7rocksdb_RocksDBWrapper;
   PyTypeObject *__pyx_ptype_7rocksdb_Collection;
   PyTypeObject *__pyx_ptype_7rocksdb___pyx_scope_struct____iter__;
-  PyTypeObject *__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many;
+  PyTypeObject *__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw;
   PyTypeObject *__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr;
+  PyTypeObject *__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr;
   PyObject *__pyx_n_s_Collection;
   PyObject *__pyx_n_s_Collection___reduce_cython;
   PyObject *__pyx_n_s_Collection___setstate_cython;
@@ -2705,11 +2771,14 @@ typedef struct {
   PyObject *__pyx_n_s_Collection_delete;
   PyObject *__pyx_n_s_Collection_exists;
   PyObject *__pyx_n_s_Collection_find_all;
+  PyObject *__pyx_n_s_Collection_find_all_raw;
   PyObject *__pyx_n_s_Collection_find_first;
   PyObject *__pyx_n_s_Collection_find_last;
   PyObject *__pyx_n_s_Collection_find_many;
+  PyObject *__pyx_n_s_Collection_find_many_raw;
   PyObject *__pyx_n_s_Collection_find_one;
   PyObject *__pyx_n_s_Collection_get;
+  PyObject *__pyx_n_s_Collection_get_raw;
   PyObject *__pyx_n_s_Collection_update;
   PyObject *__pyx_n_s_OPT_SERIALIZE_NUMPY;
   PyObject *__pyx_kp_u_Object_with_id;
@@ -2722,8 +2791,8 @@ typedef struct {
   PyObject *__pyx_n_s_RocksDBWrapper_put;
   PyObject *__pyx_n_s_TypeError;
   PyObject *__pyx_n_s_ValueError;
-  PyObject *__pyx_n_s__2;
-  PyObject *__pyx_n_s__30;
+  PyObject *__pyx_n_s__3;
+  PyObject *__pyx_n_s__36;
   PyObject *__pyx_kp_u_already_exists;
   PyObject *__pyx_n_s_args;
   PyObject *__pyx_n_s_asyncio_coroutines;
@@ -2741,14 +2810,17 @@ typedef struct {
   PyObject *__pyx_n_s_encode;
   PyObject *__pyx_n_s_exists;
   PyObject *__pyx_n_s_find_all;
+  PyObject *__pyx_n_s_find_all_raw;
   PyObject *__pyx_n_s_find_first;
   PyObject *__pyx_n_s_find_last;
   PyObject *__pyx_n_s_find_many;
-  PyObject *__pyx_n_s_find_many_locals_genexpr;
+  PyObject *__pyx_n_s_find_many_raw;
+  PyObject *__pyx_n_s_find_many_raw_locals_genexpr;
   PyObject *__pyx_n_s_find_one;
   PyObject *__pyx_kp_u_gc;
   PyObject *__pyx_n_s_genexpr;
   PyObject *__pyx_n_s_get;
+  PyObject *__pyx_n_s_get_raw;
   PyObject *__pyx_n_s_getstate;
   PyObject *__pyx_n_s_import;
   PyObject *__pyx_n_s_initializing;
@@ -2757,11 +2829,13 @@ typedef struct {
   PyObject *__pyx_n_s_it;
   PyObject *__pyx_n_s_items;
   PyObject *__pyx_n_s_iter;
+  PyObject *__pyx_n_s_k;
   PyObject *__pyx_n_s_key;
   PyObject *__pyx_n_s_kwargs;
   PyObject *__pyx_n_s_loads;
   PyObject *__pyx_n_s_main;
   PyObject *__pyx_n_s_name;
+  PyObject *__pyx_n_s_needles;
   PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
   PyObject *__pyx_kp_u_not_found;
   PyObject *__pyx_n_s_option;
@@ -2785,36 +2859,45 @@ typedef struct {
   PyObject *__pyx_n_s_test;
   PyObject *__pyx_n_s_throw;
   PyObject *__pyx_n_s_update;
+  PyObject *__pyx_n_s_v;
   PyObject *__pyx_n_s_value;
   PyObject *__pyx_n_s_value_dict;
+  PyObject *__pyx_int_1;
+  PyObject *__pyx_int_neg_1;
   PyObject *__pyx_tuple_;
-  PyObject *__pyx_tuple__3;
-  PyObject *__pyx_tuple__5;
-  PyObject *__pyx_tuple__7;
-  PyObject *__pyx_tuple__9;
-  PyObject *__pyx_tuple__11;
-  PyObject *__pyx_tuple__19;
-  PyObject *__pyx_tuple__21;
-  PyObject *__pyx_tuple__23;
+  PyObject *__pyx_slice__2;
+  PyObject *__pyx_tuple__4;
+  PyObject *__pyx_tuple__6;
+  PyObject *__pyx_tuple__8;
+  PyObject *__pyx_tuple__10;
+  PyObject *__pyx_tuple__12;
+  PyObject *__pyx_tuple__20;
+  PyObject *__pyx_tuple__22;
   PyObject *__pyx_tuple__25;
-  PyObject *__pyx_codeobj__4;
-  PyObject *__pyx_codeobj__6;
-  PyObject *__pyx_codeobj__8;
-  PyObject *__pyx_codeobj__10;
-  PyObject *__pyx_codeobj__12;
+  PyObject *__pyx_tuple__27;
+  PyObject *__pyx_tuple__29;
+  PyObject *__pyx_tuple__31;
+  PyObject *__pyx_codeobj__5;
+  PyObject *__pyx_codeobj__7;
+  PyObject *__pyx_codeobj__9;
+  PyObject *__pyx_codeobj__11;
   PyObject *__pyx_codeobj__13;
   PyObject *__pyx_codeobj__14;
   PyObject *__pyx_codeobj__15;
   PyObject *__pyx_codeobj__16;
   PyObject *__pyx_codeobj__17;
   PyObject *__pyx_codeobj__18;
-  PyObject *__pyx_codeobj__20;
-  PyObject *__pyx_codeobj__22;
+  PyObject *__pyx_codeobj__19;
+  PyObject *__pyx_codeobj__21;
+  PyObject *__pyx_codeobj__23;
   PyObject *__pyx_codeobj__24;
   PyObject *__pyx_codeobj__26;
-  PyObject *__pyx_codeobj__27;
   PyObject *__pyx_codeobj__28;
-  PyObject *__pyx_codeobj__29;
+  PyObject *__pyx_codeobj__30;
+  PyObject *__pyx_codeobj__32;
+  PyObject *__pyx_codeobj__33;
+  PyObject *__pyx_codeobj__34;
+  PyObject *__pyx_codeobj__35;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -2863,10 +2946,12 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_type_7rocksdb_Collection);
   Py_CLEAR(clear_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct____iter__);
   Py_CLEAR(clear_module_state->__pyx_type_7rocksdb___pyx_scope_struct____iter__);
-  Py_CLEAR(clear_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many);
-  Py_CLEAR(clear_module_state->__pyx_type_7rocksdb___pyx_scope_struct_1_find_many);
+  Py_CLEAR(clear_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw);
+  Py_CLEAR(clear_module_state->__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw);
   Py_CLEAR(clear_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr);
   Py_CLEAR(clear_module_state->__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_type_7rocksdb___pyx_scope_struct_3_genexpr);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection___reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection___setstate_cython);
@@ -2875,11 +2960,14 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_delete);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_exists);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_find_all);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Collection_find_all_raw);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_find_first);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_find_last);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_find_many);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Collection_find_many_raw);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_find_one);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_get);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Collection_get_raw);
   Py_CLEAR(clear_module_state->__pyx_n_s_Collection_update);
   Py_CLEAR(clear_module_state->__pyx_n_s_OPT_SERIALIZE_NUMPY);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Object_with_id);
@@ -2892,8 +2980,8 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_RocksDBWrapper_put);
   Py_CLEAR(clear_module_state->__pyx_n_s_TypeError);
   Py_CLEAR(clear_module_state->__pyx_n_s_ValueError);
-  Py_CLEAR(clear_module_state->__pyx_n_s__2);
-  Py_CLEAR(clear_module_state->__pyx_n_s__30);
+  Py_CLEAR(clear_module_state->__pyx_n_s__3);
+  Py_CLEAR(clear_module_state->__pyx_n_s__36);
   Py_CLEAR(clear_module_state->__pyx_kp_u_already_exists);
   Py_CLEAR(clear_module_state->__pyx_n_s_args);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
@@ -2911,14 +2999,17 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_encode);
   Py_CLEAR(clear_module_state->__pyx_n_s_exists);
   Py_CLEAR(clear_module_state->__pyx_n_s_find_all);
+  Py_CLEAR(clear_module_state->__pyx_n_s_find_all_raw);
   Py_CLEAR(clear_module_state->__pyx_n_s_find_first);
   Py_CLEAR(clear_module_state->__pyx_n_s_find_last);
   Py_CLEAR(clear_module_state->__pyx_n_s_find_many);
-  Py_CLEAR(clear_module_state->__pyx_n_s_find_many_locals_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_n_s_find_many_raw);
+  Py_CLEAR(clear_module_state->__pyx_n_s_find_many_raw_locals_genexpr);
   Py_CLEAR(clear_module_state->__pyx_n_s_find_one);
   Py_CLEAR(clear_module_state->__pyx_kp_u_gc);
   Py_CLEAR(clear_module_state->__pyx_n_s_genexpr);
   Py_CLEAR(clear_module_state->__pyx_n_s_get);
+  Py_CLEAR(clear_module_state->__pyx_n_s_get_raw);
   Py_CLEAR(clear_module_state->__pyx_n_s_getstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_import);
   Py_CLEAR(clear_module_state->__pyx_n_s_initializing);
@@ -2927,11 +3018,13 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_it);
   Py_CLEAR(clear_module_state->__pyx_n_s_items);
   Py_CLEAR(clear_module_state->__pyx_n_s_iter);
+  Py_CLEAR(clear_module_state->__pyx_n_s_k);
   Py_CLEAR(clear_module_state->__pyx_n_s_key);
   Py_CLEAR(clear_module_state->__pyx_n_s_kwargs);
   Py_CLEAR(clear_module_state->__pyx_n_s_loads);
   Py_CLEAR(clear_module_state->__pyx_n_s_main);
   Py_CLEAR(clear_module_state->__pyx_n_s_name);
+  Py_CLEAR(clear_module_state->__pyx_n_s_needles);
   Py_CLEAR(clear_module_state->__pyx_kp_s_no_default___reduce___due_to_non);
   Py_CLEAR(clear_module_state->__pyx_kp_u_not_found);
   Py_CLEAR(clear_module_state->__pyx_n_s_option);
@@ -2955,36 +3048,45 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_test);
   Py_CLEAR(clear_module_state->__pyx_n_s_throw);
   Py_CLEAR(clear_module_state->__pyx_n_s_update);
+  Py_CLEAR(clear_module_state->__pyx_n_s_v);
   Py_CLEAR(clear_module_state->__pyx_n_s_value);
   Py_CLEAR(clear_module_state->__pyx_n_s_value_dict);
+  Py_CLEAR(clear_module_state->__pyx_int_1);
+  Py_CLEAR(clear_module_state->__pyx_int_neg_1);
   Py_CLEAR(clear_module_state->__pyx_tuple_);
-  Py_CLEAR(clear_module_state->__pyx_tuple__3);
-  Py_CLEAR(clear_module_state->__pyx_tuple__5);
-  Py_CLEAR(clear_module_state->__pyx_tuple__7);
-  Py_CLEAR(clear_module_state->__pyx_tuple__9);
-  Py_CLEAR(clear_module_state->__pyx_tuple__11);
-  Py_CLEAR(clear_module_state->__pyx_tuple__19);
-  Py_CLEAR(clear_module_state->__pyx_tuple__21);
-  Py_CLEAR(clear_module_state->__pyx_tuple__23);
+  Py_CLEAR(clear_module_state->__pyx_slice__2);
+  Py_CLEAR(clear_module_state->__pyx_tuple__4);
+  Py_CLEAR(clear_module_state->__pyx_tuple__6);
+  Py_CLEAR(clear_module_state->__pyx_tuple__8);
+  Py_CLEAR(clear_module_state->__pyx_tuple__10);
+  Py_CLEAR(clear_module_state->__pyx_tuple__12);
+  Py_CLEAR(clear_module_state->__pyx_tuple__20);
+  Py_CLEAR(clear_module_state->__pyx_tuple__22);
   Py_CLEAR(clear_module_state->__pyx_tuple__25);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__4);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__6);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__8);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__10);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__12);
+  Py_CLEAR(clear_module_state->__pyx_tuple__27);
+  Py_CLEAR(clear_module_state->__pyx_tuple__29);
+  Py_CLEAR(clear_module_state->__pyx_tuple__31);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__5);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__7);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__9);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__11);
   Py_CLEAR(clear_module_state->__pyx_codeobj__13);
   Py_CLEAR(clear_module_state->__pyx_codeobj__14);
   Py_CLEAR(clear_module_state->__pyx_codeobj__15);
   Py_CLEAR(clear_module_state->__pyx_codeobj__16);
   Py_CLEAR(clear_module_state->__pyx_codeobj__17);
   Py_CLEAR(clear_module_state->__pyx_codeobj__18);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__20);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__22);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__19);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__21);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__23);
   Py_CLEAR(clear_module_state->__pyx_codeobj__24);
   Py_CLEAR(clear_module_state->__pyx_codeobj__26);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__27);
   Py_CLEAR(clear_module_state->__pyx_codeobj__28);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__29);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__30);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__32);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__33);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__34);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__35);
   return 0;
 }
 #endif
@@ -3011,10 +3113,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_type_7rocksdb_Collection);
   Py_VISIT(traverse_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct____iter__);
   Py_VISIT(traverse_module_state->__pyx_type_7rocksdb___pyx_scope_struct____iter__);
-  Py_VISIT(traverse_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many);
-  Py_VISIT(traverse_module_state->__pyx_type_7rocksdb___pyx_scope_struct_1_find_many);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw);
+  Py_VISIT(traverse_module_state->__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw);
   Py_VISIT(traverse_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr);
   Py_VISIT(traverse_module_state->__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_type_7rocksdb___pyx_scope_struct_3_genexpr);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection___reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection___setstate_cython);
@@ -3023,11 +3127,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_delete);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_exists);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_find_all);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Collection_find_all_raw);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_find_first);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_find_last);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_find_many);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Collection_find_many_raw);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_find_one);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_get);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Collection_get_raw);
   Py_VISIT(traverse_module_state->__pyx_n_s_Collection_update);
   Py_VISIT(traverse_module_state->__pyx_n_s_OPT_SERIALIZE_NUMPY);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Object_with_id);
@@ -3040,8 +3147,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_RocksDBWrapper_put);
   Py_VISIT(traverse_module_state->__pyx_n_s_TypeError);
   Py_VISIT(traverse_module_state->__pyx_n_s_ValueError);
-  Py_VISIT(traverse_module_state->__pyx_n_s__2);
-  Py_VISIT(traverse_module_state->__pyx_n_s__30);
+  Py_VISIT(traverse_module_state->__pyx_n_s__3);
+  Py_VISIT(traverse_module_state->__pyx_n_s__36);
   Py_VISIT(traverse_module_state->__pyx_kp_u_already_exists);
   Py_VISIT(traverse_module_state->__pyx_n_s_args);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
@@ -3059,14 +3166,17 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_encode);
   Py_VISIT(traverse_module_state->__pyx_n_s_exists);
   Py_VISIT(traverse_module_state->__pyx_n_s_find_all);
+  Py_VISIT(traverse_module_state->__pyx_n_s_find_all_raw);
   Py_VISIT(traverse_module_state->__pyx_n_s_find_first);
   Py_VISIT(traverse_module_state->__pyx_n_s_find_last);
   Py_VISIT(traverse_module_state->__pyx_n_s_find_many);
-  Py_VISIT(traverse_module_state->__pyx_n_s_find_many_locals_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_n_s_find_many_raw);
+  Py_VISIT(traverse_module_state->__pyx_n_s_find_many_raw_locals_genexpr);
   Py_VISIT(traverse_module_state->__pyx_n_s_find_one);
   Py_VISIT(traverse_module_state->__pyx_kp_u_gc);
   Py_VISIT(traverse_module_state->__pyx_n_s_genexpr);
   Py_VISIT(traverse_module_state->__pyx_n_s_get);
+  Py_VISIT(traverse_module_state->__pyx_n_s_get_raw);
   Py_VISIT(traverse_module_state->__pyx_n_s_getstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_import);
   Py_VISIT(traverse_module_state->__pyx_n_s_initializing);
@@ -3075,11 +3185,13 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_it);
   Py_VISIT(traverse_module_state->__pyx_n_s_items);
   Py_VISIT(traverse_module_state->__pyx_n_s_iter);
+  Py_VISIT(traverse_module_state->__pyx_n_s_k);
   Py_VISIT(traverse_module_state->__pyx_n_s_key);
   Py_VISIT(traverse_module_state->__pyx_n_s_kwargs);
   Py_VISIT(traverse_module_state->__pyx_n_s_loads);
   Py_VISIT(traverse_module_state->__pyx_n_s_main);
   Py_VISIT(traverse_module_state->__pyx_n_s_name);
+  Py_VISIT(traverse_module_state->__pyx_n_s_needles);
   Py_VISIT(traverse_module_state->__pyx_kp_s_no_default___reduce___due_to_non);
   Py_VISIT(traverse_module_state->__pyx_kp_u_not_found);
   Py_VISIT(traverse_module_state->__pyx_n_s_option);
@@ -3103,36 +3215,45 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_test);
   Py_VISIT(traverse_module_state->__pyx_n_s_throw);
   Py_VISIT(traverse_module_state->__pyx_n_s_update);
+  Py_VISIT(traverse_module_state->__pyx_n_s_v);
   Py_VISIT(traverse_module_state->__pyx_n_s_value);
   Py_VISIT(traverse_module_state->__pyx_n_s_value_dict);
+  Py_VISIT(traverse_module_state->__pyx_int_1);
+  Py_VISIT(traverse_module_state->__pyx_int_neg_1);
   Py_VISIT(traverse_module_state->__pyx_tuple_);
-  Py_VISIT(traverse_module_state->__pyx_tuple__3);
-  Py_VISIT(traverse_module_state->__pyx_tuple__5);
-  Py_VISIT(traverse_module_state->__pyx_tuple__7);
-  Py_VISIT(traverse_module_state->__pyx_tuple__9);
-  Py_VISIT(traverse_module_state->__pyx_tuple__11);
-  Py_VISIT(traverse_module_state->__pyx_tuple__19);
-  Py_VISIT(traverse_module_state->__pyx_tuple__21);
-  Py_VISIT(traverse_module_state->__pyx_tuple__23);
+  Py_VISIT(traverse_module_state->__pyx_slice__2);
+  Py_VISIT(traverse_module_state->__pyx_tuple__4);
+  Py_VISIT(traverse_module_state->__pyx_tuple__6);
+  Py_VISIT(traverse_module_state->__pyx_tuple__8);
+  Py_VISIT(traverse_module_state->__pyx_tuple__10);
+  Py_VISIT(traverse_module_state->__pyx_tuple__12);
+  Py_VISIT(traverse_module_state->__pyx_tuple__20);
+  Py_VISIT(traverse_module_state->__pyx_tuple__22);
   Py_VISIT(traverse_module_state->__pyx_tuple__25);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__4);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__6);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__8);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__10);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__12);
+  Py_VISIT(traverse_module_state->__pyx_tuple__27);
+  Py_VISIT(traverse_module_state->__pyx_tuple__29);
+  Py_VISIT(traverse_module_state->__pyx_tuple__31);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__5);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__7);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__9);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__11);
   Py_VISIT(traverse_module_state->__pyx_codeobj__13);
   Py_VISIT(traverse_module_state->__pyx_codeobj__14);
   Py_VISIT(traverse_module_state->__pyx_codeobj__15);
   Py_VISIT(traverse_module_state->__pyx_codeobj__16);
   Py_VISIT(traverse_module_state->__pyx_codeobj__17);
   Py_VISIT(traverse_module_state->__pyx_codeobj__18);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__20);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__22);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__19);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__21);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__23);
   Py_VISIT(traverse_module_state->__pyx_codeobj__24);
   Py_VISIT(traverse_module_state->__pyx_codeobj__26);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__27);
   Py_VISIT(traverse_module_state->__pyx_codeobj__28);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__29);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__30);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__32);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__33);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__34);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__35);
   return 0;
 }
 #endif
@@ -3171,14 +3292,16 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_type_7rocksdb_RocksDBWrapper __pyx_mstate_global->__pyx_type_7rocksdb_RocksDBWrapper
 #define __pyx_type_7rocksdb_Collection __pyx_mstate_global->__pyx_type_7rocksdb_Collection
 #define __pyx_type_7rocksdb___pyx_scope_struct____iter__ __pyx_mstate_global->__pyx_type_7rocksdb___pyx_scope_struct____iter__
-#define __pyx_type_7rocksdb___pyx_scope_struct_1_find_many __pyx_mstate_global->__pyx_type_7rocksdb___pyx_scope_struct_1_find_many
+#define __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw __pyx_mstate_global->__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw
 #define __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr __pyx_mstate_global->__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr
+#define __pyx_type_7rocksdb___pyx_scope_struct_3_genexpr __pyx_mstate_global->__pyx_type_7rocksdb___pyx_scope_struct_3_genexpr
 #endif
 #define __pyx_ptype_7rocksdb_RocksDBWrapper __pyx_mstate_global->__pyx_ptype_7rocksdb_RocksDBWrapper
 #define __pyx_ptype_7rocksdb_Collection __pyx_mstate_global->__pyx_ptype_7rocksdb_Collection
 #define __pyx_ptype_7rocksdb___pyx_scope_struct____iter__ __pyx_mstate_global->__pyx_ptype_7rocksdb___pyx_scope_struct____iter__
-#define __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many __pyx_mstate_global->__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many
+#define __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw __pyx_mstate_global->__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw
 #define __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr __pyx_mstate_global->__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr
+#define __pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr __pyx_mstate_global->__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr
 #define __pyx_n_s_Collection __pyx_mstate_global->__pyx_n_s_Collection
 #define __pyx_n_s_Collection___reduce_cython __pyx_mstate_global->__pyx_n_s_Collection___reduce_cython
 #define __pyx_n_s_Collection___setstate_cython __pyx_mstate_global->__pyx_n_s_Collection___setstate_cython
@@ -3187,11 +3310,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_Collection_delete __pyx_mstate_global->__pyx_n_s_Collection_delete
 #define __pyx_n_s_Collection_exists __pyx_mstate_global->__pyx_n_s_Collection_exists
 #define __pyx_n_s_Collection_find_all __pyx_mstate_global->__pyx_n_s_Collection_find_all
+#define __pyx_n_s_Collection_find_all_raw __pyx_mstate_global->__pyx_n_s_Collection_find_all_raw
 #define __pyx_n_s_Collection_find_first __pyx_mstate_global->__pyx_n_s_Collection_find_first
 #define __pyx_n_s_Collection_find_last __pyx_mstate_global->__pyx_n_s_Collection_find_last
 #define __pyx_n_s_Collection_find_many __pyx_mstate_global->__pyx_n_s_Collection_find_many
+#define __pyx_n_s_Collection_find_many_raw __pyx_mstate_global->__pyx_n_s_Collection_find_many_raw
 #define __pyx_n_s_Collection_find_one __pyx_mstate_global->__pyx_n_s_Collection_find_one
 #define __pyx_n_s_Collection_get __pyx_mstate_global->__pyx_n_s_Collection_get
+#define __pyx_n_s_Collection_get_raw __pyx_mstate_global->__pyx_n_s_Collection_get_raw
 #define __pyx_n_s_Collection_update __pyx_mstate_global->__pyx_n_s_Collection_update
 #define __pyx_n_s_OPT_SERIALIZE_NUMPY __pyx_mstate_global->__pyx_n_s_OPT_SERIALIZE_NUMPY
 #define __pyx_kp_u_Object_with_id __pyx_mstate_global->__pyx_kp_u_Object_with_id
@@ -3204,8 +3330,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_RocksDBWrapper_put __pyx_mstate_global->__pyx_n_s_RocksDBWrapper_put
 #define __pyx_n_s_TypeError __pyx_mstate_global->__pyx_n_s_TypeError
 #define __pyx_n_s_ValueError __pyx_mstate_global->__pyx_n_s_ValueError
-#define __pyx_n_s__2 __pyx_mstate_global->__pyx_n_s__2
-#define __pyx_n_s__30 __pyx_mstate_global->__pyx_n_s__30
+#define __pyx_n_s__3 __pyx_mstate_global->__pyx_n_s__3
+#define __pyx_n_s__36 __pyx_mstate_global->__pyx_n_s__36
 #define __pyx_kp_u_already_exists __pyx_mstate_global->__pyx_kp_u_already_exists
 #define __pyx_n_s_args __pyx_mstate_global->__pyx_n_s_args
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
@@ -3223,14 +3349,17 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_encode __pyx_mstate_global->__pyx_n_s_encode
 #define __pyx_n_s_exists __pyx_mstate_global->__pyx_n_s_exists
 #define __pyx_n_s_find_all __pyx_mstate_global->__pyx_n_s_find_all
+#define __pyx_n_s_find_all_raw __pyx_mstate_global->__pyx_n_s_find_all_raw
 #define __pyx_n_s_find_first __pyx_mstate_global->__pyx_n_s_find_first
 #define __pyx_n_s_find_last __pyx_mstate_global->__pyx_n_s_find_last
 #define __pyx_n_s_find_many __pyx_mstate_global->__pyx_n_s_find_many
-#define __pyx_n_s_find_many_locals_genexpr __pyx_mstate_global->__pyx_n_s_find_many_locals_genexpr
+#define __pyx_n_s_find_many_raw __pyx_mstate_global->__pyx_n_s_find_many_raw
+#define __pyx_n_s_find_many_raw_locals_genexpr __pyx_mstate_global->__pyx_n_s_find_many_raw_locals_genexpr
 #define __pyx_n_s_find_one __pyx_mstate_global->__pyx_n_s_find_one
 #define __pyx_kp_u_gc __pyx_mstate_global->__pyx_kp_u_gc
 #define __pyx_n_s_genexpr __pyx_mstate_global->__pyx_n_s_genexpr
 #define __pyx_n_s_get __pyx_mstate_global->__pyx_n_s_get
+#define __pyx_n_s_get_raw __pyx_mstate_global->__pyx_n_s_get_raw
 #define __pyx_n_s_getstate __pyx_mstate_global->__pyx_n_s_getstate
 #define __pyx_n_s_import __pyx_mstate_global->__pyx_n_s_import
 #define __pyx_n_s_initializing __pyx_mstate_global->__pyx_n_s_initializing
@@ -3239,11 +3368,13 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_it __pyx_mstate_global->__pyx_n_s_it
 #define __pyx_n_s_items __pyx_mstate_global->__pyx_n_s_items
 #define __pyx_n_s_iter __pyx_mstate_global->__pyx_n_s_iter
+#define __pyx_n_s_k __pyx_mstate_global->__pyx_n_s_k
 #define __pyx_n_s_key __pyx_mstate_global->__pyx_n_s_key
 #define __pyx_n_s_kwargs __pyx_mstate_global->__pyx_n_s_kwargs
 #define __pyx_n_s_loads __pyx_mstate_global->__pyx_n_s_loads
 #define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
 #define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
+#define __pyx_n_s_needles __pyx_mstate_global->__pyx_n_s_needles
 #define __pyx_kp_s_no_default___reduce___due_to_non __pyx_mstate_global->__pyx_kp_s_no_default___reduce___due_to_non
 #define __pyx_kp_u_not_found __pyx_mstate_global->__pyx_kp_u_not_found
 #define __pyx_n_s_option __pyx_mstate_global->__pyx_n_s_option
@@ -3267,36 +3398,45 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
 #define __pyx_n_s_throw __pyx_mstate_global->__pyx_n_s_throw
 #define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
+#define __pyx_n_s_v __pyx_mstate_global->__pyx_n_s_v
 #define __pyx_n_s_value __pyx_mstate_global->__pyx_n_s_value
 #define __pyx_n_s_value_dict __pyx_mstate_global->__pyx_n_s_value_dict
+#define __pyx_int_1 __pyx_mstate_global->__pyx_int_1
+#define __pyx_int_neg_1 __pyx_mstate_global->__pyx_int_neg_1
 #define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
-#define __pyx_tuple__3 __pyx_mstate_global->__pyx_tuple__3
-#define __pyx_tuple__5 __pyx_mstate_global->__pyx_tuple__5
-#define __pyx_tuple__7 __pyx_mstate_global->__pyx_tuple__7
-#define __pyx_tuple__9 __pyx_mstate_global->__pyx_tuple__9
-#define __pyx_tuple__11 __pyx_mstate_global->__pyx_tuple__11
-#define __pyx_tuple__19 __pyx_mstate_global->__pyx_tuple__19
-#define __pyx_tuple__21 __pyx_mstate_global->__pyx_tuple__21
-#define __pyx_tuple__23 __pyx_mstate_global->__pyx_tuple__23
+#define __pyx_slice__2 __pyx_mstate_global->__pyx_slice__2
+#define __pyx_tuple__4 __pyx_mstate_global->__pyx_tuple__4
+#define __pyx_tuple__6 __pyx_mstate_global->__pyx_tuple__6
+#define __pyx_tuple__8 __pyx_mstate_global->__pyx_tuple__8
+#define __pyx_tuple__10 __pyx_mstate_global->__pyx_tuple__10
+#define __pyx_tuple__12 __pyx_mstate_global->__pyx_tuple__12
+#define __pyx_tuple__20 __pyx_mstate_global->__pyx_tuple__20
+#define __pyx_tuple__22 __pyx_mstate_global->__pyx_tuple__22
 #define __pyx_tuple__25 __pyx_mstate_global->__pyx_tuple__25
-#define __pyx_codeobj__4 __pyx_mstate_global->__pyx_codeobj__4
-#define __pyx_codeobj__6 __pyx_mstate_global->__pyx_codeobj__6
-#define __pyx_codeobj__8 __pyx_mstate_global->__pyx_codeobj__8
-#define __pyx_codeobj__10 __pyx_mstate_global->__pyx_codeobj__10
-#define __pyx_codeobj__12 __pyx_mstate_global->__pyx_codeobj__12
+#define __pyx_tuple__27 __pyx_mstate_global->__pyx_tuple__27
+#define __pyx_tuple__29 __pyx_mstate_global->__pyx_tuple__29
+#define __pyx_tuple__31 __pyx_mstate_global->__pyx_tuple__31
+#define __pyx_codeobj__5 __pyx_mstate_global->__pyx_codeobj__5
+#define __pyx_codeobj__7 __pyx_mstate_global->__pyx_codeobj__7
+#define __pyx_codeobj__9 __pyx_mstate_global->__pyx_codeobj__9
+#define __pyx_codeobj__11 __pyx_mstate_global->__pyx_codeobj__11
 #define __pyx_codeobj__13 __pyx_mstate_global->__pyx_codeobj__13
 #define __pyx_codeobj__14 __pyx_mstate_global->__pyx_codeobj__14
 #define __pyx_codeobj__15 __pyx_mstate_global->__pyx_codeobj__15
 #define __pyx_codeobj__16 __pyx_mstate_global->__pyx_codeobj__16
 #define __pyx_codeobj__17 __pyx_mstate_global->__pyx_codeobj__17
 #define __pyx_codeobj__18 __pyx_mstate_global->__pyx_codeobj__18
-#define __pyx_codeobj__20 __pyx_mstate_global->__pyx_codeobj__20
-#define __pyx_codeobj__22 __pyx_mstate_global->__pyx_codeobj__22
+#define __pyx_codeobj__19 __pyx_mstate_global->__pyx_codeobj__19
+#define __pyx_codeobj__21 __pyx_mstate_global->__pyx_codeobj__21
+#define __pyx_codeobj__23 __pyx_mstate_global->__pyx_codeobj__23
 #define __pyx_codeobj__24 __pyx_mstate_global->__pyx_codeobj__24
 #define __pyx_codeobj__26 __pyx_mstate_global->__pyx_codeobj__26
-#define __pyx_codeobj__27 __pyx_mstate_global->__pyx_codeobj__27
 #define __pyx_codeobj__28 __pyx_mstate_global->__pyx_codeobj__28
-#define __pyx_codeobj__29 __pyx_mstate_global->__pyx_codeobj__29
+#define __pyx_codeobj__30 __pyx_mstate_global->__pyx_codeobj__30
+#define __pyx_codeobj__32 __pyx_mstate_global->__pyx_codeobj__32
+#define __pyx_codeobj__33 __pyx_mstate_global->__pyx_codeobj__33
+#define __pyx_codeobj__34 __pyx_mstate_global->__pyx_codeobj__34
+#define __pyx_codeobj__35 __pyx_mstate_global->__pyx_codeobj__35
 /* #### Code section: module_code ### */
 
 /* "string.from_py":13
@@ -6908,8 +7048,8 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_14find_all(struct __pyx_obj_7roc
  *         return results
  * 
  *     def find_many(self, object kwargs):             # <<<<<<<<<<<<<<
- *         cdef list results = []
- *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
  */
 
 /* Python wrapper */
@@ -7007,233 +7147,444 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static PyObject *__pyx_gb_7rocksdb_10Collection_9find_many_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
-
-/* "rocksdb.pyx":193
- *                 value = (<bytes>it.value().data())[:it.value().size()]
- *                 value_dict = orjson.loads(value)  # Parse bytes to dict
- *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):             # <<<<<<<<<<<<<<
- *                     results.append(value_dict)
- *                 it.Next()
- */
 
-static PyObject *__pyx_pf_7rocksdb_10Collection_9find_many_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0) {
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *__pyx_cur_scope;
+static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_kwargs) {
+  PyObject *__pyx_7genexpr__pyx_v_value = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("genexpr", 0);
-  __pyx_cur_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr(__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr, __pyx_empty_tuple, NULL);
-  if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)Py_None);
-    __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 193, __pyx_L1_error)
-  } else {
-    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
-  }
-  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *) __pyx_self;
-  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
-  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
-  __pyx_cur_scope->__pyx_genexpr_arg_0 = __pyx_genexpr_arg_0;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
-  {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7rocksdb_10Collection_9find_many_2generator1, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_find_many_locals_genexpr, __pyx_n_s_rocksdb); if (unlikely(!gen)) __PYX_ERR(0, 193, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_cur_scope);
-    __Pyx_RefNannyFinishContext();
-    return (PyObject *) gen;
-  }
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("rocksdb.Collection.find_many.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_gb_7rocksdb_10Collection_9find_many_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
-{
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)__pyx_generator->closure);
-  PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  PyObject *(*__pyx_t_7)(PyObject *);
   PyObject *__pyx_t_8 = NULL;
-  int __pyx_t_9;
-  int __pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("genexpr", 0);
-  switch (__pyx_generator->resume_label) {
-    case 0: goto __pyx_L3_first_run;
-    default: /* CPython raises the right error here */
-    __Pyx_RefNannyFinishContext();
-    return NULL;
-  }
-  __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 193, __pyx_L1_error)
-  __pyx_t_2 = 0;
-  if (unlikely(!__pyx_cur_scope->__pyx_genexpr_arg_0)) { __Pyx_RaiseUnboundLocalError(".0"); __PYX_ERR(0, 193, __pyx_L1_error) }
-  if (unlikely(__pyx_cur_scope->__pyx_genexpr_arg_0 == Py_None)) {
-    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
-    __PYX_ERR(0, 193, __pyx_L1_error)
-  }
-  __pyx_t_5 = __Pyx_dict_iterator(__pyx_cur_scope->__pyx_genexpr_arg_0, 0, __pyx_n_s_items, (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 193, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_1);
-  __pyx_t_1 = __pyx_t_5;
-  __pyx_t_5 = 0;
-  while (1) {
-    __pyx_t_7 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, &__pyx_t_6, NULL, __pyx_t_4);
-    if (unlikely(__pyx_t_7 == 0)) break;
-    if (unlikely(__pyx_t_7 == -1)) __PYX_ERR(0, 193, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_k);
-    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_k, __pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_5);
+  __Pyx_RefNannySetupContext("find_many", 1);
+
+  /* "rocksdb.pyx":185
+ * 
+ *     def find_many(self, object kwargs):
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]             # <<<<<<<<<<<<<<
+ * 
+ *     def get_raw(self, str key):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_find_many_raw); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
     __pyx_t_5 = 0;
-    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_v);
-    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_v, __pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_6);
-    __pyx_t_6 = 0;
-    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_value_dict)) { __Pyx_RaiseClosureNameError("value_dict"); __PYX_ERR(0, 193, __pyx_L1_error) }
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_value_dict, __pyx_n_s_get); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 193, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = NULL;
-    __pyx_t_7 = 0;
     #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
-      if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_8);
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
-        __pyx_t_7 = 1;
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
       }
     }
     #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_cur_scope->__pyx_v_k};
-      __pyx_t_6 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 193, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_kwargs};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     }
-    __pyx_t_5 = PyObject_RichCompare(__pyx_t_6, __pyx_cur_scope->__pyx_v_v, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 193, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 193, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_10 = (!__pyx_t_9);
-    if (__pyx_t_10) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(Py_False);
-      __pyx_r = Py_False;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+    if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
+      __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+    } else {
+      __pyx_t_6 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 185, __pyx_L5_error)
     }
-  }
-  /*else*/ {
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_True);
-    __pyx_r = Py_True;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    goto __pyx_L0;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_7)) {
+        if (likely(PyList_CheckExact(__pyx_t_3))) {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
+            #if !CYTHON_ASSUME_SAFE_MACROS
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 185, __pyx_L5_error)
+            #endif
+            if (__pyx_t_6 >= __pyx_temp) break;
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 185, __pyx_L5_error)
+          #else
+          __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          #endif
+        } else {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
+            #if !CYTHON_ASSUME_SAFE_MACROS
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 185, __pyx_L5_error)
+            #endif
+            if (__pyx_t_6 >= __pyx_temp) break;
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 185, __pyx_L5_error)
+          #else
+          __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          #endif
+        }
+      } else {
+        __pyx_t_2 = __pyx_t_7(__pyx_t_3);
+        if (unlikely(!__pyx_t_2)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 185, __pyx_L5_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_2);
+      }
+      __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_value, __pyx_t_2);
+      __pyx_t_2 = 0;
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_orjson); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 185, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_loads); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 185, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = NULL;
+      __pyx_t_5 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (unlikely(PyMethod_Check(__pyx_t_8))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_8);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_8, function);
+          __pyx_t_5 = 1;
+        }
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_7genexpr__pyx_v_value};
+        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      }
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_2))) __PYX_ERR(0, 185, __pyx_L5_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_value); __pyx_7genexpr__pyx_v_value = 0;
+    goto __pyx_L9_exit_scope;
+    __pyx_L5_error:;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_value); __pyx_7genexpr__pyx_v_value = 0;
+    goto __pyx_L1_error;
+    __pyx_L9_exit_scope:;
+  } /* exit inner scope */
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "rocksdb.pyx":184
+ *         return results
+ * 
+ *     def find_many(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
+ */
 
   /* function exit code */
-  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_Generator_Replace_StopIteration(0);
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("rocksdb.Collection.find_many", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_value);
   __Pyx_XGIVEREF(__pyx_r);
-  #if !CYTHON_USE_EXC_INFO_STACK
-  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-  #endif
-  __pyx_generator->resume_label = -1;
-  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "rocksdb.pyx":184
- *         return results
+/* "rocksdb.pyx":187
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
+ *     def get_raw(self, str key):             # <<<<<<<<<<<<<<
+ *         return self.db.get(key)
  * 
- *     def find_many(self, object kwargs):             # <<<<<<<<<<<<<<
- *         cdef list results = []
- *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  */
 
-static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_kwargs) {
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *__pyx_cur_scope;
-  PyObject *__pyx_v_results = 0;
-  rocksdb::Iterator *__pyx_v_it;
-  CYTHON_UNUSED PyObject *__pyx_v_key = NULL;
-  PyObject *__pyx_v_value = NULL;
-  PyObject *__pyx_gb_7rocksdb_10Collection_9find_many_2generator1 = 0;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  char const *__pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
+/* Python wrapper */
+static PyObject *__pyx_pw_7rocksdb_10Collection_19get_raw(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_19get_raw = {"get_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_19get_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7rocksdb_10Collection_19get_raw(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_key = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_raw (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_key,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_key)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 187, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_raw") < 0)) __PYX_ERR(0, 187, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_key = ((PyObject*)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_raw", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 187, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("rocksdb.Collection.get_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_18get_raw(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self), __pyx_v_key);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7rocksdb_10Collection_18get_raw(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_key) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_raw", 1);
+
+  /* "rocksdb.pyx":188
+ * 
+ *     def get_raw(self, str key):
+ *         return self.db.get(key)             # <<<<<<<<<<<<<<
+ * 
+ *     def find_all_raw(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self->db), __pyx_n_s_get); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 188, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 188, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "rocksdb.pyx":187
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
+ *     def get_raw(self, str key):             # <<<<<<<<<<<<<<
+ *         return self.db.get(key)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rocksdb.Collection.get_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rocksdb.pyx":190
+ *         return self.db.get(key)
+ * 
+ *     def find_all_raw(self):             # <<<<<<<<<<<<<<
+ *         cdef list results = []
+ *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7rocksdb_10Collection_21find_all_raw(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_21find_all_raw = {"find_all_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_21find_all_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7rocksdb_10Collection_21find_all_raw(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_all_raw (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("find_all_raw", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "find_all_raw", 0))) return NULL;
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_20find_all_raw(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7rocksdb_10Collection_20find_all_raw(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
+  PyObject *__pyx_v_results = 0;
+  rocksdb::Iterator *__pyx_v_it;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  char const *__pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
   PyObject *__pyx_t_10 = NULL;
   PyObject *__pyx_t_11 = NULL;
   PyObject *__pyx_t_12 = NULL;
   PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("find_many", 0);
-  __pyx_cur_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *)__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many(__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many, __pyx_empty_tuple, NULL);
-  if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *)Py_None);
-    __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 184, __pyx_L1_error)
-  } else {
-    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
-  }
+  __Pyx_RefNannySetupContext("find_all_raw", 1);
 
-  /* "rocksdb.pyx":185
+  /* "rocksdb.pyx":191
  * 
- *     def find_many(self, object kwargs):
+ *     def find_all_raw(self):
  *         cdef list results = []             # <<<<<<<<<<<<<<
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_results = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "rocksdb.pyx":186
- *     def find_many(self, object kwargs):
+  /* "rocksdb.pyx":192
+ *     def find_all_raw(self):
  *         cdef list results = []
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)             # <<<<<<<<<<<<<<
  *         try:
@@ -7241,7 +7592,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7ro
  */
   __pyx_v_it = __pyx_v_self->db->db->NewIterator(__pyx_v_self->db->read_options);
 
-  /* "rocksdb.pyx":187
+  /* "rocksdb.pyx":193
  *         cdef list results = []
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:             # <<<<<<<<<<<<<<
@@ -7250,153 +7601,902 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7ro
  */
   /*try:*/ {
 
-    /* "rocksdb.pyx":188
+    /* "rocksdb.pyx":194
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  *             it.SeekToFirst()             # <<<<<<<<<<<<<<
  *             while it.Valid():
- *                 key = (<bytes>it.key().data())[:it.key().size()]
+ *                 results.append((<bytes>it.value().data())[:it.value().size()])
  */
     __pyx_v_it->SeekToFirst();
 
-    /* "rocksdb.pyx":189
+    /* "rocksdb.pyx":195
  *         try:
  *             it.SeekToFirst()
  *             while it.Valid():             # <<<<<<<<<<<<<<
- *                 key = (<bytes>it.key().data())[:it.key().size()]
- *                 value = (<bytes>it.value().data())[:it.value().size()]
+ *                 results.append((<bytes>it.value().data())[:it.value().size()])
+ *                 it.Next()
  */
     while (1) {
       __pyx_t_2 = (__pyx_v_it->Valid() != 0);
       if (!__pyx_t_2) break;
 
-      /* "rocksdb.pyx":190
+      /* "rocksdb.pyx":196
  *             it.SeekToFirst()
  *             while it.Valid():
- *                 key = (<bytes>it.key().data())[:it.key().size()]             # <<<<<<<<<<<<<<
- *                 value = (<bytes>it.value().data())[:it.value().size()]
- *                 value_dict = orjson.loads(value)  # Parse bytes to dict
+ *                 results.append((<bytes>it.value().data())[:it.value().size()])             # <<<<<<<<<<<<<<
+ *                 it.Next()
+ *         finally:
  */
-      __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_it->key().data()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L4_error)
+      __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (unlikely(__pyx_t_1 == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 190, __pyx_L4_error)
+        __PYX_ERR(0, 196, __pyx_L4_error)
       }
-      __pyx_t_3 = PySequence_GetSlice(((PyObject*)__pyx_t_1), 0, __pyx_v_it->key().size()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 190, __pyx_L4_error)
+      __pyx_t_3 = PySequence_GetSlice(((PyObject*)__pyx_t_1), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 196, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_key, ((PyObject*)__pyx_t_3));
-      __pyx_t_3 = 0;
+      __pyx_t_4 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_3); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 196, __pyx_L4_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-      /* "rocksdb.pyx":191
+      /* "rocksdb.pyx":197
  *             while it.Valid():
- *                 key = (<bytes>it.key().data())[:it.key().size()]
- *                 value = (<bytes>it.value().data())[:it.value().size()]             # <<<<<<<<<<<<<<
+ *                 results.append((<bytes>it.value().data())[:it.value().size()])
+ *                 it.Next()             # <<<<<<<<<<<<<<
+ *         finally:
+ *             del it
+ */
+      __pyx_v_it->Next();
+    }
+  }
+
+  /* "rocksdb.pyx":199
+ *                 it.Next()
+ *         finally:
+ *             del it             # <<<<<<<<<<<<<<
+ *         return results
+ * 
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      delete __pyx_v_it;
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10) < 0)) __Pyx_ErrFetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __pyx_t_5 = __pyx_lineno; __pyx_t_6 = __pyx_clineno; __pyx_t_7 = __pyx_filename;
+      {
+        delete __pyx_v_it;
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+      }
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_ErrRestore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0;
+      __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_6; __pyx_filename = __pyx_t_7;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
+
+  /* "rocksdb.pyx":200
+ *         finally:
+ *             del it
+ *         return results             # <<<<<<<<<<<<<<
+ * 
+ *     def find_many_raw(self, object kwargs):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
+
+  /* "rocksdb.pyx":190
+ *         return self.db.get(key)
+ * 
+ *     def find_all_raw(self):             # <<<<<<<<<<<<<<
+ *         cdef list results = []
+ *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rocksdb.Collection.find_all_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_results);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rocksdb.pyx":202
+ *         return results
+ * 
+ *     def find_many_raw(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the stored bytes of the documents matching `kwargs`. String filters
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7rocksdb_10Collection_23find_many_raw(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_7rocksdb_10Collection_22find_many_raw, "\n        Returns the stored bytes of the documents matching `kwargs`. String filters\n        are first looked up as serialized `\"key\":\"value\"` fragments so most\n        non-matching documents are skipped without being decoded. Other values are\n        left to the decoded comparison, which also matches missing keys to `None`\n        and `1` to `True`, like `find_many` always did.\n        ");
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_23find_many_raw = {"find_many_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_23find_many_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7rocksdb_10Collection_22find_many_raw};
+static PyObject *__pyx_pw_7rocksdb_10Collection_23find_many_raw(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_kwargs = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_many_raw (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_kwargs,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_kwargs)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "find_many_raw") < 0)) __PYX_ERR(0, 202, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_kwargs = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_many_raw", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 202, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("rocksdb.Collection.find_many_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_22find_many_raw(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self), __pyx_v_kwargs);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static PyObject *__pyx_gb_7rocksdb_10Collection_13find_many_raw_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
+
+/* "rocksdb.pyx":222
+ *                 value = (<bytes>it.value().data())[:it.value().size()]
+ *                 it.Next()
+ *                 if not all(needle in value for needle in needles):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 value_dict = orjson.loads(value)  # Parse bytes to dict
+ */
+
+static PyObject *__pyx_pf_7rocksdb_10Collection_13find_many_raw_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0) {
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr(__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 222, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *) __pyx_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __pyx_cur_scope->__pyx_genexpr_arg_0 = __pyx_genexpr_arg_0;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7rocksdb_10Collection_13find_many_raw_2generator1, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_find_many_raw_locals_genexpr, __pyx_n_s_rocksdb); if (unlikely(!gen)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
+  }
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("rocksdb.Collection.find_many_raw.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_gb_7rocksdb_10Collection_13find_many_raw_2generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 222, __pyx_L1_error)
+  if (unlikely(!__pyx_cur_scope->__pyx_genexpr_arg_0)) { __Pyx_RaiseUnboundLocalError(".0"); __PYX_ERR(0, 222, __pyx_L1_error) }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_genexpr_arg_0; __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = 0;
+  for (;;) {
+    {
+      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+      #if !CYTHON_ASSUME_SAFE_MACROS
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 222, __pyx_L1_error)
+      #endif
+      if (__pyx_t_2 >= __pyx_temp) break;
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 222, __pyx_L1_error)
+    #else
+    __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_needle);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_needle, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_value)) { __Pyx_RaiseClosureNameError("value"); __PYX_ERR(0, 222, __pyx_L1_error) }
+    __pyx_t_4 = (__Pyx_PySequence_ContainsTF(__pyx_cur_scope->__pyx_v_needle, __pyx_cur_scope->__pyx_outer_scope->__pyx_v_value, Py_EQ)); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_t_5 = (!__pyx_t_4);
+    if (__pyx_t_5) {
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(Py_False);
+      __pyx_r = Py_False;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_True);
+    __pyx_r = Py_True;
+    goto __pyx_L0;
+  }
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_Generator_Replace_StopIteration(0);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static PyObject *__pyx_gb_7rocksdb_10Collection_13find_many_raw_5generator2(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
+
+/* "rocksdb.pyx":225
+ *                     continue
+ *                 value_dict = orjson.loads(value)  # Parse bytes to dict
+ *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):             # <<<<<<<<<<<<<<
+ *                     results.append(value)
+ *         finally:
+ */
+
+static PyObject *__pyx_pf_7rocksdb_10Collection_13find_many_raw_3genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0) {
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *)__pyx_tp_new_7rocksdb___pyx_scope_struct_3_genexpr(__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 225, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *) __pyx_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __pyx_cur_scope->__pyx_genexpr_arg_0 = __pyx_genexpr_arg_0;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_7rocksdb_10Collection_13find_many_raw_5generator2, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_find_many_raw_locals_genexpr, __pyx_n_s_rocksdb); if (unlikely(!gen)) __PYX_ERR(0, 225, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
+  }
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("rocksdb.Collection.find_many_raw.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_gb_7rocksdb_10Collection_13find_many_raw_5generator2(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *__pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_t_2 = 0;
+  if (unlikely(!__pyx_cur_scope->__pyx_genexpr_arg_0)) { __Pyx_RaiseUnboundLocalError(".0"); __PYX_ERR(0, 225, __pyx_L1_error) }
+  if (unlikely(__pyx_cur_scope->__pyx_genexpr_arg_0 == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+    __PYX_ERR(0, 225, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_cur_scope->__pyx_genexpr_arg_0, 0, __pyx_n_s_items, (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_7 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, &__pyx_t_6, NULL, __pyx_t_4);
+    if (unlikely(__pyx_t_7 == 0)) break;
+    if (unlikely(__pyx_t_7 == -1)) __PYX_ERR(0, 225, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_k);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_k, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_v);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_v, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    __pyx_t_6 = 0;
+    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_value_dict)) { __Pyx_RaiseClosureNameError("value_dict"); __PYX_ERR(0, 225, __pyx_L1_error) }
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_value_dict, __pyx_n_s_get); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 225, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = NULL;
+    __pyx_t_7 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __pyx_t_7 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_cur_scope->__pyx_v_k};
+      __pyx_t_6 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 225, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+    __pyx_t_5 = PyObject_RichCompare(__pyx_t_6, __pyx_cur_scope->__pyx_v_v, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 225, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 225, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_10 = (!__pyx_t_9);
+    if (__pyx_t_10) {
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(Py_False);
+      __pyx_r = Py_False;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L0;
+    }
+  }
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_True);
+    __pyx_r = Py_True;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    goto __pyx_L0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_Generator_Replace_StopIteration(0);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rocksdb.pyx":202
+ *         return results
+ * 
+ *     def find_many_raw(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the stored bytes of the documents matching `kwargs`. String filters
+ */
+
+static PyObject *__pyx_pf_7rocksdb_10Collection_22find_many_raw(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, PyObject *__pyx_v_kwargs) {
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *__pyx_cur_scope;
+  PyObject *__pyx_v_results = 0;
+  PyObject *__pyx_v_needles = 0;
+  rocksdb::Iterator *__pyx_v_it;
+  PyObject *__pyx_8genexpr1__pyx_v_k = NULL;
+  PyObject *__pyx_8genexpr1__pyx_v_v = NULL;
+  PyObject *__pyx_gb_7rocksdb_10Collection_13find_many_raw_2generator1 = 0;
+  PyObject *__pyx_gb_7rocksdb_10Collection_13find_many_raw_5generator2 = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  char const *__pyx_t_14;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("find_many_raw", 0);
+  __pyx_cur_scope = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *)__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many_raw(__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 202, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+  }
+
+  /* "rocksdb.pyx":210
+ *         and `1` to `True`, like `find_many` always did.
+ *         """
+ *         cdef list results = []             # <<<<<<<<<<<<<<
+ *         cdef list needles = [
+ *             orjson.dumps({k: v})[1:-1]
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_results = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rocksdb.pyx":211
+ *         """
+ *         cdef list results = []
+ *         cdef list needles = [             # <<<<<<<<<<<<<<
+ *             orjson.dumps({k: v})[1:-1]
+ *             for k, v in kwargs.items()
+ */
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_1);
+
+    /* "rocksdb.pyx":213
+ *         cdef list needles = [
+ *             orjson.dumps({k: v})[1:-1]
+ *             for k, v in kwargs.items()             # <<<<<<<<<<<<<<
+ *             if isinstance(v, str)
+ *         ]
+ */
+    __pyx_t_3 = 0;
+    if (unlikely(__pyx_v_kwargs == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+      __PYX_ERR(0, 213, __pyx_L5_error)
+    }
+    __pyx_t_6 = __Pyx_dict_iterator(__pyx_v_kwargs, 0, __pyx_n_s_items, (&__pyx_t_4), (&__pyx_t_5)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_2);
+    __pyx_t_2 = __pyx_t_6;
+    __pyx_t_6 = 0;
+    while (1) {
+      __pyx_t_8 = __Pyx_dict_iter_next(__pyx_t_2, __pyx_t_4, &__pyx_t_3, &__pyx_t_6, &__pyx_t_7, NULL, __pyx_t_5);
+      if (unlikely(__pyx_t_8 == 0)) break;
+      if (unlikely(__pyx_t_8 == -1)) __PYX_ERR(0, 213, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_k, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_v, __pyx_t_7);
+      __pyx_t_7 = 0;
+
+      /* "rocksdb.pyx":214
+ *             orjson.dumps({k: v})[1:-1]
+ *             for k, v in kwargs.items()
+ *             if isinstance(v, str)             # <<<<<<<<<<<<<<
+ *         ]
+ *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ */
+      __pyx_t_9 = PyString_Check(__pyx_8genexpr1__pyx_v_v); 
+      if (__pyx_t_9) {
+
+        /* "rocksdb.pyx":212
+ *         cdef list results = []
+ *         cdef list needles = [
+ *             orjson.dumps({k: v})[1:-1]             # <<<<<<<<<<<<<<
+ *             for k, v in kwargs.items()
+ *             if isinstance(v, str)
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_orjson); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 212, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_dumps); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 212, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 212, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        if (PyDict_SetItem(__pyx_t_6, __pyx_8genexpr1__pyx_v_k, __pyx_8genexpr1__pyx_v_v) < 0) __PYX_ERR(0, 212, __pyx_L5_error)
+        __pyx_t_11 = NULL;
+        __pyx_t_8 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_10))) {
+          __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_10);
+          if (likely(__pyx_t_11)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+            __Pyx_INCREF(__pyx_t_11);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_10, function);
+            __pyx_t_8 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_11, __pyx_t_6};
+          __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
+          __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 212, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        }
+        __pyx_t_10 = __Pyx_PyObject_GetSlice(__pyx_t_7, 1, -1L, NULL, NULL, &__pyx_slice__2, 1, 1, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 212, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_10))) __PYX_ERR(0, 211, __pyx_L5_error)
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+        /* "rocksdb.pyx":214
+ *             orjson.dumps({k: v})[1:-1]
+ *             for k, v in kwargs.items()
+ *             if isinstance(v, str)             # <<<<<<<<<<<<<<
+ *         ]
+ *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ */
+      }
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_k); __pyx_8genexpr1__pyx_v_k = 0;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_v); __pyx_8genexpr1__pyx_v_v = 0;
+    goto __pyx_L9_exit_scope;
+    __pyx_L5_error:;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_k); __pyx_8genexpr1__pyx_v_k = 0;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_v); __pyx_8genexpr1__pyx_v_v = 0;
+    goto __pyx_L1_error;
+    __pyx_L9_exit_scope:;
+  } /* exit inner scope */
+  __pyx_v_needles = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rocksdb.pyx":216
+ *             if isinstance(v, str)
+ *         ]
+ *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)             # <<<<<<<<<<<<<<
+ *         try:
+ *             it.SeekToFirst()
+ */
+  __pyx_v_it = __pyx_v_self->db->db->NewIterator(__pyx_v_self->db->read_options);
+
+  /* "rocksdb.pyx":217
+ *         ]
+ *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ *         try:             # <<<<<<<<<<<<<<
+ *             it.SeekToFirst()
+ *             while it.Valid():
+ */
+  /*try:*/ {
+
+    /* "rocksdb.pyx":218
+ *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ *         try:
+ *             it.SeekToFirst()             # <<<<<<<<<<<<<<
+ *             while it.Valid():
+ *                 value = (<bytes>it.value().data())[:it.value().size()]
+ */
+    __pyx_v_it->SeekToFirst();
+
+    /* "rocksdb.pyx":219
+ *         try:
+ *             it.SeekToFirst()
+ *             while it.Valid():             # <<<<<<<<<<<<<<
+ *                 value = (<bytes>it.value().data())[:it.value().size()]
+ *                 it.Next()
+ */
+    while (1) {
+      __pyx_t_9 = (__pyx_v_it->Valid() != 0);
+      if (!__pyx_t_9) break;
+
+      /* "rocksdb.pyx":220
+ *             it.SeekToFirst()
+ *             while it.Valid():
+ *                 value = (<bytes>it.value().data())[:it.value().size()]             # <<<<<<<<<<<<<<
+ *                 it.Next()
+ *                 if not all(needle in value for needle in needles):
+ */
+      __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L11_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (unlikely(__pyx_t_1 == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 220, __pyx_L11_error)
+      }
+      __pyx_t_2 = PySequence_GetSlice(((PyObject*)__pyx_t_1), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 220, __pyx_L11_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_value);
+      __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_value, ((PyObject*)__pyx_t_2));
+      __Pyx_GIVEREF(__pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "rocksdb.pyx":221
+ *             while it.Valid():
+ *                 value = (<bytes>it.value().data())[:it.value().size()]
+ *                 it.Next()             # <<<<<<<<<<<<<<
+ *                 if not all(needle in value for needle in needles):
+ *                     continue
+ */
+      __pyx_v_it->Next();
+
+      /* "rocksdb.pyx":222
+ *                 value = (<bytes>it.value().data())[:it.value().size()]
+ *                 it.Next()
+ *                 if not all(needle in value for needle in needles):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 value_dict = orjson.loads(value)  # Parse bytes to dict
+ */
+      __pyx_t_2 = __pyx_pf_7rocksdb_10Collection_13find_many_raw_genexpr(((PyObject*)__pyx_cur_scope), __pyx_v_needles); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L11_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_1 = __Pyx_Generator_Next(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 222, __pyx_L11_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 222, __pyx_L11_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = (!__pyx_t_9);
+      if (__pyx_t_12) {
+
+        /* "rocksdb.pyx":223
+ *                 it.Next()
+ *                 if not all(needle in value for needle in needles):
+ *                     continue             # <<<<<<<<<<<<<<
  *                 value_dict = orjson.loads(value)  # Parse bytes to dict
  *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):
  */
-      __pyx_t_3 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 191, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      if (unlikely(__pyx_t_3 == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 191, __pyx_L4_error)
-      }
-      __pyx_t_1 = PySequence_GetSlice(((PyObject*)__pyx_t_3), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_value, ((PyObject*)__pyx_t_1));
-      __pyx_t_1 = 0;
+        goto __pyx_L13_continue;
 
-      /* "rocksdb.pyx":192
- *                 key = (<bytes>it.key().data())[:it.key().size()]
+        /* "rocksdb.pyx":222
  *                 value = (<bytes>it.value().data())[:it.value().size()]
+ *                 it.Next()
+ *                 if not all(needle in value for needle in needles):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 value_dict = orjson.loads(value)  # Parse bytes to dict
+ */
+      }
+
+      /* "rocksdb.pyx":224
+ *                 if not all(needle in value for needle in needles):
+ *                     continue
  *                 value_dict = orjson.loads(value)  # Parse bytes to dict             # <<<<<<<<<<<<<<
  *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):
- *                     results.append(value_dict)
+ *                     results.append(value)
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_orjson); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 192, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_loads); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 192, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = NULL;
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L11_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 224, __pyx_L11_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = NULL;
       __pyx_t_5 = 0;
       #if CYTHON_UNPACK_METHODS
-      if (unlikely(PyMethod_Check(__pyx_t_4))) {
-        __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
-        if (likely(__pyx_t_3)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-          __Pyx_INCREF(__pyx_t_3);
+      if (unlikely(PyMethod_Check(__pyx_t_10))) {
+        __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_10);
+        if (likely(__pyx_t_2)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+          __Pyx_INCREF(__pyx_t_2);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_4, function);
+          __Pyx_DECREF_SET(__pyx_t_10, function);
           __pyx_t_5 = 1;
         }
       }
       #endif
       {
-        PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_value};
-        __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L4_error)
+        PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_cur_scope->__pyx_v_value};
+        __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L11_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
       }
       __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_value_dict);
       __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_value_dict, __pyx_t_1);
       __Pyx_GIVEREF(__pyx_t_1);
       __pyx_t_1 = 0;
 
-      /* "rocksdb.pyx":193
- *                 value = (<bytes>it.value().data())[:it.value().size()]
+      /* "rocksdb.pyx":225
+ *                     continue
  *                 value_dict = orjson.loads(value)  # Parse bytes to dict
  *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):             # <<<<<<<<<<<<<<
- *                     results.append(value_dict)
- *                 it.Next()
+ *                     results.append(value)
+ *         finally:
  */
-      __pyx_t_1 = __pyx_pf_7rocksdb_10Collection_9find_many_genexpr(((PyObject*)__pyx_cur_scope), __pyx_v_kwargs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 193, __pyx_L4_error)
+      __pyx_t_1 = __pyx_pf_7rocksdb_10Collection_13find_many_raw_3genexpr(((PyObject*)__pyx_cur_scope), __pyx_v_kwargs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L11_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = __Pyx_Generator_Next(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 193, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_10 = __Pyx_Generator_Next(__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 225, __pyx_L11_error)
+      __Pyx_GOTREF(__pyx_t_10);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 193, __pyx_L4_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (__pyx_t_2) {
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 225, __pyx_L11_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (__pyx_t_12) {
 
-        /* "rocksdb.pyx":194
+        /* "rocksdb.pyx":226
  *                 value_dict = orjson.loads(value)  # Parse bytes to dict
  *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):
- *                     results.append(value_dict)             # <<<<<<<<<<<<<<
- *                 it.Next()
+ *                     results.append(value)             # <<<<<<<<<<<<<<
  *         finally:
+ *             del it
  */
-        __pyx_t_4 = __pyx_cur_scope->__pyx_v_value_dict;
-        __Pyx_INCREF(__pyx_t_4);
-        __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_4); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 194, __pyx_L4_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_10 = __pyx_cur_scope->__pyx_v_value;
+        __Pyx_INCREF(__pyx_t_10);
+        __pyx_t_13 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_10); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 226, __pyx_L11_error)
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
 
-        /* "rocksdb.pyx":193
- *                 value = (<bytes>it.value().data())[:it.value().size()]
+        /* "rocksdb.pyx":225
+ *                     continue
  *                 value_dict = orjson.loads(value)  # Parse bytes to dict
  *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):             # <<<<<<<<<<<<<<
- *                     results.append(value_dict)
- *                 it.Next()
- */
-      }
-
-      /* "rocksdb.pyx":195
- *                 if all(value_dict.get(k) == v for k, v in kwargs.items()):
- *                     results.append(value_dict)
- *                 it.Next()             # <<<<<<<<<<<<<<
+ *                     results.append(value)
  *         finally:
- *             del it
  */
-      __pyx_v_it->Next();
+      }
+      __pyx_L13_continue:;
     }
   }
 
-  /* "rocksdb.pyx":197
- *                 it.Next()
+  /* "rocksdb.pyx":228
+ *                     results.append(value)
  *         finally:
  *             del it             # <<<<<<<<<<<<<<
  *         return results
@@ -7405,46 +8505,49 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7ro
   /*finally:*/ {
     /*normal exit:*/{
       delete __pyx_v_it;
-      goto __pyx_L5;
+      goto __pyx_L12;
     }
-    __pyx_L4_error:;
+    __pyx_L11_error:;
     /*exception exit:*/{
       __Pyx_PyThreadState_declare
       __Pyx_PyThreadState_assign
-      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
-      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11) < 0)) __Pyx_ErrFetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
-      __Pyx_XGOTREF(__pyx_t_9);
-      __Pyx_XGOTREF(__pyx_t_10);
-      __Pyx_XGOTREF(__pyx_t_11);
-      __Pyx_XGOTREF(__pyx_t_12);
-      __Pyx_XGOTREF(__pyx_t_13);
-      __Pyx_XGOTREF(__pyx_t_14);
-      __pyx_t_5 = __pyx_lineno; __pyx_t_7 = __pyx_clineno; __pyx_t_8 = __pyx_filename;
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_18, &__pyx_t_19, &__pyx_t_20);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17) < 0)) __Pyx_ErrFetch(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __Pyx_XGOTREF(__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_18);
+      __Pyx_XGOTREF(__pyx_t_19);
+      __Pyx_XGOTREF(__pyx_t_20);
+      __pyx_t_5 = __pyx_lineno; __pyx_t_8 = __pyx_clineno; __pyx_t_14 = __pyx_filename;
       {
         delete __pyx_v_it;
       }
       if (PY_MAJOR_VERSION >= 3) {
-        __Pyx_XGIVEREF(__pyx_t_12);
-        __Pyx_XGIVEREF(__pyx_t_13);
-        __Pyx_XGIVEREF(__pyx_t_14);
-        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_18);
+        __Pyx_XGIVEREF(__pyx_t_19);
+        __Pyx_XGIVEREF(__pyx_t_20);
+        __Pyx_ExceptionReset(__pyx_t_18, __pyx_t_19, __pyx_t_20);
       }
-      __Pyx_XGIVEREF(__pyx_t_9);
-      __Pyx_XGIVEREF(__pyx_t_10);
-      __Pyx_XGIVEREF(__pyx_t_11);
-      __Pyx_ErrRestore(__pyx_t_9, __pyx_t_10, __pyx_t_11);
-      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
-      __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_7; __pyx_filename = __pyx_t_8;
+      __Pyx_XGIVEREF(__pyx_t_15);
+      __Pyx_XGIVEREF(__pyx_t_16);
+      __Pyx_XGIVEREF(__pyx_t_17);
+      __Pyx_ErrRestore(__pyx_t_15, __pyx_t_16, __pyx_t_17);
+      __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
+      __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_8; __pyx_filename = __pyx_t_14;
       goto __pyx_L1_error;
     }
-    __pyx_L5:;
+    __pyx_L12:;
   }
 
-  /* "rocksdb.pyx":198
+  /* "rocksdb.pyx":229
  *         finally:
  *             del it
  *         return results             # <<<<<<<<<<<<<<
@@ -7456,33 +8559,38 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7ro
   __pyx_r = __pyx_v_results;
   goto __pyx_L0;
 
-  /* "rocksdb.pyx":184
+  /* "rocksdb.pyx":202
  *         return results
  * 
- *     def find_many(self, object kwargs):             # <<<<<<<<<<<<<<
- *         cdef list results = []
- *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+ *     def find_many_raw(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the stored bytes of the documents matching `kwargs`. String filters
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("rocksdb.Collection.find_many", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("rocksdb.Collection.find_many_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_results);
-  __Pyx_XDECREF(__pyx_v_key);
-  __Pyx_XDECREF(__pyx_v_value);
-  __Pyx_XDECREF(__pyx_gb_7rocksdb_10Collection_9find_many_2generator1);
+  __Pyx_XDECREF(__pyx_v_needles);
+  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_k);
+  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_v);
+  __Pyx_XDECREF(__pyx_gb_7rocksdb_10Collection_13find_many_raw_2generator1);
+  __Pyx_XDECREF(__pyx_gb_7rocksdb_10Collection_13find_many_raw_5generator2);
   __Pyx_DECREF((PyObject *)__pyx_cur_scope);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "rocksdb.pyx":200
+/* "rocksdb.pyx":231
  *         return results
  * 
  *     def count(self):             # <<<<<<<<<<<<<<
@@ -7491,15 +8599,15 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_16find_many(struct __pyx_obj_7ro
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7rocksdb_10Collection_19count(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_7rocksdb_10Collection_25count(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_7rocksdb_10Collection_19count = {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_19count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_7rocksdb_10Collection_19count(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_25count = {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_25count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7rocksdb_10Collection_25count(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7524,14 +8632,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("count", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "count", 0))) return NULL;
-  __pyx_r = __pyx_pf_7rocksdb_10Collection_18count(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_24count(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
+static PyObject *__pyx_pf_7rocksdb_10Collection_24count(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
   int __pyx_v_count;
   rocksdb::Iterator *__pyx_v_it;
   PyObject *__pyx_r = NULL;
@@ -7543,7 +8651,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("count", 1);
 
-  /* "rocksdb.pyx":201
+  /* "rocksdb.pyx":232
  * 
  *     def count(self):
  *         cdef int count = 0             # <<<<<<<<<<<<<<
@@ -7552,7 +8660,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
  */
   __pyx_v_count = 0;
 
-  /* "rocksdb.pyx":202
+  /* "rocksdb.pyx":233
  *     def count(self):
  *         cdef int count = 0
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)             # <<<<<<<<<<<<<<
@@ -7561,7 +8669,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
  */
   __pyx_v_it = __pyx_v_self->db->db->NewIterator(__pyx_v_self->db->read_options);
 
-  /* "rocksdb.pyx":203
+  /* "rocksdb.pyx":234
  *         cdef int count = 0
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:             # <<<<<<<<<<<<<<
@@ -7570,7 +8678,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
  */
   /*try:*/ {
 
-    /* "rocksdb.pyx":204
+    /* "rocksdb.pyx":235
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  *             it.SeekToFirst()             # <<<<<<<<<<<<<<
@@ -7579,7 +8687,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
  */
     __pyx_v_it->SeekToFirst();
 
-    /* "rocksdb.pyx":205
+    /* "rocksdb.pyx":236
  *         try:
  *             it.SeekToFirst()
  *             while it.Valid():             # <<<<<<<<<<<<<<
@@ -7590,7 +8698,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
       __pyx_t_1 = (__pyx_v_it->Valid() != 0);
       if (!__pyx_t_1) break;
 
-      /* "rocksdb.pyx":206
+      /* "rocksdb.pyx":237
  *             it.SeekToFirst()
  *             while it.Valid():
  *                 count += 1             # <<<<<<<<<<<<<<
@@ -7599,7 +8707,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
  */
       __pyx_v_count = (__pyx_v_count + 1);
 
-      /* "rocksdb.pyx":207
+      /* "rocksdb.pyx":238
  *             while it.Valid():
  *                 count += 1
  *                 it.Next()             # <<<<<<<<<<<<<<
@@ -7610,7 +8718,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
     }
   }
 
-  /* "rocksdb.pyx":209
+  /* "rocksdb.pyx":240
  *                 it.Next()
  *         finally:
  *             del it             # <<<<<<<<<<<<<<
@@ -7625,7 +8733,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
     __pyx_L5:;
   }
 
-  /* "rocksdb.pyx":210
+  /* "rocksdb.pyx":241
  *         finally:
  *             del it
  *         return count             # <<<<<<<<<<<<<<
@@ -7633,13 +8741,13 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
  *     def find_first(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_count); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_count); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 241, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "rocksdb.pyx":200
+  /* "rocksdb.pyx":231
  *         return results
  * 
  *     def count(self):             # <<<<<<<<<<<<<<
@@ -7658,7 +8766,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
   return __pyx_r;
 }
 
-/* "rocksdb.pyx":212
+/* "rocksdb.pyx":243
  *         return count
  * 
  *     def find_first(self):             # <<<<<<<<<<<<<<
@@ -7667,15 +8775,15 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_18count(struct __pyx_obj_7rocksd
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7rocksdb_10Collection_21find_first(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_7rocksdb_10Collection_27find_first(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_7rocksdb_10Collection_21find_first = {"find_first", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_21find_first, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_7rocksdb_10Collection_21find_first(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_27find_first = {"find_first", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_27find_first, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7rocksdb_10Collection_27find_first(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7700,14 +8808,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("find_first", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "find_first", 0))) return NULL;
-  __pyx_r = __pyx_pf_7rocksdb_10Collection_20find_first(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_26find_first(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
+static PyObject *__pyx_pf_7rocksdb_10Collection_26find_first(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
   rocksdb::Iterator *__pyx_v_it;
   PyObject *__pyx_v_value = NULL;
   PyObject *__pyx_r = NULL;
@@ -7730,7 +8838,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("find_first", 1);
 
-  /* "rocksdb.pyx":213
+  /* "rocksdb.pyx":244
  * 
  *     def find_first(self):
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)             # <<<<<<<<<<<<<<
@@ -7739,7 +8847,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
  */
   __pyx_v_it = __pyx_v_self->db->db->NewIterator(__pyx_v_self->db->read_options);
 
-  /* "rocksdb.pyx":214
+  /* "rocksdb.pyx":245
  *     def find_first(self):
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:             # <<<<<<<<<<<<<<
@@ -7748,7 +8856,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
  */
   /*try:*/ {
 
-    /* "rocksdb.pyx":215
+    /* "rocksdb.pyx":246
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  *             it.SeekToFirst()             # <<<<<<<<<<<<<<
@@ -7757,7 +8865,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
  */
     __pyx_v_it->SeekToFirst();
 
-    /* "rocksdb.pyx":216
+    /* "rocksdb.pyx":247
  *         try:
  *             it.SeekToFirst()
  *             if it.Valid():             # <<<<<<<<<<<<<<
@@ -7767,26 +8875,26 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
     __pyx_t_1 = (__pyx_v_it->Valid() != 0);
     if (__pyx_t_1) {
 
-      /* "rocksdb.pyx":217
+      /* "rocksdb.pyx":248
  *             it.SeekToFirst()
  *             if it.Valid():
  *                 value = (<bytes>it.value().data())[:it.value().size()]             # <<<<<<<<<<<<<<
  *                 return orjson.loads(value)
  *         finally:
  */
-      __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L4_error)
+      __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_2);
       if (unlikely(__pyx_t_2 == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 217, __pyx_L4_error)
+        __PYX_ERR(0, 248, __pyx_L4_error)
       }
-      __pyx_t_3 = PySequence_GetSlice(((PyObject*)__pyx_t_2), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 217, __pyx_L4_error)
+      __pyx_t_3 = PySequence_GetSlice(((PyObject*)__pyx_t_2), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 248, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_v_value = ((PyObject*)__pyx_t_3);
       __pyx_t_3 = 0;
 
-      /* "rocksdb.pyx":218
+      /* "rocksdb.pyx":249
  *             if it.Valid():
  *                 value = (<bytes>it.value().data())[:it.value().size()]
  *                 return orjson.loads(value)             # <<<<<<<<<<<<<<
@@ -7794,9 +8902,9 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
  *             del it
  */
       __Pyx_XDECREF(__pyx_r);
-      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 218, __pyx_L4_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 218, __pyx_L4_error)
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 249, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_t_2 = NULL;
@@ -7817,7 +8925,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
         PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_value};
         __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
         __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 218, __pyx_L4_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 249, __pyx_L4_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       }
@@ -7825,7 +8933,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
       __pyx_t_3 = 0;
       goto __pyx_L3_return;
 
-      /* "rocksdb.pyx":216
+      /* "rocksdb.pyx":247
  *         try:
  *             it.SeekToFirst()
  *             if it.Valid():             # <<<<<<<<<<<<<<
@@ -7835,7 +8943,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
     }
   }
 
-  /* "rocksdb.pyx":220
+  /* "rocksdb.pyx":251
  *                 return orjson.loads(value)
  *         finally:
  *             del it             # <<<<<<<<<<<<<<
@@ -7892,7 +9000,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
     __pyx_L5:;
   }
 
-  /* "rocksdb.pyx":221
+  /* "rocksdb.pyx":252
  *         finally:
  *             del it
  *         return None             # <<<<<<<<<<<<<<
@@ -7903,7 +9011,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
 
-  /* "rocksdb.pyx":212
+  /* "rocksdb.pyx":243
  *         return count
  * 
  *     def find_first(self):             # <<<<<<<<<<<<<<
@@ -7925,7 +9033,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
   return __pyx_r;
 }
 
-/* "rocksdb.pyx":223
+/* "rocksdb.pyx":254
  *         return None
  * 
  *     def find_last(self):             # <<<<<<<<<<<<<<
@@ -7934,15 +9042,15 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_20find_first(struct __pyx_obj_7r
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7rocksdb_10Collection_23find_last(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_7rocksdb_10Collection_29find_last(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_7rocksdb_10Collection_23find_last = {"find_last", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_23find_last, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_7rocksdb_10Collection_23find_last(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_29find_last = {"find_last", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_29find_last, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7rocksdb_10Collection_29find_last(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7967,14 +9075,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("find_last", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "find_last", 0))) return NULL;
-  __pyx_r = __pyx_pf_7rocksdb_10Collection_22find_last(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_28find_last(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
+static PyObject *__pyx_pf_7rocksdb_10Collection_28find_last(struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
   rocksdb::Iterator *__pyx_v_it;
   PyObject *__pyx_v_value = NULL;
   PyObject *__pyx_r = NULL;
@@ -7997,7 +9105,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("find_last", 1);
 
-  /* "rocksdb.pyx":224
+  /* "rocksdb.pyx":255
  * 
  *     def find_last(self):
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)             # <<<<<<<<<<<<<<
@@ -8006,7 +9114,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
  */
   __pyx_v_it = __pyx_v_self->db->db->NewIterator(__pyx_v_self->db->read_options);
 
-  /* "rocksdb.pyx":225
+  /* "rocksdb.pyx":256
  *     def find_last(self):
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:             # <<<<<<<<<<<<<<
@@ -8015,7 +9123,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
  */
   /*try:*/ {
 
-    /* "rocksdb.pyx":226
+    /* "rocksdb.pyx":257
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  *             it.SeekToFirst()             # <<<<<<<<<<<<<<
@@ -8024,7 +9132,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
  */
     __pyx_v_it->SeekToFirst();
 
-    /* "rocksdb.pyx":227
+    /* "rocksdb.pyx":258
  *         try:
  *             it.SeekToFirst()
  *             while it.Valid():             # <<<<<<<<<<<<<<
@@ -8035,26 +9143,26 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
       __pyx_t_1 = (__pyx_v_it->Valid() != 0);
       if (!__pyx_t_1) break;
 
-      /* "rocksdb.pyx":228
+      /* "rocksdb.pyx":259
  *             it.SeekToFirst()
  *             while it.Valid():
  *                 value = (<bytes>it.value().data())[:it.value().size()]             # <<<<<<<<<<<<<<
  *                 it.Next()
  *                 return orjson.loads(value)
  */
-      __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L4_error)
+      __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_2);
       if (unlikely(__pyx_t_2 == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 228, __pyx_L4_error)
+        __PYX_ERR(0, 259, __pyx_L4_error)
       }
-      __pyx_t_3 = PySequence_GetSlice(((PyObject*)__pyx_t_2), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 228, __pyx_L4_error)
+      __pyx_t_3 = PySequence_GetSlice(((PyObject*)__pyx_t_2), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_v_value = ((PyObject*)__pyx_t_3);
       __pyx_t_3 = 0;
 
-      /* "rocksdb.pyx":229
+      /* "rocksdb.pyx":260
  *             while it.Valid():
  *                 value = (<bytes>it.value().data())[:it.value().size()]
  *                 it.Next()             # <<<<<<<<<<<<<<
@@ -8063,7 +9171,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
  */
       __pyx_v_it->Next();
 
-      /* "rocksdb.pyx":230
+      /* "rocksdb.pyx":261
  *                 value = (<bytes>it.value().data())[:it.value().size()]
  *                 it.Next()
  *                 return orjson.loads(value)             # <<<<<<<<<<<<<<
@@ -8071,9 +9179,9 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
  *             del it
  */
       __Pyx_XDECREF(__pyx_r);
-      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L4_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 261, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 230, __pyx_L4_error)
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 261, __pyx_L4_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_t_2 = NULL;
@@ -8094,7 +9202,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
         PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_value};
         __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
         __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 230, __pyx_L4_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L4_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       }
@@ -8104,7 +9212,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
     }
   }
 
-  /* "rocksdb.pyx":232
+  /* "rocksdb.pyx":263
  *                 return orjson.loads(value)
  *         finally:
  *             del it             # <<<<<<<<<<<<<<
@@ -8160,7 +9268,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
     __pyx_L5:;
   }
 
-  /* "rocksdb.pyx":233
+  /* "rocksdb.pyx":264
  *         finally:
  *             del it
  *         return None             # <<<<<<<<<<<<<<
@@ -8169,7 +9277,7 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
 
-  /* "rocksdb.pyx":223
+  /* "rocksdb.pyx":254
  *         return None
  * 
  *     def find_last(self):             # <<<<<<<<<<<<<<
@@ -8198,15 +9306,15 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_22find_last(struct __pyx_obj_7ro
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7rocksdb_10Collection_25__reduce_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_7rocksdb_10Collection_31__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_7rocksdb_10Collection_25__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_25__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_7rocksdb_10Collection_25__reduce_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_31__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_31__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7rocksdb_10Collection_31__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -8231,14 +9339,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
-  __pyx_r = __pyx_pf_7rocksdb_10Collection_24__reduce_cython__(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_30__reduce_cython__(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7rocksdb_10Collection_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
+static PyObject *__pyx_pf_7rocksdb_10Collection_30__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -8278,15 +9386,15 @@ static PyObject *__pyx_pf_7rocksdb_10Collection_24__reduce_cython__(CYTHON_UNUSE
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7rocksdb_10Collection_27__setstate_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_7rocksdb_10Collection_33__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_7rocksdb_10Collection_27__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_27__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_7rocksdb_10Collection_27__setstate_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_7rocksdb_10Collection_33__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_33__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7rocksdb_10Collection_33__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -8360,7 +9468,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7rocksdb_10Collection_26__setstate_cython__(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self), __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_7rocksdb_10Collection_32__setstate_cython__(((struct __pyx_obj_7rocksdb_Collection *)__pyx_v_self), __pyx_v___pyx_state);
 
   /* function exit code */
   {
@@ -8373,7 +9481,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7rocksdb_10Collection_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_7rocksdb_10Collection_32__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7rocksdb_Collection *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -8648,11 +9756,14 @@ static PyMethodDef __pyx_methods_7rocksdb_Collection[] = {
   {"find_one", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_13find_one, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {"find_all", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_15find_all, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {"find_many", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_17find_many, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_19count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"find_first", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_21find_first, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"find_last", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_23find_last, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_25__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_27__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"get_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_19get_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"find_all_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_21find_all_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"find_many_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_23find_many_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_7rocksdb_10Collection_22find_many_raw},
+  {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_25count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"find_first", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_27find_first, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"find_last", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_29find_last, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_31__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_7rocksdb_10Collection_33__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {0, 0, 0, 0}
 };
 #if CYTHON_USE_TYPE_SPECS
@@ -8668,17 +9779,180 @@ static PyType_Spec __pyx_type_7rocksdb_Collection_spec = {
   "rocksdb.Collection",
   sizeof(struct __pyx_obj_7rocksdb_Collection),
   0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
-  __pyx_type_7rocksdb_Collection_slots,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_7rocksdb_Collection_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_7rocksdb_Collection = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "rocksdb.""Collection", /*tp_name*/
+  sizeof(struct __pyx_obj_7rocksdb_Collection), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7rocksdb_Collection, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_7rocksdb_Collection, /*tp_traverse*/
+  __pyx_tp_clear_7rocksdb_Collection, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7rocksdb_Collection, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7rocksdb_Collection, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+#if CYTHON_USE_FREELISTS
+static struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *__pyx_freelist_7rocksdb___pyx_scope_struct____iter__[8];
+static int __pyx_freecount_7rocksdb___pyx_scope_struct____iter__ = 0;
+#endif
+
+static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct____iter__(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  #if CYTHON_USE_FREELISTS
+  if (likely((int)(__pyx_freecount_7rocksdb___pyx_scope_struct____iter__ > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__)))) {
+    o = (PyObject*)__pyx_freelist_7rocksdb___pyx_scope_struct____iter__[--__pyx_freecount_7rocksdb___pyx_scope_struct____iter__];
+    memset(o, 0, sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else
+  #endif
+  {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  #endif
+  return o;
+}
+
+static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__(PyObject *o) {
+  struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->__pyx_v_key);
+  Py_CLEAR(p->__pyx_v_self);
+  Py_CLEAR(p->__pyx_v_value);
+  #if CYTHON_USE_FREELISTS
+  if (((int)(__pyx_freecount_7rocksdb___pyx_scope_struct____iter__ < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__)))) {
+    __pyx_freelist_7rocksdb___pyx_scope_struct____iter__[__pyx_freecount_7rocksdb___pyx_scope_struct____iter__++] = ((struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *)o);
+  } else
+  #endif
+  {
+    #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+    (*Py_TYPE(o)->tp_free)(o);
+    #else
+    {
+      freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+      if (tp_free) tp_free(o);
+    }
+    #endif
+  }
+}
+
+static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct____iter__(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *)o;
+  if (p->__pyx_v_self) {
+    e = (*v)(((PyObject *)p->__pyx_v_self), a); if (e) return e;
+  }
+  return 0;
+}
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_7rocksdb___pyx_scope_struct____iter___slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_7rocksdb___pyx_scope_struct____iter__},
+  {Py_tp_new, (void *)__pyx_tp_new_7rocksdb___pyx_scope_struct____iter__},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_7rocksdb___pyx_scope_struct____iter___spec = {
+  "rocksdb.__pyx_scope_struct____iter__",
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
+  __pyx_type_7rocksdb___pyx_scope_struct____iter___slots,
 };
 #else
 
-static PyTypeObject __pyx_type_7rocksdb_Collection = {
+static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct____iter__ = {
   PyVarObject_HEAD_INIT(0, 0)
-  "rocksdb.""Collection", /*tp_name*/
-  sizeof(struct __pyx_obj_7rocksdb_Collection), /*tp_basicsize*/
+  "rocksdb.""__pyx_scope_struct____iter__", /*tp_name*/
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7rocksdb_Collection, /*tp_dealloc*/
+  __pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -8703,15 +9977,15 @@ static PyTypeObject __pyx_type_7rocksdb_Collection = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7rocksdb_Collection, /*tp_traverse*/
-  __pyx_tp_clear_7rocksdb_Collection, /*tp_clear*/
+  __pyx_tp_traverse_7rocksdb___pyx_scope_struct____iter__, /*tp_traverse*/
+  0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_7rocksdb_Collection, /*tp_methods*/
+  0, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -8723,7 +9997,7 @@ static PyTypeObject __pyx_type_7rocksdb_Collection = {
   #endif
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7rocksdb_Collection, /*tp_new*/
+  __pyx_tp_new_7rocksdb___pyx_scope_struct____iter__, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -8756,20 +10030,20 @@ static PyTypeObject __pyx_type_7rocksdb_Collection = {
 #endif
 
 #if CYTHON_USE_FREELISTS
-static struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *__pyx_freelist_7rocksdb___pyx_scope_struct____iter__[8];
-static int __pyx_freecount_7rocksdb___pyx_scope_struct____iter__ = 0;
+static struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *__pyx_freelist_7rocksdb___pyx_scope_struct_1_find_many_raw[8];
+static int __pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many_raw = 0;
 #endif
 
-static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct____iter__(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many_raw(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
   #if CYTHON_COMPILING_IN_LIMITED_API
   allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
   o = alloc_func(t, 0);
   #else
   #if CYTHON_USE_FREELISTS
-  if (likely((int)(__pyx_freecount_7rocksdb___pyx_scope_struct____iter__ > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__)))) {
-    o = (PyObject*)__pyx_freelist_7rocksdb___pyx_scope_struct____iter__[--__pyx_freecount_7rocksdb___pyx_scope_struct____iter__];
-    memset(o, 0, sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__));
+  if (likely((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many_raw > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw)))) {
+    o = (PyObject*)__pyx_freelist_7rocksdb___pyx_scope_struct_1_find_many_raw[--__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many_raw];
+    memset(o, 0, sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw));
     (void) PyObject_INIT(o, t);
     PyObject_GC_Track(o);
   } else
@@ -8782,22 +10056,21 @@ static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct____iter__(PyTypeObject
   return o;
 }
 
-static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__(PyObject *o) {
-  struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *)o;
+static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many_raw(PyObject *o) {
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *)o;
   #if CYTHON_USE_TP_FINALIZE
   if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
-    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many_raw) {
       if (PyObject_CallFinalizerFromDealloc(o)) return;
     }
   }
   #endif
   PyObject_GC_UnTrack(o);
-  Py_CLEAR(p->__pyx_v_key);
-  Py_CLEAR(p->__pyx_v_self);
   Py_CLEAR(p->__pyx_v_value);
+  Py_CLEAR(p->__pyx_v_value_dict);
   #if CYTHON_USE_FREELISTS
-  if (((int)(__pyx_freecount_7rocksdb___pyx_scope_struct____iter__ < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__)))) {
-    __pyx_freelist_7rocksdb___pyx_scope_struct____iter__[__pyx_freecount_7rocksdb___pyx_scope_struct____iter__++] = ((struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *)o);
+  if (((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many_raw < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw)))) {
+    __pyx_freelist_7rocksdb___pyx_scope_struct_1_find_many_raw[__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many_raw++] = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *)o);
   } else
   #endif
   {
@@ -8812,36 +10085,46 @@ static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__(PyObject *o)
   }
 }
 
-static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct____iter__(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct_1_find_many_raw(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__ *)o;
-  if (p->__pyx_v_self) {
-    e = (*v)(((PyObject *)p->__pyx_v_self), a); if (e) return e;
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *)o;
+  if (p->__pyx_v_value_dict) {
+    e = (*v)(p->__pyx_v_value_dict, a); if (e) return e;
   }
   return 0;
 }
+
+static int __pyx_tp_clear_7rocksdb___pyx_scope_struct_1_find_many_raw(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw *)o;
+  tmp = ((PyObject*)p->__pyx_v_value_dict);
+  p->__pyx_v_value_dict = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot __pyx_type_7rocksdb___pyx_scope_struct____iter___slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_7rocksdb___pyx_scope_struct____iter__},
-  {Py_tp_new, (void *)__pyx_tp_new_7rocksdb___pyx_scope_struct____iter__},
+static PyType_Slot __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many_raw},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_7rocksdb___pyx_scope_struct_1_find_many_raw},
+  {Py_tp_clear, (void *)__pyx_tp_clear_7rocksdb___pyx_scope_struct_1_find_many_raw},
+  {Py_tp_new, (void *)__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many_raw},
   {0, 0},
 };
-static PyType_Spec __pyx_type_7rocksdb___pyx_scope_struct____iter___spec = {
-  "rocksdb.__pyx_scope_struct____iter__",
-  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__),
+static PyType_Spec __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw_spec = {
+  "rocksdb.__pyx_scope_struct_1_find_many_raw",
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw),
   0,
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
-  __pyx_type_7rocksdb___pyx_scope_struct____iter___slots,
+  __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw_slots,
 };
 #else
 
-static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct____iter__ = {
+static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw = {
   PyVarObject_HEAD_INIT(0, 0)
-  "rocksdb.""__pyx_scope_struct____iter__", /*tp_name*/
-  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct____iter__), /*tp_basicsize*/
+  "rocksdb.""__pyx_scope_struct_1_find_many_raw", /*tp_name*/
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many_raw), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7rocksdb___pyx_scope_struct____iter__, /*tp_dealloc*/
+  __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many_raw, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -8868,8 +10151,8 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct____iter__ = {
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7rocksdb___pyx_scope_struct____iter__, /*tp_traverse*/
-  0, /*tp_clear*/
+  __pyx_tp_traverse_7rocksdb___pyx_scope_struct_1_find_many_raw, /*tp_traverse*/
+  __pyx_tp_clear_7rocksdb___pyx_scope_struct_1_find_many_raw, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
@@ -8886,7 +10169,7 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct____iter__ = {
   #endif
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7rocksdb___pyx_scope_struct____iter__, /*tp_new*/
+  __pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many_raw, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -8919,20 +10202,20 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct____iter__ = {
 #endif
 
 #if CYTHON_USE_FREELISTS
-static struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *__pyx_freelist_7rocksdb___pyx_scope_struct_1_find_many[8];
-static int __pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many = 0;
+static struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *__pyx_freelist_7rocksdb___pyx_scope_struct_2_genexpr[8];
+static int __pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr = 0;
 #endif
 
-static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
   #if CYTHON_COMPILING_IN_LIMITED_API
   allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
   o = alloc_func(t, 0);
   #else
   #if CYTHON_USE_FREELISTS
-  if (likely((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many)))) {
-    o = (PyObject*)__pyx_freelist_7rocksdb___pyx_scope_struct_1_find_many[--__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many];
-    memset(o, 0, sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many));
+  if (likely((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_7rocksdb___pyx_scope_struct_2_genexpr[--__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr));
     (void) PyObject_INIT(o, t);
     PyObject_GC_Track(o);
   } else
@@ -8945,20 +10228,22 @@ static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many(PyTypeObje
   return o;
 }
 
-static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many(PyObject *o) {
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *)o;
+static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr(PyObject *o) {
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)o;
   #if CYTHON_USE_TP_FINALIZE
   if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
-    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr) {
       if (PyObject_CallFinalizerFromDealloc(o)) return;
     }
   }
   #endif
   PyObject_GC_UnTrack(o);
-  Py_CLEAR(p->__pyx_v_value_dict);
+  Py_CLEAR(p->__pyx_outer_scope);
+  Py_CLEAR(p->__pyx_genexpr_arg_0);
+  Py_CLEAR(p->__pyx_v_needle);
   #if CYTHON_USE_FREELISTS
-  if (((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many)))) {
-    __pyx_freelist_7rocksdb___pyx_scope_struct_1_find_many[__pyx_freecount_7rocksdb___pyx_scope_struct_1_find_many++] = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *)o);
+  if (((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr)))) {
+    __pyx_freelist_7rocksdb___pyx_scope_struct_2_genexpr[__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr++] = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)o);
   } else
   #endif
   {
@@ -8973,46 +10258,42 @@ static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many(PyObject *o
   }
 }
 
-static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct_1_find_many(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct_2_genexpr(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *)o;
-  if (p->__pyx_v_value_dict) {
-    e = (*v)(p->__pyx_v_value_dict, a); if (e) return e;
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)o;
+  if (p->__pyx_outer_scope) {
+    e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
+  }
+  if (p->__pyx_genexpr_arg_0) {
+    e = (*v)(p->__pyx_genexpr_arg_0, a); if (e) return e;
+  }
+  if (p->__pyx_v_needle) {
+    e = (*v)(p->__pyx_v_needle, a); if (e) return e;
   }
-  return 0;
-}
-
-static int __pyx_tp_clear_7rocksdb___pyx_scope_struct_1_find_many(PyObject *o) {
-  PyObject* tmp;
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many *)o;
-  tmp = ((PyObject*)p->__pyx_v_value_dict);
-  p->__pyx_v_value_dict = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
   return 0;
 }
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_7rocksdb___pyx_scope_struct_1_find_many},
-  {Py_tp_clear, (void *)__pyx_tp_clear_7rocksdb___pyx_scope_struct_1_find_many},
-  {Py_tp_new, (void *)__pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many},
+static PyType_Slot __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_7rocksdb___pyx_scope_struct_2_genexpr},
+  {Py_tp_new, (void *)__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr},
   {0, 0},
 };
-static PyType_Spec __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_spec = {
-  "rocksdb.__pyx_scope_struct_1_find_many",
-  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many),
+static PyType_Spec __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_spec = {
+  "rocksdb.__pyx_scope_struct_2_genexpr",
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr),
   0,
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
-  __pyx_type_7rocksdb___pyx_scope_struct_1_find_many_slots,
+  __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_slots,
 };
 #else
 
-static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_1_find_many = {
+static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr = {
   PyVarObject_HEAD_INIT(0, 0)
-  "rocksdb.""__pyx_scope_struct_1_find_many", /*tp_name*/
-  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_1_find_many), /*tp_basicsize*/
+  "rocksdb.""__pyx_scope_struct_2_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_1_find_many, /*tp_dealloc*/
+  __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -9039,8 +10320,8 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_1_find_many = {
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7rocksdb___pyx_scope_struct_1_find_many, /*tp_traverse*/
-  __pyx_tp_clear_7rocksdb___pyx_scope_struct_1_find_many, /*tp_clear*/
+  __pyx_tp_traverse_7rocksdb___pyx_scope_struct_2_genexpr, /*tp_traverse*/
+  0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
@@ -9057,7 +10338,7 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_1_find_many = {
   #endif
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7rocksdb___pyx_scope_struct_1_find_many, /*tp_new*/
+  __pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -9090,20 +10371,20 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_1_find_many = {
 #endif
 
 #if CYTHON_USE_FREELISTS
-static struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *__pyx_freelist_7rocksdb___pyx_scope_struct_2_genexpr[8];
-static int __pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr = 0;
+static struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *__pyx_freelist_7rocksdb___pyx_scope_struct_3_genexpr[8];
+static int __pyx_freecount_7rocksdb___pyx_scope_struct_3_genexpr = 0;
 #endif
 
-static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_3_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   PyObject *o;
   #if CYTHON_COMPILING_IN_LIMITED_API
   allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
   o = alloc_func(t, 0);
   #else
   #if CYTHON_USE_FREELISTS
-  if (likely((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr)))) {
-    o = (PyObject*)__pyx_freelist_7rocksdb___pyx_scope_struct_2_genexpr[--__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr];
-    memset(o, 0, sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr));
+  if (likely((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_3_genexpr > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_7rocksdb___pyx_scope_struct_3_genexpr[--__pyx_freecount_7rocksdb___pyx_scope_struct_3_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr));
     (void) PyObject_INIT(o, t);
     PyObject_GC_Track(o);
   } else
@@ -9116,11 +10397,11 @@ static PyObject *__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr(PyTypeObject
   return o;
 }
 
-static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr(PyObject *o) {
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)o;
+static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_3_genexpr(PyObject *o) {
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *)o;
   #if CYTHON_USE_TP_FINALIZE
   if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
-    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_3_genexpr) {
       if (PyObject_CallFinalizerFromDealloc(o)) return;
     }
   }
@@ -9131,8 +10412,8 @@ static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr(PyObject *o)
   Py_CLEAR(p->__pyx_v_k);
   Py_CLEAR(p->__pyx_v_v);
   #if CYTHON_USE_FREELISTS
-  if (((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr)))) {
-    __pyx_freelist_7rocksdb___pyx_scope_struct_2_genexpr[__pyx_freecount_7rocksdb___pyx_scope_struct_2_genexpr++] = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)o);
+  if (((int)(__pyx_freecount_7rocksdb___pyx_scope_struct_3_genexpr < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr)))) {
+    __pyx_freelist_7rocksdb___pyx_scope_struct_3_genexpr[__pyx_freecount_7rocksdb___pyx_scope_struct_3_genexpr++] = ((struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *)o);
   } else
   #endif
   {
@@ -9147,9 +10428,9 @@ static void __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr(PyObject *o)
   }
 }
 
-static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct_2_genexpr(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct_3_genexpr(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr *)o;
+  struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *p = (struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr *)o;
   if (p->__pyx_outer_scope) {
     e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
   }
@@ -9165,27 +10446,27 @@ static int __pyx_tp_traverse_7rocksdb___pyx_scope_struct_2_genexpr(PyObject *o,
   return 0;
 }
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_7rocksdb___pyx_scope_struct_2_genexpr},
-  {Py_tp_new, (void *)__pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr},
+static PyType_Slot __pyx_type_7rocksdb___pyx_scope_struct_3_genexpr_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_7rocksdb___pyx_scope_struct_3_genexpr},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_7rocksdb___pyx_scope_struct_3_genexpr},
+  {Py_tp_new, (void *)__pyx_tp_new_7rocksdb___pyx_scope_struct_3_genexpr},
   {0, 0},
 };
-static PyType_Spec __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_spec = {
-  "rocksdb.__pyx_scope_struct_2_genexpr",
-  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr),
+static PyType_Spec __pyx_type_7rocksdb___pyx_scope_struct_3_genexpr_spec = {
+  "rocksdb.__pyx_scope_struct_3_genexpr",
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr),
   0,
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
-  __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_slots,
+  __pyx_type_7rocksdb___pyx_scope_struct_3_genexpr_slots,
 };
 #else
 
-static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr = {
+static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_3_genexpr = {
   PyVarObject_HEAD_INIT(0, 0)
-  "rocksdb.""__pyx_scope_struct_2_genexpr", /*tp_name*/
-  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_2_genexpr), /*tp_basicsize*/
+  "rocksdb.""__pyx_scope_struct_3_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_7rocksdb___pyx_scope_struct_3_genexpr), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_2_genexpr, /*tp_dealloc*/
+  __pyx_tp_dealloc_7rocksdb___pyx_scope_struct_3_genexpr, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -9212,7 +10493,7 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr = {
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7rocksdb___pyx_scope_struct_2_genexpr, /*tp_traverse*/
+  __pyx_tp_traverse_7rocksdb___pyx_scope_struct_3_genexpr, /*tp_traverse*/
   0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
@@ -9230,7 +10511,7 @@ static PyTypeObject __pyx_type_7rocksdb___pyx_scope_struct_2_genexpr = {
   #endif
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7rocksdb___pyx_scope_struct_2_genexpr, /*tp_new*/
+  __pyx_tp_new_7rocksdb___pyx_scope_struct_3_genexpr, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -9286,11 +10567,14 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_Collection_delete, __pyx_k_Collection_delete, sizeof(__pyx_k_Collection_delete), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_exists, __pyx_k_Collection_exists, sizeof(__pyx_k_Collection_exists), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_find_all, __pyx_k_Collection_find_all, sizeof(__pyx_k_Collection_find_all), 0, 0, 1, 1},
+    {&__pyx_n_s_Collection_find_all_raw, __pyx_k_Collection_find_all_raw, sizeof(__pyx_k_Collection_find_all_raw), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_find_first, __pyx_k_Collection_find_first, sizeof(__pyx_k_Collection_find_first), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_find_last, __pyx_k_Collection_find_last, sizeof(__pyx_k_Collection_find_last), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_find_many, __pyx_k_Collection_find_many, sizeof(__pyx_k_Collection_find_many), 0, 0, 1, 1},
+    {&__pyx_n_s_Collection_find_many_raw, __pyx_k_Collection_find_many_raw, sizeof(__pyx_k_Collection_find_many_raw), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_find_one, __pyx_k_Collection_find_one, sizeof(__pyx_k_Collection_find_one), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_get, __pyx_k_Collection_get, sizeof(__pyx_k_Collection_get), 0, 0, 1, 1},
+    {&__pyx_n_s_Collection_get_raw, __pyx_k_Collection_get_raw, sizeof(__pyx_k_Collection_get_raw), 0, 0, 1, 1},
     {&__pyx_n_s_Collection_update, __pyx_k_Collection_update, sizeof(__pyx_k_Collection_update), 0, 0, 1, 1},
     {&__pyx_n_s_OPT_SERIALIZE_NUMPY, __pyx_k_OPT_SERIALIZE_NUMPY, sizeof(__pyx_k_OPT_SERIALIZE_NUMPY), 0, 0, 1, 1},
     {&__pyx_kp_u_Object_with_id, __pyx_k_Object_with_id, sizeof(__pyx_k_Object_with_id), 0, 1, 0, 0},
@@ -9303,8 +10587,8 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_RocksDBWrapper_put, __pyx_k_RocksDBWrapper_put, sizeof(__pyx_k_RocksDBWrapper_put), 0, 0, 1, 1},
     {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
     {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-    {&__pyx_n_s__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 1, 1},
-    {&__pyx_n_s__30, __pyx_k__30, sizeof(__pyx_k__30), 0, 0, 1, 1},
+    {&__pyx_n_s__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 0, 1, 1},
+    {&__pyx_n_s__36, __pyx_k__36, sizeof(__pyx_k__36), 0, 0, 1, 1},
     {&__pyx_kp_u_already_exists, __pyx_k_already_exists, sizeof(__pyx_k_already_exists), 0, 1, 0, 0},
     {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
     {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
@@ -9322,14 +10606,17 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
     {&__pyx_n_s_exists, __pyx_k_exists, sizeof(__pyx_k_exists), 0, 0, 1, 1},
     {&__pyx_n_s_find_all, __pyx_k_find_all, sizeof(__pyx_k_find_all), 0, 0, 1, 1},
+    {&__pyx_n_s_find_all_raw, __pyx_k_find_all_raw, sizeof(__pyx_k_find_all_raw), 0, 0, 1, 1},
     {&__pyx_n_s_find_first, __pyx_k_find_first, sizeof(__pyx_k_find_first), 0, 0, 1, 1},
     {&__pyx_n_s_find_last, __pyx_k_find_last, sizeof(__pyx_k_find_last), 0, 0, 1, 1},
     {&__pyx_n_s_find_many, __pyx_k_find_many, sizeof(__pyx_k_find_many), 0, 0, 1, 1},
-    {&__pyx_n_s_find_many_locals_genexpr, __pyx_k_find_many_locals_genexpr, sizeof(__pyx_k_find_many_locals_genexpr), 0, 0, 1, 1},
+    {&__pyx_n_s_find_many_raw, __pyx_k_find_many_raw, sizeof(__pyx_k_find_many_raw), 0, 0, 1, 1},
+    {&__pyx_n_s_find_many_raw_locals_genexpr, __pyx_k_find_many_raw_locals_genexpr, sizeof(__pyx_k_find_many_raw_locals_genexpr), 0, 0, 1, 1},
     {&__pyx_n_s_find_one, __pyx_k_find_one, sizeof(__pyx_k_find_one), 0, 0, 1, 1},
     {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
     {&__pyx_n_s_genexpr, __pyx_k_genexpr, sizeof(__pyx_k_genexpr), 0, 0, 1, 1},
     {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
+    {&__pyx_n_s_get_raw, __pyx_k_get_raw, sizeof(__pyx_k_get_raw), 0, 0, 1, 1},
     {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
     {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
     {&__pyx_n_s_initializing, __pyx_k_initializing, sizeof(__pyx_k_initializing), 0, 0, 1, 1},
@@ -9338,11 +10625,13 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_it, __pyx_k_it, sizeof(__pyx_k_it), 0, 0, 1, 1},
     {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
     {&__pyx_n_s_iter, __pyx_k_iter, sizeof(__pyx_k_iter), 0, 0, 1, 1},
+    {&__pyx_n_s_k, __pyx_k_k, sizeof(__pyx_k_k), 0, 0, 1, 1},
     {&__pyx_n_s_key, __pyx_k_key, sizeof(__pyx_k_key), 0, 0, 1, 1},
     {&__pyx_n_s_kwargs, __pyx_k_kwargs, sizeof(__pyx_k_kwargs), 0, 0, 1, 1},
     {&__pyx_n_s_loads, __pyx_k_loads, sizeof(__pyx_k_loads), 0, 0, 1, 1},
     {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
     {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+    {&__pyx_n_s_needles, __pyx_k_needles, sizeof(__pyx_k_needles), 0, 0, 1, 1},
     {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
     {&__pyx_kp_u_not_found, __pyx_k_not_found, sizeof(__pyx_k_not_found), 0, 1, 0, 0},
     {&__pyx_n_s_option, __pyx_k_option, sizeof(__pyx_k_option), 0, 0, 1, 1},
@@ -9366,6 +10655,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
     {&__pyx_n_s_throw, __pyx_k_throw, sizeof(__pyx_k_throw), 0, 0, 1, 1},
     {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+    {&__pyx_n_s_v, __pyx_k_v, sizeof(__pyx_k_v), 0, 0, 1, 1},
     {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
     {&__pyx_n_s_value_dict, __pyx_k_value_dict, sizeof(__pyx_k_value_dict), 0, 0, 1, 1},
     {0, 0, 0, 0, 0, 0, 0}
@@ -9397,6 +10687,17 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
+  /* "rocksdb.pyx":212
+ *         cdef list results = []
+ *         cdef list needles = [
+ *             orjson.dumps({k: v})[1:-1]             # <<<<<<<<<<<<<<
+ *             for k, v in kwargs.items()
+ *             if isinstance(v, str)
+ */
+  __pyx_slice__2 = PySlice_New(__pyx_int_1, __pyx_int_neg_1, Py_None); if (unlikely(!__pyx_slice__2)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__2);
+  __Pyx_GIVEREF(__pyx_slice__2);
+
   /* "rocksdb.pyx":110
  *             self.db.Close()
  * 
@@ -9404,10 +10705,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         self.db.Put(self.write_options, key.encode(), value)
  * 
  */
-  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_value); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 110, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
-  __pyx_codeobj__4 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_put, 110, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__4)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __pyx_tuple__4 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_value); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_put, 110, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(0, 110, __pyx_L1_error)
 
   /* "rocksdb.pyx":113
  *         self.db.Put(self.write_options, key.encode(), value)
@@ -9416,10 +10717,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         cdef Status status
  *         cdef string value
  */
-  __pyx_tuple__5 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_status, __pyx_n_s_value); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 113, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
-  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_get, 113, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_status, __pyx_n_s_value); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_get, 113, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 113, __pyx_L1_error)
 
   /* "rocksdb.pyx":121
  *         return value
@@ -9428,20 +10729,20 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         self.db.Delete(self.write_options, key.encode())
  * 
  */
-  __pyx_tuple__7 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_key); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 121, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_delete, 121, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_tuple__8 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_key); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_delete, 121, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 121, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(1, 1, __pyx_L1_error)
 
   /* "(tree fragment)":3
  * def __reduce_cython__(self):
@@ -9449,10 +10750,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_tuple__11 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 3, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_tuple__12 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(1, 3, __pyx_L1_error)
 
   /* "rocksdb.pyx":142
  *         self.db = RocksDBWrapper(db_path)
@@ -9461,7 +10762,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         return self.db.get(key) is not None
  * 
  */
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_exists, 142, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_exists, 142, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 142, __pyx_L1_error)
 
   /* "rocksdb.pyx":145
  *         return self.db.get(key) is not None
@@ -9470,7 +10771,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         cdef bytes value = self.db.get(key)
  *         if value is None:
  */
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_get, 145, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_get, 145, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 145, __pyx_L1_error)
 
   /* "rocksdb.pyx":151
  *         return orjson.loads(value)
@@ -9479,7 +10780,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         if self.exists(key):
  *             raise ValueError(f"Object with id {key} already exists")
  */
-  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_create, 151, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_create, 151, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 151, __pyx_L1_error)
 
   /* "rocksdb.pyx":156
  *         self.db.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
@@ -9488,7 +10789,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         if not self.exists(key):
  *             raise ValueError(f"Object with id {key} not found")
  */
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_update, 156, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_update, 156, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 156, __pyx_L1_error)
 
   /* "rocksdb.pyx":161
  *         self.db.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
@@ -9497,7 +10798,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         if not self.exists(key):
  *             raise ValueError(f"Object with id {key} not found")
  */
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_delete, 161, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_delete, 161, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 161, __pyx_L1_error)
 
   /* "rocksdb.pyx":166
  *         self.db.delete(key)
@@ -9506,7 +10807,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         if self.exists(key):
  *             return self.get(key)
  */
-  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_one, 166, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_one, 166, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 166, __pyx_L1_error)
 
   /* "rocksdb.pyx":171
  *         return {key: None}
@@ -9515,62 +10816,95 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         cdef list results = []
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  */
-  __pyx_tuple__19 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_results, __pyx_n_s_it, __pyx_n_s_value); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 171, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
-  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_all, 171, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __pyx_tuple__20 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_results, __pyx_n_s_it, __pyx_n_s_value); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_all, 171, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 171, __pyx_L1_error)
 
   /* "rocksdb.pyx":184
  *         return results
  * 
  *     def find_many(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
+ */
+  __pyx_tuple__22 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_kwargs, __pyx_n_s_value); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_many, 184, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 184, __pyx_L1_error)
+
+  /* "rocksdb.pyx":187
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
+ *     def get_raw(self, str key):             # <<<<<<<<<<<<<<
+ *         return self.db.get(key)
+ * 
+ */
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_get_raw, 187, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 187, __pyx_L1_error)
+
+  /* "rocksdb.pyx":190
+ *         return self.db.get(key)
+ * 
+ *     def find_all_raw(self):             # <<<<<<<<<<<<<<
  *         cdef list results = []
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  */
-  __pyx_tuple__21 = PyTuple_Pack(9, __pyx_n_s_self, __pyx_n_s_kwargs, __pyx_n_s_results, __pyx_n_s_it, __pyx_n_s_key, __pyx_n_s_value, __pyx_n_s_value_dict, __pyx_n_s_genexpr, __pyx_n_s_genexpr); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 184, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_many, 184, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_tuple__25 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_results, __pyx_n_s_it); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_all_raw, 190, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 190, __pyx_L1_error)
+
+  /* "rocksdb.pyx":202
+ *         return results
+ * 
+ *     def find_many_raw(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the stored bytes of the documents matching `kwargs`. String filters
+ */
+  __pyx_tuple__27 = PyTuple_Pack(12, __pyx_n_s_self, __pyx_n_s_kwargs, __pyx_n_s_results, __pyx_n_s_needles, __pyx_n_s_it, __pyx_n_s_value, __pyx_n_s_value_dict, __pyx_n_s_k, __pyx_n_s_v, __pyx_n_s_genexpr, __pyx_n_s_genexpr, __pyx_n_s_genexpr); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_many_raw, 202, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 202, __pyx_L1_error)
 
-  /* "rocksdb.pyx":200
+  /* "rocksdb.pyx":231
  *         return results
  * 
  *     def count(self):             # <<<<<<<<<<<<<<
  *         cdef int count = 0
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  */
-  __pyx_tuple__23 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_count, __pyx_n_s_it); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 200, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__23);
-  __Pyx_GIVEREF(__pyx_tuple__23);
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_count, 200, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_tuple__29 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_count, __pyx_n_s_it); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_count, 231, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 231, __pyx_L1_error)
 
-  /* "rocksdb.pyx":212
+  /* "rocksdb.pyx":243
  *         return count
  * 
  *     def find_first(self):             # <<<<<<<<<<<<<<
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  */
-  __pyx_tuple__25 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_it, __pyx_n_s_value); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_first, 212, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_tuple__31 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_it, __pyx_n_s_value); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_first, 243, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 243, __pyx_L1_error)
 
-  /* "rocksdb.pyx":223
+  /* "rocksdb.pyx":254
  *         return None
  * 
  *     def find_last(self):             # <<<<<<<<<<<<<<
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  */
-  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_last, 223, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rocksdb_pyx, __pyx_n_s_find_last, 254, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 254, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(1, 1, __pyx_L1_error)
 
   /* "(tree fragment)":3
  * def __reduce_cython__(self):
@@ -9578,7 +10912,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -9591,6 +10925,8 @@ static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
   __pyx_umethod_PyString_Type_encode.type = (PyObject*)&PyString_Type;
   __pyx_umethod_PyString_Type_encode.method_name = &__pyx_n_s_encode;
   if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -9707,34 +11043,34 @@ static int __Pyx_modinit_type_init_code(void) {
   }
   #endif
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_spec, NULL); if (unlikely(!__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many)) __PYX_ERR(0, 184, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_spec, __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw_spec, NULL); if (unlikely(!__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw)) __PYX_ERR(0, 202, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw_spec, __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw) < 0) __PYX_ERR(0, 202, __pyx_L1_error)
   #else
-  __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many = &__pyx_type_7rocksdb___pyx_scope_struct_1_find_many;
+  __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw = &__pyx_type_7rocksdb___pyx_scope_struct_1_find_many_raw;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw) < 0) __PYX_ERR(0, 202, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
-  __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many->tp_print = 0;
+  __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw->tp_print = 0;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many->tp_dictoffset && __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many->tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many->tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw->tp_dictoffset && __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_7rocksdb___pyx_scope_struct_1_find_many_raw->tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
   #endif
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_spec, NULL); if (unlikely(!__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr)) __PYX_ERR(0, 193, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_spec, __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr) < 0) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_spec, NULL); if (unlikely(!__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr)) __PYX_ERR(0, 222, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr_spec, __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr) < 0) __PYX_ERR(0, 222, __pyx_L1_error)
   #else
   __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr = &__pyx_type_7rocksdb___pyx_scope_struct_2_genexpr;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr) < 0) __PYX_ERR(0, 193, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr) < 0) __PYX_ERR(0, 222, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr->tp_print = 0;
@@ -9744,6 +11080,25 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_ptype_7rocksdb___pyx_scope_struct_2_genexpr->tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
   #endif
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_7rocksdb___pyx_scope_struct_3_genexpr_spec, NULL); if (unlikely(!__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr)) __PYX_ERR(0, 225, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_7rocksdb___pyx_scope_struct_3_genexpr_spec, __pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  #else
+  __pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr = &__pyx_type_7rocksdb___pyx_scope_struct_3_genexpr;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr->tp_dictoffset && __pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_7rocksdb___pyx_scope_struct_3_genexpr->tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  #endif
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -10072,7 +11427,7 @@ if (!__Pyx_RefNanny) {
  *         self.db.Put(self.write_options, key.encode(), value)
  * 
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_5put, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper_put, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__4)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_5put, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper_put, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__5)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_RocksDBWrapper, __pyx_n_s_put, __pyx_t_2) < 0) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10085,7 +11440,7 @@ if (!__Pyx_RefNanny) {
  *         cdef Status status
  *         cdef string value
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_7get, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper_get, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__6)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_7get, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper_get, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 113, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_RocksDBWrapper, __pyx_n_s_get, __pyx_t_2) < 0) __PYX_ERR(0, 113, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10098,7 +11453,7 @@ if (!__Pyx_RefNanny) {
  *         self.db.Delete(self.write_options, key.encode())
  * 
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_9delete, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper_delete, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__8)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_9delete, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper_delete, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 121, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_RocksDBWrapper, __pyx_n_s_delete, __pyx_t_2) < 0) __PYX_ERR(0, 121, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10109,7 +11464,7 @@ if (!__Pyx_RefNanny) {
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_14__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper___reduce_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_14__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper___reduce_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10120,7 +11475,7 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_16__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper___setstate_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_14RocksDBWrapper_16__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_RocksDBWrapper___setstate_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10135,7 +11490,7 @@ if (!__Pyx_RefNanny) {
   __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_return, __pyx_n_s_bool) < 0) __PYX_ERR(0, 142, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_3exists, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_exists, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_3exists, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_exists, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_3, __pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10150,7 +11505,7 @@ if (!__Pyx_RefNanny) {
  *         cdef bytes value = self.db.get(key)
  *         if value is None:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_5get, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_get, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_5get, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_get, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_get, __pyx_t_3) < 0) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10163,7 +11518,7 @@ if (!__Pyx_RefNanny) {
  *         if self.exists(key):
  *             raise ValueError(f"Object with id {key} already exists")
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_7create, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_create, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_7create, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_create, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_create, __pyx_t_3) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10176,7 +11531,7 @@ if (!__Pyx_RefNanny) {
  *         if not self.exists(key):
  *             raise ValueError(f"Object with id {key} not found")
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_9update, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_update, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_9update, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_update, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_update, __pyx_t_3) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10189,7 +11544,7 @@ if (!__Pyx_RefNanny) {
  *         if not self.exists(key):
  *             raise ValueError(f"Object with id {key} not found")
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_11delete, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_delete, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_11delete, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_delete, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_delete, __pyx_t_3) < 0) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10202,7 +11557,7 @@ if (!__Pyx_RefNanny) {
  *         if self.exists(key):
  *             return self.get(key)
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_13find_one, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_one, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_13find_one, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_one, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_one, __pyx_t_3) < 0) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10215,7 +11570,7 @@ if (!__Pyx_RefNanny) {
  *         cdef list results = []
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_15find_all, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_all, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_15find_all, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_all, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 171, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_all, __pyx_t_3) < 0) __PYX_ERR(0, 171, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10225,51 +11580,90 @@ if (!__Pyx_RefNanny) {
  *         return results
  * 
  *     def find_many(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_17find_many, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_many, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_many, __pyx_t_3) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_7rocksdb_Collection);
+
+  /* "rocksdb.pyx":187
+ *         return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+ * 
+ *     def get_raw(self, str key):             # <<<<<<<<<<<<<<
+ *         return self.db.get(key)
+ * 
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_19get_raw, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_get_raw, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_get_raw, __pyx_t_3) < 0) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_7rocksdb_Collection);
+
+  /* "rocksdb.pyx":190
+ *         return self.db.get(key)
+ * 
+ *     def find_all_raw(self):             # <<<<<<<<<<<<<<
  *         cdef list results = []
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_17find_many, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_many, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_21find_all_raw, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_all_raw, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 190, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_many, __pyx_t_3) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_all_raw, __pyx_t_3) < 0) __PYX_ERR(0, 190, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_7rocksdb_Collection);
 
-  /* "rocksdb.pyx":200
+  /* "rocksdb.pyx":202
+ *         return results
+ * 
+ *     def find_many_raw(self, object kwargs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the stored bytes of the documents matching `kwargs`. String filters
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_23find_many_raw, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_many_raw, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_many_raw, __pyx_t_3) < 0) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_7rocksdb_Collection);
+
+  /* "rocksdb.pyx":231
  *         return results
  * 
  *     def count(self):             # <<<<<<<<<<<<<<
  *         cdef int count = 0
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_19count, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_count, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_25count, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_count, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_count, __pyx_t_3) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_count, __pyx_t_3) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_7rocksdb_Collection);
 
-  /* "rocksdb.pyx":212
+  /* "rocksdb.pyx":243
  *         return count
  * 
  *     def find_first(self):             # <<<<<<<<<<<<<<
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_21find_first, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_first, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_27find_first, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_first, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_first, __pyx_t_3) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_first, __pyx_t_3) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_7rocksdb_Collection);
 
-  /* "rocksdb.pyx":223
+  /* "rocksdb.pyx":254
  *         return None
  * 
  *     def find_last(self):             # <<<<<<<<<<<<<<
  *         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
  *         try:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_23find_last, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_last, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_29find_last, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection_find_last, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_last, __pyx_t_3) < 0) __PYX_ERR(0, 223, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_7rocksdb_Collection, __pyx_n_s_find_last, __pyx_t_3) < 0) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_7rocksdb_Collection);
 
@@ -10278,7 +11672,7 @@ if (!__Pyx_RefNanny) {
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_25__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection___reduce_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_31__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection___reduce_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -10289,7 +11683,7 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_27__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection___setstate_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_7rocksdb_10Collection_33__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Collection___setstate_cython, NULL, __pyx_n_s_rocksdb, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -11963,6 +13357,16 @@ bad:
 #endif
 }
 
+/* RaiseUnboundLocalError */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
+    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
+}
+
+/* RaiseClosureNameError */
+static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname) {
+    PyErr_Format(PyExc_NameError, "free variable '%s' referenced before assignment in enclosing scope", varname);
+}
+
 /* IterFinish */
 static CYTHON_INLINE int __Pyx_IterFinish(void) {
     PyObject* exc_type;
@@ -12308,14 +13712,108 @@ static CYTHON_INLINE int __Pyx_dict_iter_next(
     return 1;
 }
 
-/* RaiseUnboundLocalError */
-static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
-    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
-}
-
-/* RaiseClosureNameError */
-static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname) {
-    PyErr_Format(PyExc_NameError, "free variable '%s' referenced before assignment in enclosing scope", varname);
+/* SliceObject */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, int wraparound) {
+    __Pyx_TypeName obj_type_name;
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_slice(obj, cstart, cstop);
+    }
+#else
+    CYTHON_UNUSED_VAR(wraparound);
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_subscript))
+#else
+    CYTHON_UNUSED_VAR(wraparound);
+#endif
+    {
+        PyObject* result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "'" __Pyx_FMT_TYPENAME "' object is unsliceable", obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+bad:
+    return NULL;
 }
 
 /* FixUpExtensionType */
@@ -12857,7 +14355,7 @@ static PyObject *__Pyx_ImportDottedModule_WalkParts(PyObject *module, PyObject *
 #endif
 static PyObject *__Pyx__ImportDottedModule(PyObject *name, PyObject *parts_tuple) {
 #if PY_MAJOR_VERSION < 3
-    PyObject *module, *from_list, *star = __pyx_n_s__2;
+    PyObject *module, *from_list, *star = __pyx_n_s__3;
     CYTHON_UNUSED_VAR(parts_tuple);
     from_list = PyList_New(1);
     if (unlikely(!from_list))
@@ -14475,7 +15973,7 @@ __Pyx_PyType_GetName(PyTypeObject* tp)
     if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
         PyErr_Clear();
         Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__30);
+        name = __Pyx_NewRef(__pyx_n_s__36);
     }
     return name;
 }
@@ -182,17 +182,48 @@ cdef class Collection:
         return results
 
     def find_many(self, object kwargs):
+        return [orjson.loads(value) for value in self.find_many_raw(kwargs)]
+
+    def get_raw(self, str key):
+        return self.db.get(key)
+
+    def find_all_raw(self):
         cdef list results = []
         cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
         try:
             it.SeekToFirst()
             while it.Valid():
-                key = (<bytes>it.key().data())[:it.key().size()]
+                results.append((<bytes>it.value().data())[:it.value().size()])
+                it.Next()
+        finally:
+            del it
+        return results
+
+    def find_many_raw(self, object kwargs):
+        """
+        Returns the stored bytes of the documents matching `kwargs`. String filters
+        are first looked up as serialized `"key":"value"` fragments so most
+        non-matching documents are skipped without being decoded. Other values are
+        left to the decoded comparison, which also matches missing keys to `None`
+        and `1` to `True`, like `find_many` always did.
+        """
+        cdef list results = []
+        cdef list needles = [
+            orjson.dumps({k: v})[1:-1]
+            for k, v in kwargs.items()
+            if isinstance(v, str)
+        ]
+        cdef Iterator* it = self.db.db.NewIterator(self.db.read_options)
+        try:
+            it.SeekToFirst()
+            while it.Valid():
                 value = (<bytes>it.value().data())[:it.value().size()]
+                it.Next()
+                if not all(needle in value for needle in needles):
+                    continue
                 value_dict = orjson.loads(value)  # Parse bytes to dict
                 if all(value_dict.get(k) == v for k, v in kwargs.items()):
-                    results.append(value_dict)
-                it.Next()
+                    results.append(value)
         finally:
             del it
         return results
@@ -0,0 +1,282 @@
+"""
+This module contains the Unix socket broker used by `IQueue` to deliver messages
+across worker processes, and the client each process uses to talk to it.
+
+Frames are a 4-byte big-endian length followed by an orjson payload:
+
+- client to broker: `["sub", key]`, `["unsub", key]` or `["pub", [[key, data], ...]]`
+- broker to client: `[[key, data], ...]`
+
+Publishers batch the messages published during one event loop iteration into a
+single frame, and the broker forwards them to each subscribed connection in a single
+frame as well. Run the broker with `python src/interfaces/broker.py`, or let the
+first client start it. Run by path, the broker does not import the application
+package, only this module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import os
+import struct
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import orjson
+
+try:
+    from ..utils.handlers import get_logger
+except ImportError:  # run as a script, outside the package
+    from logging import getLogger as get_logger
+
+logger = get_logger(__name__)
+
+SOCKET_PATH = os.getenv("QUEUE_SOCKET", "/tmp/iqueue.sock")
+FLUSH_SIZE = 64 * 1024
+WRITE_BUFFER_LIMIT = 16 * 1024 * 1024
+HEADER = struct.Struct(">I")
+
+
+def frame(payload: Any) -> bytes:
+    data = orjson.dumps(payload)
+    return HEADER.pack(len(data)) + data
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Any:
+    header = await reader.readexactly(HEADER.size)
+    (size,) = HEADER.unpack(header)
+    return orjson.loads(await reader.readexactly(size))
+
+
+class Broker:
+    """
+    Routes published messages to every connection subscribed to their key.
+
+    Connections whose write buffer exceeds `WRITE_BUFFER_LIMIT` bytes are considered
+    stalled and their messages are dropped rather than buffered without bound.
+    """
+
+    def __init__(self, path: str = SOCKET_PATH) -> None:
+        self.path = path
+        self.subscribers: dict[str, set[asyncio.StreamWriter]] = {}
+        self.dropped = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        keys: set[str] = set()
+        try:
+            while True:
+                message = await read_frame(reader)
+                if message[0] == "pub":
+                    self.route(message[1])
+                elif message[0] == "sub":
+                    keys.add(message[1])
+                    self.subscribers.setdefault(message[1], set()).add(writer)
+                elif message[0] == "unsub":
+                    keys.discard(message[1])
+                    self.unsubscribe(message[1], writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for key in keys:
+                self.unsubscribe(key, writer)
+            writer.close()
+
+    def unsubscribe(self, key: str, writer: asyncio.StreamWriter) -> None:
+        writers = self.subscribers.get(key)
+        if writers is not None:
+            writers.discard(writer)
+            if not writers:
+                del self.subscribers[key]
+
+    def route(self, messages: list[list[Any]]) -> None:
+        batches: dict[asyncio.StreamWriter, list[list[Any]]] = {}
+        for message in messages:
+            for writer in self.subscribers.get(message[0], ()):
+                batches.setdefault(writer, []).append(message)
+        for writer, batch in batches.items():
+            if writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                self.dropped += len(batch)
+                continue
+            writer.write(frame(batch))
+
+    async def serve(self) -> None:
+        lock = open(f"{self.path}.lock", "w", encoding="utf-8")  # pylint: disable=R1732
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info("Broker already running on %s", self.path)
+            return
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self.handle, path=self.path)
+        logger.info("Broker listening on %s", self.path)
+        async with server:
+            await server.serve_forever()
+
+
+class BrokerClient:
+    """
+    A process' connection to the broker.
+
+    Messages received from the broker are handed to `deliver`, which fans them out to
+    the local subscribers of their key. When the connection drops the client
+    reconnects in the background, subscribes again to every key it was subscribed to
+    and sends the messages published meanwhile, keeping at most `WRITE_BUFFER_LIMIT`
+    bytes of them.
+    """
+
+    def __init__(
+        self, deliver: Callable[[str, Any], Any], path: str = SOCKET_PATH
+    ) -> None:
+        self.deliver = deliver
+        self.path = path
+        self.writer: asyncio.StreamWriter | None = None
+        self.reader_task: asyncio.Task[None] | None = None
+        self.reconnect_task: asyncio.Task[None] | None = None
+        self.lock = asyncio.Lock()
+        self.keys: set[str] = set()
+        self.buffer: list[bytes] = []
+        self.buffer_size = 0
+        self.dropped = 0
+
+    @property
+    def connected(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+
+    async def connect(self) -> asyncio.StreamWriter:
+        async with self.lock:
+            if self.writer is not None and not self.writer.is_closing():
+                return self.writer
+            reader, writer = await connect(self.path)
+            for key in self.keys:
+                writer.write(frame(["sub", key]))
+            self.writer = writer
+            self.reader_task = asyncio.create_task(self.read(reader))
+            return writer
+
+    async def reconnect(self) -> None:
+        """
+        Connects again until the broker answers, then sends the buffered messages.
+        """
+        delay = 0.1
+        while not self.connected:
+            try:
+                await self.connect()
+            except (OSError, ConnectionError):
+                logger.warning("Broker on %s unavailable, retrying", self.path)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 5.0)
+        self.flush()
+
+    def ensure_connected(self) -> None:
+        if not self.reconnecting:
+            self.reconnect_task = asyncio.create_task(self.reconnect())
+
+    async def read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                for key, data in await read_frame(reader):
+                    await self.deliver(key, data)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logger.warning("Lost connection to the broker on %s", self.path)
+            if self.writer is not None:
+                self.writer.close()
+            self.writer = None
+            if self.keys or self.buffer:
+                self.ensure_connected()
+
+    @property
+    def reconnecting(self) -> bool:
+        return self.reconnect_task is not None and not self.reconnect_task.done()
+
+    async def subscribe(self, key: str) -> None:
+        self.keys.add(key)
+        if self.reconnecting:
+            return
+        writer = await self.connect()
+        writer.write(frame(["sub", key]))
+        await writer.drain()
+
+    async def unsubscribe(self, key: str) -> None:
+        self.keys.discard(key)
+        if self.writer is not None and not self.writer.is_closing():
+            self.writer.write(frame(["unsub", key]))
+
+    async def publish(self, key: str, data: Any) -> None:
+        writer = None
+        if not self.reconnecting:
+            try:
+                writer = await self.connect()
+            except OSError:
+                logger.warning("Buffering messages until the broker is back")
+        if not self.buffer:
+            asyncio.get_running_loop().call_soon(self.flush)
+        message = orjson.dumps([key, data])
+        self.buffer.append(message)
+        self.buffer_size += len(message)
+        if self.buffer_size >= FLUSH_SIZE:
+            self.flush()
+            if writer is not None and self.connected:
+                await writer.drain()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered messages to the broker as a single `pub` frame, or keeps
+        them until the connection is back, dropping the oldest beyond
+        `WRITE_BUFFER_LIMIT` bytes.
+        """
+        if not self.buffer:
+            return
+        if self.writer is None or self.writer.is_closing():
+            while self.buffer_size > WRITE_BUFFER_LIMIT:
+                self.buffer_size -= len(self.buffer.pop(0))
+                self.dropped += 1
+            self.ensure_connected()
+            return
+        buffer, self.buffer, self.buffer_size = self.buffer, [], 0
+        payload = b'["pub",[' + b",".join(buffer) + b"]]"
+        self.writer.write(HEADER.pack(len(payload)) + payload)
+
+
+async def connect(
+    path: str = SOCKET_PATH, retries: int = 50
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Connects to the broker, starting it in a separate process if it is not running.
+
+    :param path: Path of the broker's Unix socket.
+    :param retries: Number of connection attempts while the broker starts.
+    :return: The reader and writer of the connection.
+    """
+    started = False
+    for _ in range(retries):
+        try:
+            return await asyncio.open_unix_connection(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not started:
+                start(path)
+                started = True
+            await asyncio.sleep(0.1)
+    raise ConnectionError(f"Could not connect to the broker on {path}")
+
+
+def start(path: str = SOCKET_PATH) -> None:
+    """
+    Starts the broker in a separate process that outlives the worker starting it.
+    """
+    subprocess.Popen(  # pylint: disable=R1732
+        [sys.executable, "-P", str(Path(__file__).resolve())],
+        env={**os.environ, "QUEUE_SOCKET": path},
+        start_new_session=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(Broker().serve())
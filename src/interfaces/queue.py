@@ -1,20 +1,153 @@
 import asyncio
-from typing import AsyncIterator, Dict, Generic, TypeVar
+import os
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Generic,
+    Literal,
+    Optional,
+    Set,
+    TypeAlias,
+    TypeVar,
+)
+
+from ..utils.metrics import Sample, collector, labelled
+from .broker import BrokerClient
 
 T = TypeVar("T")
 
+Overflow: TypeAlias = Literal["block", "drop-oldest", "drop-newest"]
+Backend: TypeAlias = Literal["local", "unix"]
+
+
+@dataclass(eq=False)
+class Subscription(Generic[T]):
+    """
+    A subscriber of a key with its own bounded queue.
+
+    Attributes:
+        queue (asyncio.Queue[T]): The pending messages of the subscriber.
+        overflow (Overflow): What to do when a message arrives and the queue is full.
+        dropped (int): Number of messages dropped because the queue was full.
+    """
+
+    queue: "asyncio.Queue[T]"
+    overflow: Overflow
+    dropped: int = field(default=0)
+
+
 class IQueue(Generic[T]):
-    subscribers: Dict[str, asyncio.Queue[T]] = {}
+    """
+    Publish/subscribe queue.
+
+    Every subscriber of a key gets its own queue of at most `maxsize` messages and
+    receives every message published to that key. When a subscriber's queue is full
+    the `overflow` policy applies: `block` waits for room (backpressure on the
+    publisher), `drop-oldest` discards the oldest pending message and `drop-newest`
+    discards the message being published. Subscribers are removed as soon as their
+    generator is closed.
+
+    With the `local` backend messages only reach subscribers of the same process.
+    With the `unix` backend (`QUEUE_BACKEND=unix`) they go through a broker on a Unix
+    socket and reach subscribers of every worker process; messages must then be
+    serializable by orjson.
+    """
+
+    subscribers: ClassVar[Dict[str, Set[Subscription]]] = {}
+    dropped: ClassVar[Dict[str, int]] = {}
+    broker: ClassVar[Optional[BrokerClient]] = None
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        overflow: Overflow = "drop-oldest",
+        backend: Optional[Backend] = None,
+    ):
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.backend: Backend = backend or os.getenv("QUEUE_BACKEND", "local")  # type: ignore
+
+    @classmethod
+    def get_broker(cls) -> BrokerClient:
+        if cls.broker is None:
+            cls.broker = BrokerClient(deliver=cls.deliver)
+        return cls.broker
 
     async def sub(self, *, key: str) -> AsyncIterator[T]:
-        if key not in self.subscribers:
-            self.subscribers[key] = asyncio.Queue()
-        queue = self.subscribers[key]
-        while True:
-            yield await queue.get()
+        subscription = Subscription[T](
+            queue=asyncio.Queue(maxsize=self.maxsize), overflow=self.overflow
+        )
+        subscriptions = self.subscribers.setdefault(key, set())
+        if self.backend == "unix" and not subscriptions:
+            await self.get_broker().subscribe(key)
+        subscriptions.add(subscription)
+        try:
+            while True:
+                yield await subscription.queue.get()
+        finally:
+            subscriptions = self.subscribers.get(key)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self.subscribers[key]
+                    if self.backend == "unix":
+                        await self.get_broker().unsubscribe(key)
 
     async def pub(self, *, key: str, data: T) -> None:
-        if key not in self.subscribers:
-            self.subscribers[key] = asyncio.Queue()
-        queue = self.subscribers[key]
-        await queue.put(data)
\ No newline at end of file
+        if self.backend == "unix":
+            await self.get_broker().publish(key, data)
+        else:
+            await self.deliver(key, data)
+
+    @classmethod
+    async def deliver(cls, key: str, data: T) -> None:
+        """
+        Hands a message to every local subscriber of `key`.
+        """
+        for subscription in list(cls.subscribers.get(key, ())):
+            queue = subscription.queue
+            if not queue.full():
+                queue.put_nowait(data)
+            elif subscription.overflow == "block":
+                await queue.put(data)
+            elif subscription.overflow == "drop-oldest":
+                queue.get_nowait()
+                queue.put_nowait(data)
+                cls._drop(key, subscription)
+            else:
+                cls._drop(key, subscription)
+
+    @classmethod
+    def _drop(cls, key: str, subscription: Subscription) -> None:
+        subscription.dropped += 1
+        cls.dropped[key] = cls.dropped.get(key, 0) + 1
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the number of subscribers, pending messages and dropped messages
+        per key.
+        """
+        keys = set(cls.subscribers) | set(cls.dropped)
+        return {
+            key: {
+                "subscribers": len(cls.subscribers.get(key, ())),
+                "depth": sum(s.queue.qsize() for s in cls.subscribers.get(key, ())),
+                "max_depth": max(
+                    (s.queue.qsize() for s in cls.subscribers.get(key, ())), default=0
+                ),
+                "dropped": cls.dropped.get(key, 0),
+            }
+            for key in keys
+        }
+
+
+@collector
+def queue_samples() -> list[Sample]:
+    samples = list(labelled("queue", "key", IQueue.stats()))
+    if IQueue.broker is not None:
+        samples.append(("queue_broker_buffered_bytes", {}, IQueue.broker.buffer_size))
+    return samples
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Coroutine, Generic, TypeAlias, TypeVar
+from typing import Any, ClassVar, Coroutine, Generic, Optional, TypeAlias, TypeVar
 
 from fastapi import Response
 from pydantic import BaseModel
 from typing_extensions import Literal
 
+from ..utils.admission import admission, get_gate
+
 Identifier: TypeAlias = Literal[
     "sentence-transformers/all-mpnet-base-v2",
     "openai/whisper-large-v3",
@@ -22,7 +24,28 @@ class IRequest(BaseModel, Generic[T]):
 
 
 class ITask(BaseModel, Generic[T, Res], ABC):
+    """
+    A task served by the API.
+
+    The handlers listed in `admitted` go through the admission gate of the task,
+    which runs at most `max_concurrency` calls at once (0 for no limit) with at most
+    `max_queue` calls waiting, each for at most `max_wait` seconds.
+    """
+
     identifier: Identifier
+    max_concurrency: ClassVar[int] = 0
+    max_queue: ClassVar[int] = 0
+    max_wait: ClassVar[Optional[float]] = None
+    admitted: ClassVar[tuple[str, ...]] = ("handler",)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        names = [name for name in cls.admitted if name in cls.__dict__]
+        if not names or getattr(cls.__dict__[names[0]], "__isabstractmethod__", False):
+            return
+        gate = get_gate(cls.__name__, cls.max_concurrency, cls.max_queue, cls.max_wait)
+        for name in names:
+            setattr(cls, name, admission(gate)(cls.__dict__[name]))
 
     @abstractmethod
     async def handler(
@@ -1,13 +1,14 @@
 from .common import User
 from .image import ImageRequest, ImageResponse
 from .llm import LLMConversation, LLMMessage, LLMResponseEvent
-from .music import MusicRequest, MusicResponse
+from .music import MusicRequest, MusicResponse, MusicStreamRequest
 from .stt import VoiceFile
 from .tts import YoutubeVideoRequest
 
 __all__ = [
     "MusicRequest",
     "MusicResponse",
+    "MusicStreamRequest",
     "LLMMessage",
     "LLMResponseEvent",
     "LLMConversation",
@@ -1,12 +1,22 @@
-from functools import cached_property
+from typing import Any
 
 from pydantic import computed_field
-from transformers import AutoTokenizer  # type: ignore
 
 from ..data.database import RocksDBModel
+from ..utils.models import models
 from .llm import LLMConversation
 
 
+@models.register("llama-tokenizer", size_hint=50)
+def load_tokenizer() -> Any:
+    """
+    Loads the Llama 3 tokenizer.
+    """
+    from transformers import AutoTokenizer  # type: ignore # pylint: disable=C0415
+
+    return AutoTokenizer.from_pretrained("meta-llama/Meta-Llama-3-8B-Instruct")  # type: ignore
+
+
 class Thread(RocksDBModel):
     """
     A schema for conversation data.
@@ -16,12 +26,12 @@ class Thread(RocksDBModel):
     namespace: str
     title: str
 
-    @cached_property
-    def tokenizer(self) -> AutoTokenizer:
+    @property
+    def tokenizer(self) -> Any:
         """
         Returns the tokenizer for the conversation.
         """
-        return AutoTokenizer.from_pretrained("meta-llama/Meta-Llama-3-8B-Instruct")  # type: ignore
+        return models.get("llama-tokenizer")
 
     @computed_field(return_type=int)
     @property
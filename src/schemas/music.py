@@ -2,10 +2,10 @@ from typing import Any, Optional
 
 import numpy as np
 from pydantic import BaseModel, Field
-from typing_extensions import TypedDict
+from typing_extensions import Literal, NotRequired, TypedDict
 
 
-class MusicRequest(BaseModel):
+class MusicPrompt(BaseModel):
     text: str = Field(
         ...,
         title="Text",
@@ -16,11 +16,55 @@ class MusicRequest(BaseModel):
         title="Audio",
         description="The audio tensor for generating music continuation.",
     )
+    key: Optional[str] = Field(
+        default=None,
+        title="Key",
+        description="The storage key of a WAV or float32 audio prompt for continuation.",
+    )
+
+
+class MusicRequest(MusicPrompt):
+    response: Literal["json", "binary", "wav", "url"] = Field(
+        default="json",
+        title="Response",
+        description="Return float samples as JSON, raw float32 bytes, a WAV file, or a presigned URL to the uploaded WAV.",
+    )
+
+
+class MusicStreamRequest(MusicPrompt):
+    duration: float = Field(
+        default=30.0,
+        gt=0,
+        title="Duration",
+        description="The total duration in seconds of the generated music.",
+    )
+    segment: float = Field(
+        default=10.0,
+        gt=0,
+        title="Segment",
+        description="The duration in seconds of each streamed segment.",
+    )
+    context: float = Field(
+        default=5.0,
+        ge=0,
+        title="Context",
+        description="The seconds of the previous segment used to continue the next one.",
+    )
+    format: Literal["wav", "mp3", "opus"] = Field(
+        default="wav",
+        title="Format",
+        description="The audio format of the streamed chunks.",
+    )
+    transport: Literal["sse", "http"] = Field(
+        default="http",
+        title="Transport",
+        description="Stream base64 chunks over SSE or raw bytes over chunked HTTP.",
+    )
 
 
 class MusicResponse(TypedDict):
     time: float
-    audio: np.ndarray[np.float32, Any]
+    audio: NotRequired[np.ndarray[np.float32, Any]]
     duration: int
     sample_rate: int
     url: str
@@ -1,13 +1,18 @@
 import os
-from typing import Any
+from typing import Any, ClassVar
 
-import httpx
 from fastapi.responses import JSONResponse
 from pydantic import Field
 
 from ..interfaces import Identifier, IRequest, ITask
 from ..schemas import ImageRequest, ImageResponse
 from ..utils.handlers import handle
+from ..utils.http import get_http_client
+
+IMAGE_API_URL = os.getenv(
+    "IMAGE_API_URL", "https://api.runpod.ai/v2/riqj0gj1sg8asw/runsync"
+)
+IMAGE_TIMEOUT = float(os.getenv("IMAGE_TIMEOUT", "120"))
 
 
 class ImageGenerationResponse(JSONResponse):
@@ -25,6 +30,8 @@ class ImageGeneration(ITask[ImageRequest, ImageGenerationResponse]):
     """
 
     identifier: Identifier = Field(default="stabilityai/stable-diffusion-xl-base-1.0")
+    max_concurrency: ClassVar[int] = 8
+    max_queue: ClassVar[int] = 32
 
     async def handler(self, *, request: IRequest[ImageRequest]):
         """
@@ -39,7 +46,7 @@ class ImageGeneration(ITask[ImageRequest, ImageGenerationResponse]):
         data = await self.gen_image(request=request)
         return ImageGenerationResponse(data=data)  # type: ignore
 
-    @handle
+    @handle(idempotent=True, breaker="image")
     async def gen_image(self, *, request: IRequest[ImageRequest]) -> ImageResponse:
         """
         Generates an image based on the given data.
@@ -50,11 +57,11 @@ class ImageGeneration(ITask[ImageRequest, ImageGenerationResponse]):
         Returns:
             ImageResponse: The image response.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.runpod.ai/v2/riqj0gj1sg8asw/runsync",
-                json=request.model_dump(),
-                headers={"Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}"},
-                timeout=30000,
-            )
-            return ImageResponse(**response.json())
+        response = await get_http_client().post(
+            IMAGE_API_URL,
+            json=request.model_dump(),
+            headers={"Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}"},
+            timeout=IMAGE_TIMEOUT,
+        )
+        response.raise_for_status()
+        return ImageResponse(**response.json())
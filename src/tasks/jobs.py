@@ -0,0 +1,57 @@
+"""
+This module registers the runners of the tasks that can be submitted as jobs.
+
+Runners take the job payload and return a JSON serializable result, which is
+persisted with the job.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+from ..data.jobs import Job, jobs
+from ..data.storage import ObjectStorage
+from ..interfaces import IRequest
+from ..schemas import ImageRequest, MusicRequest, YoutubeVideoRequest
+from ..utils.audio import CONTENT_TYPES, wav
+from .image import ImageGeneration
+from .music import SAMPLE_RATE, Music
+from .tts import YoutubeToText
+
+__all__ = ["Job", "jobs"]
+
+
+@jobs.register("music", concurrency=1, model=MusicRequest)
+async def music_job(payload: dict[str, Any]) -> dict[str, Any]:
+    audio = await Music()._handler(MusicRequest(**payload))  # pylint: disable=W0212
+    storage = ObjectStorage()
+    key = f"music/{uuid4().hex}.wav"
+    await storage.put_object(
+        key=key,
+        data=wav(audio, sample_rate=SAMPLE_RATE),
+        content_type=CONTENT_TYPES["wav"],
+    )
+    return {
+        "key": key,
+        "url": await storage.generate_presigned_url(key=key),
+        "duration": round(len(audio) / SAMPLE_RATE),
+        "sample_rate": SAMPLE_RATE,
+    }
+
+
+@jobs.register("image", concurrency=4, model=ImageRequest)
+async def image_job(payload: dict[str, Any]) -> Any:
+    return await ImageGeneration().gen_image(
+        request=IRequest[ImageRequest](input=ImageRequest(**payload))
+    )
+
+
+@jobs.register("ytt", concurrency=1, model=YoutubeVideoRequest)
+async def ytt_job(payload: dict[str, Any]) -> dict[str, Any]:
+    request = YoutubeVideoRequest(**payload)
+    task = YoutubeToText()
+    audio_samples = await task.transcribe_youtube(url=request.url)
+    return {
+        "text": "".join(
+            [text async for text in task.generator(audio_samples=audio_samples)]
+        )
+    }
@@ -1,7 +1,13 @@
 import os
-from typing import cast
+import time
+from typing import ClassVar, cast
 
-from openai import AsyncOpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+)
 from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
 from pydantic import Field
 from sse_starlette.sse import EventSourceResponse
@@ -9,21 +15,43 @@ from sse_starlette.sse import EventSourceResponse
 from ..interfaces import Identifier, IProxy, IRequest, ITask
 from ..schemas import LLMConversation, LLMMessage
 from ..schemas.conversation import Thread
-from ..utils.handlers import handle
+from ..utils.handlers import handle, is_transient
+from ..utils.metrics import histogram
+
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+
+ttft = histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from the start of a completion request to its first streamed token.",
+    ("model",),
+)
+
+
+def is_upstream_failure(e: BaseException) -> bool:
+    """
+    Tells whether an error means the LLM endpoint is unhealthy. The connection and
+    timeout errors of `openai` carry no response, so `is_transient` misses them.
+    """
+    return isinstance(
+        e, (APIConnectionError, APITimeoutError, InternalServerError)
+    ) or is_transient(e)
 
 
 class LanguageModel(ITask[LLMConversation, EventSourceResponse], IProxy[AsyncOpenAI]):
     namespace: str
     identifier: Identifier = Field(default="llama-3-quipu")
+    max_concurrency: ClassVar[int] = 64
+    max_queue: ClassVar[int] = 256
     instructions: str
 
     def __load__(self) -> AsyncOpenAI:
-        return AsyncOpenAI(base_url=os.getenv("OPENAI_API_BASE"))
+        return AsyncOpenAI(base_url=os.getenv("OPENAI_API_BASE"), timeout=LLM_TIMEOUT)
 
-    @handle
+    @handle(idempotent=True, breaker="llm", is_failure=is_upstream_failure)
     async def handler(
         self, *, request: IRequest[LLMConversation]
     ) -> EventSourceResponse:
+        start = time.perf_counter_ns()
         client = self.__load__()
         response = await client.chat.completions.create(
             messages=cast(
@@ -44,6 +72,8 @@ class LanguageModel(ITask[LLMConversation, EventSourceResponse], IProxy[AsyncOpe
             async for chunkpart in response:
                 content = chunkpart.choices[0].delta.content
                 if content:
+                    if not chunks:
+                        ttft.observe(time.perf_counter_ns() - start, self.identifier)
                     chunks += content
                     yield content
                 else:
@@ -3,21 +3,53 @@ This module contains the `Music` class for generating music using the `MusicGen`
 """
 
 # pylint: disable=E0402
+from __future__ import annotations
+
+import base64
+import os
+import time
 from functools import cached_property
-from typing import Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar
+from uuid import uuid4
 
 import numpy as np
-import torch
-from audiocraft.models.musicgen import MusicGen
-from fastapi.responses import ORJSONResponse
+from fastapi import HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import Field
+from sse_starlette.sse import EventSourceResponse
 
+from ..data.storage import ObjectStorage
 from ..interfaces import Identifier, IRequest, ITask
-from ..schemas import MusicRequest
+from ..schemas import MusicRequest, MusicResponse, MusicStreamRequest
+from ..utils.audio import CONTENT_TYPES, SampleFormat, chunked, decode, encode, wav
+from ..utils.batching import Batcher
 from ..utils.handlers import asyncify, handle, singleton
-from ..utils.tensor import detach, flat, splat
+from ..utils.models import models
+from ..utils.tensor import detach, flat, splat, to_tensor
+
+if TYPE_CHECKING:
+    import torch
+    from audiocraft.models.musicgen import MusicGen
 
 CHUNKSIZE = 1024 * 1024
+PROMPT_SAMPLE_RATE = 44100
+SAMPLE_RATE = 32000
+BATCH_WINDOW = float(os.getenv("MUSIC_BATCH_WINDOW", "0.05"))
+BATCH_SIZE = int(os.getenv("MUSIC_BATCH_SIZE", "4"))
+
+
+@models.register("musicgen", size_hint=6000)
+def load_musicgen() -> MusicGen:
+    """
+    Loads the `facebook/musicgen-melody` model on the available device.
+    """
+    import torch  # pylint: disable=C0415,W0621
+    from audiocraft.models.musicgen import MusicGen  # pylint: disable=C0415,W0621
+
+    return MusicGen.get_pretrained(
+        "facebook/musicgen-melody",
+        device="cuda" if torch.cuda.is_available() else "cpu",
+    )  # pylint: disable=E1101 # type: ignore
 
 
 @singleton
@@ -27,47 +59,283 @@ class Music(ITask[MusicRequest, ORJSONResponse]):
     """
 
     identifier: Identifier = Field(default="facebook/musicgen-melody")
+    max_concurrency: ClassVar[int] = 2 * BATCH_SIZE
+    max_queue: ClassVar[int] = 8 * BATCH_SIZE
+    admitted: ClassVar[tuple[str, ...]] = (
+        "handler",
+        "stream_handler",
+        "binary_handler",
+    )
 
-    @cached_property
+    @property
     def model(self) -> MusicGen:
-        return MusicGen.get_pretrained(
-            self.identifier, device="cuda" if torch.cuda.is_available() else "cpu"
-        )  # pylint: disable=E1101 # type: ignore
+        return models.get("musicgen")
 
-    @asyncify
+    @asyncify("model")
     def gen(self) -> torch.Tensor:
-        tensor = self.model.generate_unconditional(num_samples=1, progress=True)
+        with models.use("musicgen", exclusive=True) as model:
+            tensor = model.generate_unconditional(num_samples=1, progress=True)
         return splat(tensor)
 
-    @asyncify
-    def gen_music(self, *, text: str) -> torch.Tensor:
-        tensor = self.model.generate(descriptions=[text], progress=True)
-        return splat(tensor)
+    @cached_property
+    def batcher(
+        self,
+    ) -> Batcher[tuple[Any, ...], tuple[str, torch.Tensor | None], torch.Tensor]:
+        """
+        Groups concurrent generation requests into a single `generate` call.
+        """
+        return Batcher(self.gen_batch, window=BATCH_WINDOW, max_size=BATCH_SIZE)
 
-    @asyncify
-    def gen_continuation(self, *, text: str, value: torch.Tensor) -> torch.Tensor:
-        prompt = detach(value)
-        prompt_sample_rate = 44100
-        tensor = self.model.generate_continuation(
-            prompt, prompt_sample_rate, [text], progress=True
+    async def gen_batch(
+        self, key: tuple[Any, ...], items: list[tuple[str, torch.Tensor | None]]
+    ) -> list[torch.Tensor]:
+        texts = [text for text, _ in items]
+        if key[0] == "text":
+            return await self.gen_music_batch(texts=texts)
+        prompts = [prompt for _, prompt in items if prompt is not None]
+        return await self.gen_continuation_batch(
+            texts=texts, prompts=prompts, sample_rate=key[1]
         )
-        return splat(tensor)
+
+    @asyncify("model")
+    def gen_music_batch(self, *, texts: list[str]) -> list[torch.Tensor]:
+        with models.use("musicgen", exclusive=True) as model:
+            tensor = model.generate(descriptions=texts, progress=True)
+        return list(splat(tensor).split(1))
+
+    @asyncify("model")
+    def gen_continuation_batch(
+        self, *, texts: list[str], prompts: list[torch.Tensor], sample_rate: int
+    ) -> list[torch.Tensor]:
+        """
+        Continues a batch of prompts, cropped to the shortest one keeping their tails.
+        """
+        import torch  # pylint: disable=C0415,W0621
+
+        length = min(prompt.shape[-1] for prompt in prompts)
+        prompt = torch.cat([detach(prompt)[..., -length:] for prompt in prompts])
+        with models.use("musicgen", exclusive=True) as model:
+            tensor = model.generate_continuation(
+                prompt, sample_rate, texts, progress=True
+            )
+        return list(splat(tensor).split(1))
+
+    async def gen_music(self, *, text: str) -> torch.Tensor:
+        return await self.batcher.submit(("text",), (text, None))
+
+    async def gen_continuation(
+        self,
+        *,
+        text: str,
+        value: torch.Tensor,
+        sample_rate: int = PROMPT_SAMPLE_RATE,
+    ) -> torch.Tensor:
+        # Prompts are batched with those of the same sample rate, channels and
+        # length in whole seconds, so cropping them costs less than a second.
+        key = (
+            "continuation",
+            sample_rate,
+            value.shape[-2],
+            value.shape[-1] // sample_rate,
+        )
+        return await self.batcher.submit(key, (text, value))
+
+    @asyncify("model")
+    def gen_segment(
+        self,
+        *,
+        text: str,
+        duration: float,
+        prompt: torch.Tensor | None = None,
+        prompt_sample_rate: int | None = None,
+    ) -> tuple[torch.Tensor, int]:
+        """
+        Generates `duration` seconds of music, continuing `prompt` if given.
+
+        Only the newly generated audio is returned, at the model sample rate, along
+        with that sample rate. The generation length is a setting of the shared model,
+        so every MusicGen call holds the model exclusively.
+        """
+        with models.use("musicgen", exclusive=True) as model:
+            sample_rate: int = model.sample_rate
+            duration_, params = model.duration, dict(model.generation_params)
+            try:
+                if prompt is None:
+                    model.set_generation_params(duration=duration)
+                    return splat(model.generate(descriptions=[text])), sample_rate
+                prompt_sample_rate = prompt_sample_rate or sample_rate
+                offset = round(prompt.shape[-1] * sample_rate / prompt_sample_rate)
+                model.set_generation_params(duration=offset / sample_rate + duration)
+                tensor = splat(
+                    model.generate_continuation(prompt, prompt_sample_rate, [text])
+                )
+                return tensor[..., offset:], sample_rate
+            finally:
+                model.duration, model.generation_params = duration_, params
+
+    async def gen_stream(
+        self, *, request: MusicStreamRequest
+    ) -> AsyncIterator[bytes]:
+        """
+        Generates music segment by segment and yields each one encoded as soon as it
+        is ready, continuing every segment from the tail of the previous one. The
+        first segment continues the `audio` or stored `key` prompt, if any.
+        """
+        prompt: torch.Tensor | None = None
+        prompt_sample_rate: int | None = None
+        if request.audio:
+            prompt = to_tensor(np.asarray(request.audio, dtype=np.float32)[None])
+            prompt_sample_rate = PROMPT_SAMPLE_RATE
+        elif request.key:
+            samples, prompt_sample_rate = decode(
+                await ObjectStorage().get_object(key=request.key), mono=True
+            )
+            prompt = to_tensor(samples)
+            prompt_sample_rate = prompt_sample_rate or PROMPT_SAMPLE_RATE
+        generated = 0.0
+        while generated < request.duration:
+            seconds = min(request.segment, request.duration - generated)
+            tensor, sample_rate = await self.gen_segment(
+                text=request.text,
+                duration=seconds,
+                prompt=prompt,
+                prompt_sample_rate=prompt_sample_rate,
+            )
+            if request.context:
+                context = int(request.context * sample_rate)
+                prompt, prompt_sample_rate = tensor[..., -context:], sample_rate
+            else:
+                prompt, prompt_sample_rate = None, None
+            yield encode(
+                flat(tensor=tensor),
+                sample_rate=sample_rate,
+                format=request.format,
+                header=generated == 0,
+            )
+            generated += seconds
 
     async def _handler(
-        self, audio_prompt: MusicRequest | None = None
+        self,
+        audio_prompt: MusicRequest | None = None,
+        *,
+        prompt: np.ndarray[np.float32, Any] | None = None,
+        sample_rate: int | None = None,
     ) -> np.ndarray[np.float32, Any]:
         if audio_prompt:
             text = audio_prompt.text
-            audio = audio_prompt.audio
-            if audio:
+            if prompt is None and audio_prompt.audio:
+                prompt = np.asarray(audio_prompt.audio, dtype=np.float32)[None]
+            elif prompt is None and audio_prompt.key:
+                prompt, sample_rate = decode(
+                    await ObjectStorage().get_object(key=audio_prompt.key), mono=True
+                )
+            if prompt is not None:
                 return flat(
                     tensor=await self.gen_continuation(
-                        text=text, value=torch.Tensor([[audio]])
+                        text=text,
+                        value=to_tensor(prompt),
+                        sample_rate=sample_rate or PROMPT_SAMPLE_RATE,
                     )
                 )
             return flat(tensor=await self.gen_music(text=text))
         return flat(tensor=await self.gen())
 
+    async def respond(
+        self, *, audio: np.ndarray[np.float32, Any], mode: str, elapsed: float
+    ) -> Response:
+        """
+        Builds the response for the generated audio according to the requested mode.
+        """
+        headers = {"X-Sample-Rate": str(SAMPLE_RATE)}
+        if mode == "binary":
+            return Response(
+                content=audio.tobytes(),
+                media_type="application/octet-stream",
+                headers=headers,
+            )
+        if mode == "wav":
+            return Response(
+                content=wav(audio, sample_rate=SAMPLE_RATE),
+                media_type=CONTENT_TYPES["wav"],
+                headers=headers,
+            )
+        if mode == "url":
+            storage = ObjectStorage()
+            key = f"music/{uuid4().hex}.wav"
+            await storage.put_object(
+                key=key,
+                data=wav(audio, sample_rate=SAMPLE_RATE),
+                content_type=CONTENT_TYPES["wav"],
+            )
+            return ORJSONResponse(
+                content=MusicResponse(
+                    time=elapsed,
+                    duration=round(len(audio) / SAMPLE_RATE),
+                    sample_rate=SAMPLE_RATE,
+                    url=await storage.generate_presigned_url(key=key),
+                    key=key,
+                )
+            )
+        return ORJSONResponse(content={"audio": audio})
+
     @handle
     async def handler(self, *, request: IRequest[MusicRequest]):
-        return ORJSONResponse(content={"audio": await self._handler(request.input)})
+        start = time.perf_counter()
+        audio = await self._handler(request.input)
+        return await self.respond(
+            audio=audio,
+            mode=request.input.response,
+            elapsed=time.perf_counter() - start,
+        )
+
+    @handle
+    async def binary_handler(
+        self,
+        *,
+        request: IRequest[MusicRequest],
+        data: bytes,
+        dtype: SampleFormat = "float32",
+        sample_rate: int = PROMPT_SAMPLE_RATE,
+    ):
+        """
+        Handles a continuation request whose prompt is a binary audio body, either a
+        WAV file or raw `float32`/`pcm16` samples, decoded without going through JSON.
+        Multichannel WAV prompts are downmixed to mono; malformed bodies are a 400.
+        """
+        start = time.perf_counter()
+        try:
+            prompt, wav_sample_rate = decode(data, dtype=dtype, mono=True)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        audio = await self._handler(
+            request.input, prompt=prompt, sample_rate=wav_sample_rate or sample_rate
+        )
+        return await self.respond(
+            audio=audio,
+            mode=request.input.response,
+            elapsed=time.perf_counter() - start,
+        )
+
+    @handle
+    async def stream_handler(self, *, request: IRequest[MusicStreamRequest]):
+        """
+        Streams the generated music in chunks of `CHUNKSIZE` bytes, either as raw
+        bytes over chunked HTTP or as base64 encoded `audio` events over SSE.
+        """
+        segments = self.gen_stream(request=request.input)
+
+        async def _chunks():
+            async for segment in segments:
+                for chunk in chunked(segment, CHUNKSIZE):
+                    yield chunk
+
+        async def _events():
+            async for chunk in _chunks():
+                yield {"event": "audio", "data": base64.b64encode(chunk).decode()}
+            yield {"event": "done", "data": ""}
+
+        if request.input.transport == "sse":
+            return EventSourceResponse(_events())
+        return StreamingResponse(
+            _chunks(), media_type=CONTENT_TYPES[request.input.format]
+        )
@@ -1,33 +1,44 @@
+import asyncio
 import re
 import tempfile
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx
 import numpy as np
 import pydub
 import pytube
-import torch
 from pydantic import Field
 from sse_starlette import EventSourceResponse
-from whisper import load_model, transcribe
 
 from ..interfaces import Identifier, IRequest, ITask
 from ..schemas import YoutubeVideoRequest
 from ..utils.handlers import asyncify, handle
+from ..utils.models import models
 
-DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-print(f"Using device: {DEVICE}")
-MODEL = "large" if torch.cuda.is_available() else "small"
 SAMPLE_RATE = 16000
 CHUNK_DURATION = 3
 CHUNKSIZE = SAMPLE_RATE * CHUNK_DURATION
-model = load_model(MODEL).to(DEVICE)
+
+
+@models.register("whisper", size_hint=3000)
+def load_whisper():
+    """
+    Loads the Whisper model, `large` on GPU and `small` on CPU.
+    """
+    import torch  # pylint: disable=C0415
+    from whisper import load_model  # pylint: disable=C0415
+
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    name = "large" if torch.cuda.is_available() else "small"
+    return load_model(name).to(device)
 
 
 class YoutubeToText(ITask[YoutubeVideoRequest, EventSourceResponse]):
     identifier: Identifier = Field(default="openai/whisper-large-v3")
+    max_concurrency: ClassVar[int] = 2
+    max_queue: ClassVar[int] = 8
 
-    @asyncify
+    @asyncify("io")
     def transcribe_youtube(self, *, url: str):
         yt = pytube.YouTube(url)
         stream = yt.streams.filter(only_audio=True).first()
@@ -41,15 +52,36 @@ class YoutubeToText(ITask[YoutubeVideoRequest, EventSourceResponse]):
             )
             return audio_samples
 
+    @asyncify("model")
+    def transcribe(self, *, chunk: np.ndarray[np.float32, Any]) -> str:
+        from whisper import transcribe  # pylint: disable=C0415
+
+        with models.use("whisper") as model:
+            text = transcribe(model, chunk)
+        _text = text["text"]
+        assert isinstance(_text, str)
+        return _text
+
     async def generator(self, *, audio_samples: np.ndarray[np.float32, Any]):
+        await models.aget("whisper")
         for i in range(0, len(audio_samples), CHUNKSIZE):
             chunk = audio_samples[i : i + CHUNKSIZE]
             if len(chunk) < CHUNKSIZE:
                 chunk = np.pad(chunk, (0, CHUNKSIZE - len(chunk)), mode="constant")
-            text = transcribe(model, chunk)
-            _text = text["text"]
-            assert isinstance(_text, str)
-            yield _text
+            yield await self.transcribe(chunk=chunk)
+
+    @asyncify("io")
+    def video_info(self, *, url: str) -> dict[str, Any]:
+        yt = pytube.YouTube(url)
+        return {
+            "title": yt.title,
+            "url": url,
+            "thumbnail": yt.thumbnail_url,
+            "author": yt.author,
+            "length": yt.length,
+            "views": yt.views,
+            "rating": yt.rating,
+        }
 
     async def search_videos(self, *, query: str):
         search_url = f"https://www.youtube.com/results?search_query={query}"
@@ -65,23 +97,20 @@ class YoutubeToText(ITask[YoutubeVideoRequest, EventSourceResponse]):
             videos = set[str]()
             for video_id in pattern.findall(data):
                 videos.add(f"https://www.youtube.com/watch?v={video_id}")
-            for url in videos:
-                yt = pytube.YouTube(url)
-                yield {
-                    "title": yt.title,
-                    "url": url,
-                    "thumbnail": yt.thumbnail_url,
-                    "author": yt.author,
-                    "length": yt.length,
-                    "views": yt.views,
-                    "rating": yt.rating,
-                }
-
-    @handle
+            infos = [asyncio.create_task(self.video_info(url=url)) for url in videos]
+            try:
+                for info in asyncio.as_completed(infos):
+                    yield await info
+            finally:
+                for task in infos:
+                    task.cancel()
+                await asyncio.gather(*infos, return_exceptions=True)
+
+    @handle(idempotent=True)
     async def handler(self, *, request: IRequest[YoutubeVideoRequest]):
         audio_samples = await self.transcribe_youtube(url=request.input.url)
         return EventSourceResponse(self.generator(audio_samples=audio_samples))
 
-    @handle
+    @handle(idempotent=True)
     async def search(self, *, query: str):
         return [video async for video in self.search_videos(query=query)]
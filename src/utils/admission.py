@@ -0,0 +1,207 @@
+"""
+This module contains the admission control applied to `ITask` handlers.
+
+Each task class gets a `Gate` limiting how many calls run at once and how many may
+wait for a slot. Calls beyond the queue cap are rejected right away with `429`, and
+calls that wait longer than `max_wait` with `503`, both with a `Retry-After` header
+estimated from the recent service time. Limits come from the task class and can be
+overridden per deployment with `TASK_LIMITS`, e.g. `Music=1:4:30,LanguageModel=32:128`
+(`concurrency:queue[:max_wait]`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import wraps
+from typing import Any, AsyncIterator, Callable, Coroutine, TypeVar
+
+from fastapi import HTTPException
+from typing_extensions import ParamSpec
+
+from .handlers import get_logger, watch_stream
+from .metrics import Sample, collector, labelled
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+logger = get_logger(__name__)
+
+
+def _limits() -> dict[str, tuple[int, int, float | None]]:
+    limits: dict[str, tuple[int, int, float | None]] = {}
+    for item in os.getenv("TASK_LIMITS", "").split(","):
+        if "=" not in item:
+            continue
+        name, values = item.split("=", 1)
+        parts = values.split(":")
+        limits[name.strip()] = (
+            int(parts[0]),
+            int(parts[1]) if len(parts) > 1 else 0,
+            float(parts[2]) if len(parts) > 2 else None,
+        )
+    return limits
+
+
+class Gate:
+    """
+    Limits the concurrency and queue depth of a task.
+
+    Attributes:
+            name (str): The name of the task.
+            limit (int): Maximum concurrent calls, 0 for no limit.
+            max_queue (int): Maximum calls waiting for a slot.
+            max_wait (float | None): Maximum seconds a call may wait for a slot.
+    """
+
+    def __init__(
+        self, name: str, limit: int, max_queue: int, max_wait: float | None = None
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.semaphore = asyncio.Semaphore(limit or 1)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.service_time = 1.0
+
+    def retry_after(self) -> str:
+        pending = self.service_time * (self.waiting + 1) / (self.limit or 1)
+        return str(max(1, math.ceil(pending)))
+
+    def reject(self, status_code: int, detail: str) -> HTTPException:
+        self.rejected += 1
+        logger.warning("Rejected %s call: %s", self.name, detail)
+        return HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": self.retry_after()},
+        )
+
+    async def acquire(self) -> float | None:
+        """
+        Waits for a slot, rejecting the call if the queue is full or the wait is too
+        long.
+
+        :return: The time the slot was taken, to pass to `release`, or None if the
+            gate has no limit.
+        """
+        if not self.limit:
+            return None
+        if self.active + self.waiting >= self.limit + self.max_queue:
+            raise self.reject(429, f"Too many pending {self.name} requests")
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), self.max_wait)
+        except asyncio.TimeoutError as e:
+            raise self.reject(503, f"Timed out waiting for {self.name}") from e
+        finally:
+            self.waiting -= 1
+        waited = time.perf_counter() - start
+        self.admitted += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        self.active += 1
+        return time.perf_counter()
+
+    def release(self, start: float | None) -> None:
+        """
+        Gives back a slot taken by `acquire`.
+        """
+        if start is None:
+            return
+        self.active -= 1
+        self.semaphore.release()
+        self.service_time = 0.8 * self.service_time + 0.2 * (
+            time.perf_counter() - start
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Holds a slot for the duration of the block.
+        """
+        start = await self.acquire()
+        try:
+            yield
+        finally:
+            self.release(start)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_mean": self.wait_total / self.admitted if self.admitted else 0.0,
+            "wait_max": self.wait_max,
+            "service_time": self.service_time,
+        }
+
+
+gates: dict[str, Gate] = {}
+
+
+@collector
+def gate_samples() -> list[Sample]:
+    return list(
+        labelled("task", "task", {name: gate.stats() for name, gate in gates.items()})
+    )
+
+
+def get_gate(
+    name: str, limit: int = 0, max_queue: int = 0, max_wait: float | None = None
+) -> Gate:
+    """
+    Returns the gate of a task, creating it with the given limits unless overridden
+    by `TASK_LIMITS`.
+    """
+    if name not in gates:
+        limit, max_queue, max_wait = _limits().get(name, (limit, max_queue, max_wait))
+        gates[name] = Gate(name, limit, max_queue, max_wait)
+    return gates[name]
+
+
+def admission(
+    gate: Gate,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]
+]:
+    """
+    Decorator to run an async function through a gate. When the function returns a
+    streaming response, the slot is held until its body is over, since that is where
+    streaming tasks do their work.
+
+    :param gate: The gate of the task.
+    :return: Decorator.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]]
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            start = await gate.acquire()
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException:
+                gate.release(start)
+                raise
+            if not watch_stream(result, lambda _: gate.release(start)):
+                gate.release(start)
+            return result
+
+        return wrapper
+
+    return decorator
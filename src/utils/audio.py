@@ -0,0 +1,179 @@
+"""
+This module contains utility functions to encode and decode audio samples for transport.
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+import wave
+from typing import Any, Iterator, Literal, TypeAlias
+
+import numpy as np
+from numpy import ndarray
+
+AudioFormat: TypeAlias = Literal["wav", "mp3", "opus"]
+SampleFormat: TypeAlias = Literal["float32", "pcm16"]
+
+CONTENT_TYPES: dict[str, str] = {
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "opus": "audio/ogg",
+}
+
+
+def pcm16(samples: ndarray[np.float32, Any]) -> bytes:
+    """
+    Converts float samples in [-1, 1] to little-endian 16-bit PCM.
+
+    Args:
+            samples (ndarray): The float32 audio samples.
+
+    Returns:
+            bytes: The PCM16 encoded samples.
+    """
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+def decode(
+    data: bytes, *, dtype: SampleFormat = "float32", mono: bool = False
+) -> tuple[ndarray[np.float32, Any], int | None]:
+    """
+    Decodes a binary audio body into float32 samples of shape (channels, samples).
+
+    WAV bodies are detected by their `RIFF` header and carry their own sample rate,
+    otherwise the body is read as raw mono `float32` or `pcm16` samples. Either way
+    the samples are converted with a single copy, so the array is writable.
+
+    Args:
+            data (bytes): The binary audio body.
+            dtype (SampleFormat): The sample format of raw bodies.
+            mono (bool): Whether to downmix multichannel audio to a single channel.
+
+    Returns:
+            tuple[ndarray, int | None]: The samples and the WAV sample rate if known.
+
+    Raises:
+            ValueError: If the body is not valid audio of the given format.
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        try:
+            with wave.open(io.BytesIO(data)) as reader:
+                if reader.getsampwidth() != 2:
+                    raise ValueError("Only 16-bit PCM WAV audio is supported")
+                channels, sample_rate = reader.getnchannels(), reader.getframerate()
+                frames = reader.readframes(reader.getnframes())
+        except (wave.Error, EOFError) as e:
+            raise ValueError(f"Invalid WAV audio: {e}") from e
+        frames = frames[: len(frames) - len(frames) % (2 * channels)]
+        samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels).T
+        samples = samples.astype(np.float32)
+        samples /= 32768
+        if mono and channels > 1:
+            samples = samples.mean(axis=0, keepdims=True)
+        return samples, sample_rate
+    width = 2 if dtype == "pcm16" else 4
+    if len(data) % width:
+        raise ValueError(
+            f"Raw {dtype} audio must be a multiple of {width} bytes, got {len(data)}"
+        )
+    if dtype == "pcm16":
+        samples = np.frombuffer(data, dtype="<i2")[None].astype(np.float32)
+        samples /= 32768
+        return samples, None
+    return np.frombuffer(data, dtype="<f4")[None].copy(), None
+
+
+def wav(samples: ndarray[np.float32, Any], *, sample_rate: int) -> bytes:
+    """
+    Encodes float samples as a complete PCM16 WAV file.
+
+    Args:
+            samples (ndarray): The float32 audio samples.
+            sample_rate (int): The sample rate of the audio.
+
+    Returns:
+            bytes: The WAV file.
+    """
+    data = pcm16(samples)
+    return wav_header(sample_rate=sample_rate, data_size=len(data)) + data
+
+
+def wav_header(
+    *, sample_rate: int, channels: int = 1, data_size: int = 0xFFFFFFFF
+) -> bytes:
+    """
+    Builds a PCM16 WAV header.
+
+    When `data_size` is unknown, as for a stream, the maximum size is used which
+    players interpret as "read until the end of the stream".
+
+    Args:
+            sample_rate (int): The sample rate of the audio.
+            channels (int): The number of channels.
+            data_size (int): The size in bytes of the PCM data.
+
+    Returns:
+            bytes: The 44 bytes WAV header.
+    """
+    byte_rate = sample_rate * channels * 2
+    riff_size = min(data_size + 36, 0xFFFFFFFF)
+    return (
+        b"RIFF"
+        + struct.pack("<I", riff_size)
+        + b"WAVEfmt "
+        + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, byte_rate, channels * 2, 16)
+        + b"data"
+        + struct.pack("<I", data_size)
+    )
+
+
+def encode(
+    samples: ndarray[np.float32, Any],
+    *,
+    sample_rate: int,
+    format: AudioFormat = "wav",  # pylint: disable=W0622
+    header: bool = True,
+) -> bytes:
+    """
+    Encodes float samples to the given audio format.
+
+    Args:
+            samples (ndarray): The float32 audio samples.
+            sample_rate (int): The sample rate of the audio.
+            format (AudioFormat): The output format, `wav`, `mp3` or `opus`.
+            header (bool): Whether to prepend a streaming header for `wav`.
+
+    Returns:
+            bytes: The encoded audio.
+    """
+    data = pcm16(samples)
+    if format == "wav":
+        return wav_header(sample_rate=sample_rate) + data if header else data
+    import pydub  # pylint: disable=C0415
+
+    segment = pydub.AudioSegment(
+        data=data, sample_width=2, frame_rate=sample_rate, channels=1
+    )
+    buffer = io.BytesIO()
+    if format == "opus":
+        segment.export(buffer, format="ogg", codec="libopus")
+    else:
+        segment.export(buffer, format=format)
+    return buffer.getvalue()
+
+
+def chunked(data: bytes, size: int) -> Iterator[bytes]:
+    """
+    Splits the data into chunks of at most `size` bytes.
+
+    Args:
+            data (bytes): The data to split.
+            size (int): The maximum size of each chunk.
+
+    Returns:
+            Iterator[bytes]: The chunks.
+    """
+    view = memoryview(data)
+    for i in range(0, len(view), size):
+        yield bytes(view[i : i + size])
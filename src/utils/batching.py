@@ -0,0 +1,114 @@
+"""
+This module contains the `Batcher` used to group concurrent calls into batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from .handlers import get_logger
+
+K = TypeVar("K", bound=Hashable)
+I = TypeVar("I")
+O = TypeVar("O")
+
+logger = get_logger(__name__)
+
+
+class Batcher(Generic[K, I, O]):
+    """
+    Groups items submitted concurrently under the same key into a single call.
+
+    Items are collected for at most `window` seconds or until `max_size` items are
+    pending, then `fn` is called with the key and the list of items and must return
+    one output per item, in order. At most `concurrency` batches run at the same time;
+    items submitted while the batcher is busy keep accumulating into the next batch.
+
+    Attributes:
+            fn (Callable): The batch function.
+            window (float): The collection window in seconds.
+            max_size (int): The maximum number of items per batch.
+            concurrency (int): The maximum number of batches running at once.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[K, list[I]], Awaitable[list[O]]],
+        *,
+        window: float = 0.05,
+        max_size: int = 4,
+        concurrency: int = 1,
+    ) -> None:
+        self.fn = fn
+        self.window = window
+        self.max_size = max_size
+        self.concurrency = concurrency
+        self.running = 0
+        self.pending: dict[K, list[tuple[I, asyncio.Future[O]]]] = {}
+        self.timers: dict[K, asyncio.TimerHandle] = {}
+        self.ready: deque[K] = deque()
+        self.tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, key: K, item: I) -> O:
+        """
+        Submits an item and waits for its output.
+
+        :param key: The key of the batch, only items with equal keys are batched.
+        :param item: The item to process.
+        :return: The output for the item.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[O] = loop.create_future()
+        pending = self.pending.setdefault(key, [])
+        pending.append((item, future))
+        if len(pending) >= self.max_size:
+            self._ready(key)
+        elif key not in self.timers and key not in self.ready:
+            self.timers[key] = loop.call_later(self.window, self._ready, key)
+        return await future
+
+    def _ready(self, key: K) -> None:
+        timer = self.timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        if key not in self.ready:
+            self.ready.append(key)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self.ready and self.running < self.concurrency:
+            key = self.ready.popleft()
+            pending = self.pending.pop(key, [])
+            batch, rest = pending[: self.max_size], pending[self.max_size :]
+            if rest:
+                self.pending[key] = rest
+                self.ready.append(key)
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+            self.running += 1
+            task = asyncio.create_task(self._run(key, batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, key: K, batch: list[tuple[I, asyncio.Future[O]]]) -> None:
+        try:
+            logger.debug("Running batch of %s items for %s", len(batch), key)
+            outputs = await self.fn(key, [item for item, _ in batch])
+            if len(outputs) != len(batch):
+                raise ValueError(
+                    f"Batch function returned {len(outputs)} outputs "
+                    f"for {len(batch)} items"
+                )
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+        except Exception as e:  # pylint: disable=W0718
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self.running -= 1
+            self._dispatch()
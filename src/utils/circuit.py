@@ -0,0 +1,238 @@
+"""
+This module contains the circuit breakers protecting calls to upstream endpoints.
+
+A breaker tracks the outcome of the calls made through it over a rolling window.
+Once at least `min_calls` calls were made and the share of failures reaches
+`failure_rate`, the breaker opens and calls fail right away with a `503` carrying a
+`Retry-After` header instead of waiting for a dead upstream to time out. After
+`open_for` seconds it lets `probes` calls through (half-open): if they succeed the
+breaker closes again, if any fails it reopens.
+
+Defaults come from `CIRCUIT_FAILURE_RATE`, `CIRCUIT_MIN_CALLS`, `CIRCUIT_WINDOW`,
+`CIRCUIT_OPEN_FOR` and `CIRCUIT_PROBES`, and can be overridden per breaker with
+`CIRCUIT_<NAME>_<SETTING>`, e.g. `CIRCUIT_IMAGE_OPEN_FOR=60`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Awaitable, Callable, Coroutine, Literal, TypeVar, cast
+
+from fastapi import HTTPException
+from typing_extensions import ParamSpec
+
+from .handlers import get_logger, is_transient, watch_stream
+from .metrics import Sample, collector, labelled
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+State = Literal["closed", "open", "half-open"]
+STATES: dict[State, int] = {"closed": 0, "half-open": 1, "open": 2}
+
+logger = get_logger(__name__)
+
+
+def _setting(name: str, setting: str, default: float) -> float:
+    return float(
+        os.getenv(
+            f"CIRCUIT_{name.upper()}_{setting}",
+            os.getenv(f"CIRCUIT_{setting}", default),
+        )
+    )
+
+
+class CircuitOpenError(HTTPException):
+    """
+    Raised instead of calling the upstream while its breaker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of an upstream endpoint.
+
+    Attributes:
+            name (str): The name of the upstream.
+            failure_rate (float): Share of failed calls opening the breaker.
+            min_calls (int): Minimum calls in the window before the breaker may open.
+            window (float): Length of the rolling window in seconds.
+            open_for (float): Seconds the breaker stays open before probing.
+            probes (int): Successful calls needed in half-open state to close.
+            is_failure (Callable): Tells whether an exception counts as a failure.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 30,
+        open_for: float = 30,
+        probes: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_transient,
+    ) -> None:
+        self.name = name
+        self.failure_rate = _setting(name, "FAILURE_RATE", failure_rate)
+        self.min_calls = int(_setting(name, "MIN_CALLS", min_calls))
+        self.window = _setting(name, "WINDOW", window)
+        self.open_for = _setting(name, "OPEN_FOR", open_for)
+        self.probes = int(_setting(name, "PROBES", probes))
+        self.is_failure = is_failure
+        self.state: State = "closed"
+        self.opened_at = 0.0
+        self.calls: deque[tuple[float, bool]] = deque()
+        self.failures = 0
+        self.probing = 0
+        self.probed = 0
+        self.rejected = 0
+        self.trips = 0
+
+    def _prune(self, now: float) -> None:
+        while self.calls and self.calls[0][0] < now - self.window:
+            _, failed = self.calls.popleft()
+            self.failures -= failed
+
+    def _open(self, now: float) -> None:
+        self.state, self.opened_at = "open", now
+        self.probing = self.probed = 0
+        self.trips += 1
+        logger.warning("Circuit %s opened", self.name)
+
+    def _close(self) -> None:
+        self.state = "closed"
+        self.calls.clear()
+        self.failures = self.probing = self.probed = 0
+        logger.info("Circuit %s closed", self.name)
+
+    def retry_after(self) -> str:
+        remaining = self.opened_at + self.open_for - time.monotonic()
+        return str(max(1, math.ceil(remaining)))
+
+    def before(self) -> None:
+        """
+        Admits a call, raising `CircuitOpenError` if the breaker does not let it
+        through.
+        """
+        now = time.monotonic()
+        if self.state == "open" and now - self.opened_at >= self.open_for:
+            self.state = "half-open"
+            logger.info("Circuit %s half-open", self.name)
+        if self.state == "open" or (
+            self.state == "half-open" and self.probing >= self.probes
+        ):
+            self.rejected += 1
+            raise CircuitOpenError(
+                status_code=503,
+                detail=f"{self.name} is unavailable",
+                headers={"Retry-After": self.retry_after()},
+            )
+        if self.state == "half-open":
+            self.probing += 1
+
+    def record(self, failed: bool) -> None:
+        """
+        Records the outcome of an admitted call.
+        """
+        now = time.monotonic()
+        if self.state == "half-open":
+            self.probing -= 1
+            if failed:
+                self._open(now)
+                return
+            self.probed += 1
+            if self.probed >= self.probes:
+                self._close()
+            return
+        if self.state == "open":
+            return
+        self.calls.append((now, failed))
+        self.failures += failed
+        self._prune(now)
+        if (
+            len(self.calls) >= self.min_calls
+            and self.failures / len(self.calls) >= self.failure_rate
+        ):
+            self._open(now)
+
+    def settle(self, error: BaseException | None) -> None:
+        """
+        Records how an admitted call ended. Cancelled calls are not recorded, they
+        only give back their probe.
+        """
+        if error is not None and not isinstance(error, Exception):
+            if self.state == "half-open":
+                self.probing -= 1
+            return
+        self.record(error is not None and self.is_failure(error))
+
+    def __call__(self, func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T, T]]:
+        """
+        Decorator running a function through the breaker. A streaming response is
+        only recorded once its body is over, so errors of the upstream stream count.
+        """
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            self.before()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                self.settle(e)
+                raise
+            if not watch_stream(result, self.settle):
+                self.settle(None)
+            return result
+
+        @wraps(func)
+        async def awrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            self.before()
+            try:
+                result = await cast(Awaitable[T], func(*args, **kwargs))
+            except BaseException as e:
+                self.settle(e)
+                raise
+            if not watch_stream(result, self.settle):
+                self.settle(None)
+            return result
+
+        if asyncio.iscoroutinefunction(func):
+            return awrapper
+        return wrapper
+
+    def stats(self) -> dict[str, Any]:
+        self._prune(time.monotonic())
+        return {
+            "state": self.state,
+            "calls": len(self.calls),
+            "failures": self.failures,
+            "failure_rate": self.failures / len(self.calls) if self.calls else 0.0,
+            "rejected": self.rejected,
+            "trips": self.trips,
+        }
+
+
+breakers: dict[str, CircuitBreaker] = {}
+
+
+@collector
+def breaker_samples() -> list[Sample]:
+    stats = {name: breaker.stats() for name, breaker in breakers.items()}
+    for values in stats.values():
+        values["state"] = STATES[values["state"]]
+    return list(labelled("circuit", "breaker", stats))
+
+
+def get_breaker(name: str, **kwargs: Any) -> CircuitBreaker:
+    """
+    Returns the breaker of an upstream, creating it with the given settings.
+    """
+    if name not in breakers:
+        breakers[name] = CircuitBreaker(name, **kwargs)
+    return breakers[name]
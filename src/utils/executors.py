@@ -0,0 +1,81 @@
+"""
+This module contains the registry of named executors used by `asyncify`.
+
+Workloads with very different latencies get their own pools so that a few
+multi-second model calls cannot starve millisecond-scale database lookups:
+
+- `io`: network and file I/O (S3, downloads), `EXECUTOR_IO_WORKERS`, default 32.
+- `db`: RocksDB operations, `EXECUTOR_DB_WORKERS`, default 8.
+- `model`: model loading and inference, `EXECUTOR_MODEL_WORKERS`, default 2.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .metrics import Sample, collector, labelled
+
+DEFAULT_WORKERS: dict[str, int] = {
+    "io": 32,
+    "db": 8,
+    "model": 2,
+}
+
+executors: dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def get_executor(name: str) -> ThreadPoolExecutor:
+    """
+    Returns the executor registered under `name`, creating it on first use.
+
+    :param name: Name of the executor.
+    :return: The executor.
+    """
+    executor = executors.get(name)
+    if executor is not None:
+        return executor
+    if name not in DEFAULT_WORKERS:
+        raise KeyError(f"Executor {name} is not registered")
+    with _lock:
+        if name not in executors:
+            workers = int(
+                os.getenv(f"EXECUTOR_{name.upper()}_WORKERS", DEFAULT_WORKERS[name])
+            )
+            executors[name] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"asyncify-{name}"
+            )
+        return executors[name]
+
+
+def shutdown() -> None:
+    """
+    Shuts down every executor, dropping queued calls and waiting for running ones
+    to finish. Blocking: run it off the event loop.
+    """
+    with _lock:
+        for executor in executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        executors.clear()
+
+
+def stats() -> dict[str, dict[str, Any]]:
+    """
+    Returns the size and backlog of every executor in use.
+    """
+    result: dict[str, dict[str, Any]] = {}
+    for name, executor in executors.items():
+        result[name] = {
+            "max_workers": executor._max_workers,  # pylint: disable=W0212
+            "threads": len(executor._threads),  # pylint: disable=W0212
+            "queued": executor._work_queue.qsize(),  # pylint: disable=W0212
+        }
+    return result
+
+
+@collector
+def executor_samples() -> list[Sample]:
+    return list(labelled("executor", "executor", stats()))
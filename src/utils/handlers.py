@@ -1,22 +1,52 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import json
 import logging
+import os
+import random
 import time
 from functools import partial, wraps
-from typing import Awaitable, Callable, Coroutine, Type, TypeVar, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Type,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from fastapi import HTTPException
 from typing_extensions import ParamSpec
 
+from .executors import get_executor
+from .metrics import histogram
+
 T = TypeVar("T")
 P = ParamSpec("P")
 
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.01"))
+
+function_duration = histogram(
+    "function_duration_seconds",
+    "Duration of functions decorated with handle or timing_handler.",
+    ("function",),
+)
+executor_duration = histogram(
+    "executor_duration_seconds",
+    "Duration of asyncify calls including the wait for a worker.",
+    ("function", "executor"),
+)
+
 
 def get_logger(
     name: str | None = None,
-    level: int = logging.DEBUG,
+    level: int | str = LOG_LEVEL,
     format_string: str = json.dumps(
         {
             "timestamp": "%(asctime)s",
@@ -30,7 +60,8 @@ def get_logger(
     Configures and returns a logger with a specified name, level, and format.
 
     :param name: Name of the logger. If None, the root logger will be configured.
-    :param level: Logging level, e.g., logging.INFO, logging.DEBUG.
+    :param level: Logging level, e.g., logging.INFO, logging.DEBUG, by default
+        `LOG_LEVEL`.
     :param format_string: Format string for log messages.
     :return: Configured logger.
     """
@@ -51,7 +82,8 @@ logger = get_logger()
 
 def exception_handler(func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T, T]]:
     """
-    Decorator to handle exceptions in a function.
+    Decorator to handle exceptions in a function. `HTTPException`s are raised as is,
+    any other exception becomes a 500.
 
     :param func: Function to be decorated.
     :return: Decorated function.
@@ -61,6 +93,8 @@ def exception_handler(func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         try:
             return func(*args, **kwargs)
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("%s: %s", e.__class__.__name__, e)
             raise HTTPException(
@@ -68,10 +102,13 @@ def exception_handler(func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T
                 detail=f"Internal Server Error: {e.__class__.__name__} => {e}",
             ) from e
 
+    @wraps(func)
     async def awrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         try:
             func_ = cast(Awaitable[T], func(*args, **kwargs))
             return await func_
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("%s: %s", e.__class__.__name__, e)
             raise HTTPException(
@@ -84,118 +121,381 @@ def exception_handler(func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T
     return wrapper
 
 
+def trace(name: str, elapsed: int) -> None:
+    """
+    Logs a span for a sampled share (`TRACE_SAMPLE_RATE`) of the calls.
+
+    :param name: Name of the span.
+    :param elapsed: Duration in nanoseconds.
+    """
+    if TRACE_SAMPLE_RATE and random.random() < TRACE_SAMPLE_RATE:
+        logger.info("%s took %s seconds", name, elapsed / 1e9)
+
+
 def timing_handler(func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T, T]]:
     """
-    Decorator to measure the time taken by a function.
+    Decorator to record the time taken by a function in the
+    `function_duration_seconds` histogram.
 
     :param func: Function to be decorated.
     :return: Decorated function.
     """
+    name = func.__qualname__
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        start = time.time()
-        result = func(*args, **kwargs)
-        end = time.time()
-        logger.info("%s took %s seconds", func.__name__, end - start)
-        return result
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            function_duration.observe(elapsed, name)
+            trace(name, elapsed)
 
+    @wraps(func)
     async def awrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        start = time.time()
-        func_ = cast(Awaitable[T], func(*args, **kwargs))
-        result = await func_
-        end = time.time()
-        logger.info("%s took %s seconds", func.__name__, end - start)
-        return result
+        start = time.perf_counter_ns()
+        try:
+            func_ = cast(Awaitable[T], func(*args, **kwargs))
+            return await func_
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            function_duration.observe(elapsed, name)
+            trace(name, elapsed)
 
     if asyncio.iscoroutinefunction(func):
         return awrapper
     return wrapper
 
 
+TRANSIENT_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def status_code(e: BaseException) -> int | None:
+    """
+    Returns the HTTP status code carried by an exception from FastAPI, httpx or
+    botocore, if any.
+    """
+    if isinstance(e, HTTPException):
+        return e.status_code
+    response = getattr(e, "response", None)
+    if response is None:
+        return None
+    if isinstance(response, dict):
+        return response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return getattr(response, "status_code", None)
+
+
+def retry_after(e: BaseException) -> float | None:
+    """
+    Returns the delay requested by the `Retry-After` header of a failed response.
+    """
+    headers = getattr(e, "headers", None) or getattr(
+        getattr(e, "response", None), "headers", None
+    )
+    try:
+        return float(headers["Retry-After"]) if headers else None
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def is_transient(e: BaseException) -> bool:
+    """
+    Default retry predicate: connection errors, timeouts and 408/429/5xx responses.
+    """
+    if isinstance(e, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    if e.__class__.__name__ in ("TransportError", "EndpointConnectionError") or any(
+        cls.__name__ in ("TransportError", "HTTPClientError")
+        for cls in e.__class__.__mro__
+    ):
+        return True
+    return status_code(e) in TRANSIENT_STATUS
+
+
+class WatchedBody:
+    """
+    Body iterator of a streaming response telling when the stream is over.
+
+    `done` is called exactly once: with None when the body is exhausted, with the
+    exception raised while producing it, or with `asyncio.CancelledError` when the
+    body is closed, cancelled or dropped before its end (client gone, response never
+    sent).
+    """
+
+    def __init__(
+        self, body: Any, done: Callable[[BaseException | None], None]
+    ) -> None:
+        self.body: AsyncIterator[Any] = aiter(body)
+        self.done = done
+        self.finished = False
+
+    def finish(self, error: BaseException | None) -> None:
+        if not self.finished:
+            self.finished = True
+            self.done(error)
+
+    def __aiter__(self) -> WatchedBody:
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await self.body.__anext__()
+        except StopAsyncIteration:
+            self.finish(None)
+            raise
+        except Exception as e:
+            self.finish(e)
+            raise
+        except BaseException:
+            self.finish(asyncio.CancelledError())
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            aclose = getattr(self.body, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        finally:
+            self.finish(asyncio.CancelledError())
+
+    def __del__(self) -> None:
+        self.finish(asyncio.CancelledError())
+
+
+def watch_stream(response: Any, done: Callable[[BaseException | None], None]) -> bool:
+    """
+    Calls `done` once the body of a streaming response is over, see `WatchedBody`.
+
+    :param response: The value returned by a handler.
+    :param done: Callback receiving the exception that ended the stream, if any.
+    :return: Whether the response streams; if not, `done` is never called.
+    """
+    body = getattr(response, "body_iterator", None)
+    if body is None:
+        return False
+    response.body_iterator = WatchedBody(body, done)
+    return True
+
+
+_sleep = asyncio.sleep
+
+
+def backoff(attempt: int, delay: float, max_delay: float) -> float:
+    """
+    Full jitter backoff: a random delay between 0 and `delay * 2 ** attempt`,
+    capped at `max_delay`.
+    """
+    return random.uniform(0, min(max_delay, delay * 2**attempt))
+
+
 def retry_handler(
-    func: Callable[P, T], retries: int = 3, delay: int = 1
-) -> Callable[P, T | Coroutine[None, T, T]]:
+    func: Callable[P, T] | None = None,
+    *,
+    retries: int = 3,
+    delay: float = 1,
+    max_delay: float = 30,
+    max_elapsed: float | None = None,
+    retry_on: Callable[[BaseException], bool] = is_transient,
+    idempotent: bool = False,
+):
     """
-    Decorator to retry a function with exponential backoff.
+    Decorator to retry a function with exponential backoff and full jitter.
+
+    Only calls marked `idempotent` are retried, and only on exceptions matching
+    `retry_on`; anything else is raised right away. Each call keeps its own backoff
+    state, and gives up once `retries` attempts are exhausted or the next wait would
+    exceed `max_elapsed` seconds. A `Retry-After` on the failed response raises the
+    wait to at least that many seconds.
 
     :param func: Function to be decorated.
-    :param retries: Number of retries.
-    :param delay: Delay between retries.
+    :param retries: Maximum number of retries.
+    :param delay: Base delay between retries.
+    :param max_delay: Maximum delay between retries.
+    :param max_elapsed: Maximum seconds spent on a call including retries.
+    :param retry_on: Predicate telling whether an exception is worth retrying.
+    :param idempotent: Whether the function is safe to call more than once.
     :return: Decorated function.
     """
 
-    @wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        nonlocal delay
-        for _ in range(retries):
-            try:
-                return func(*args, **kwargs)
-            except (Exception, HTTPException) as e:
-                logger.error("%s: %s", e.__class__.__name__, e)
-                time.sleep(delay)
-                delay *= 2
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Internal Server Error: {e.__class__.__name__} => {e}",
-                ) from e
-        raise HTTPException(
-            status_code=500,
-            detail="Exhausted retries",
-        )
-
-    @wraps(func)
-    async def awrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        nonlocal delay
-        for _ in range(retries):
-            try:
-                func_ = cast(Awaitable[T], func(*args, **kwargs))
-                return await func_
-            except (Exception, HTTPException) as e:
-                logger.error("%s: %s", e.__class__.__name__, e)
-                await asyncio.sleep(delay)
-                delay *= 2
-        raise HTTPException(
-            status_code=500,
-            detail="Exhausted retries",
-        )
-
-    if asyncio.iscoroutinefunction(func):
-        return awrapper
-    return wrapper
+    def decorator(func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T, T]]:
+        def wait(attempt: int, start: float, e: Exception) -> float | None:
+            if not idempotent or attempt >= retries or not retry_on(e):
+                return None
+            seconds = max(backoff(attempt, delay, max_delay), retry_after(e) or 0)
+            elapsed = time.monotonic() - start + seconds
+            if max_elapsed is not None and elapsed > max_elapsed:
+                return None
+            logger.warning(
+                "Retrying %s in %.2fs after %s: %s",
+                func.__name__,
+                seconds,
+                e.__class__.__name__,
+                e,
+            )
+            return seconds
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            start = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    seconds = wait(attempt, start, e)
+                    if seconds is None:
+                        raise
+                time.sleep(seconds)
+                attempt += 1
+
+        @wraps(func)
+        async def awrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            start = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    func_ = cast(Awaitable[T], func(*args, **kwargs))
+                    return await func_
+                except Exception as e:
+                    seconds = wait(attempt, start, e)
+                    if seconds is None:
+                        raise
+                await _sleep(seconds)
+                attempt += 1
+
+        if asyncio.iscoroutinefunction(func):
+            return awrapper
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
 
 
 def handle(
-    func: Callable[P, T], retries: int = 3, delay: int = 1
-) -> Callable[P, T | Coroutine[None, T, T]]:
+    func: Callable[P, T] | None = None,
+    *,
+    retries: int = 3,
+    delay: float = 1,
+    max_elapsed: float | None = None,
+    retry_on: Callable[[BaseException], bool] = is_transient,
+    idempotent: bool = False,
+    breaker: str | None = None,
+    is_failure: Callable[[BaseException], bool] | None = None,
+):
     """
     Decorator to retry a function with exponential backoff and handle exceptions.
 
+    Works both bare (`@handle`) and with options (`@handle(idempotent=True)`); see
+    `retry_handler` for the retry options. With a `breaker`, every attempt goes
+    through the circuit breaker of that name, and calls rejected by an open breaker
+    are not retried. Failures raised while a streaming response is consumed count
+    for the call that returned it.
+
     :param func: Function to be decorated.
-    :param retries: Number of retries.
-    :param delay: Delay between retries.
+    :param retries: Maximum number of retries.
+    :param delay: Base delay between retries.
+    :param max_elapsed: Maximum seconds spent on a call including retries.
+    :param retry_on: Predicate telling whether an exception is worth retrying.
+    :param idempotent: Whether the function is safe to call more than once.
+    :param breaker: Name of the circuit breaker of the upstream called.
+    :param is_failure: Predicate telling whether an exception counts as a failure of
+        the upstream for its breaker, `retry_on` by default.
     :return: Decorated function.
     """
-    eb = partial(retry_handler, retries=retries, delay=delay)
-    return cast(
-        Callable[P, T | Coroutine[None, T, T]],
-        timing_handler(exception_handler(eb(func))),
+    if breaker is not None:
+        from .circuit import CircuitOpenError  # pylint: disable=C0415
+
+        retryable = retry_on
+
+        def retry_on(e: BaseException) -> bool:  # pylint: disable=E0102
+            return not isinstance(e, CircuitOpenError) and retryable(e)
+
+    eb = partial(
+        retry_handler,
+        retries=retries,
+        delay=delay,
+        max_elapsed=max_elapsed,
+        retry_on=retry_on,
+        idempotent=idempotent,
+    )
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T | Coroutine[None, T, T]]:
+        if breaker is not None:
+            from .circuit import get_breaker  # pylint: disable=C0415
+
+            func = get_breaker(breaker, is_failure=is_failure or retry_on)(func)
+        return cast(
+            Callable[P, T | Coroutine[None, T, T]],
+            timing_handler(exception_handler(eb(func))),
+        )
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+async def run_in_executor(
+    name: str | None, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """
+    Runs a synchronous function in the named executor.
+
+    :param name: Name of the executor, None for the default `asyncio.to_thread` pool.
+    :param func: Synchronous function to run.
+    :return: The result of the function.
+    """
+    if name is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_executor(name), partial(ctx.run, func, *args, **kwargs)
     )
 
 
-def asyncify(func: Callable[P, T]) -> Callable[P, Coroutine[None, T, T]]:
+@overload
+def asyncify(func: Callable[P, T]) -> Callable[P, Coroutine[None, T, T]]: ...
+
+
+@overload
+def asyncify(
+    func: str | None = None,
+) -> Callable[[Callable[P, T]], Callable[P, Coroutine[None, T, T]]]: ...
+
+
+def asyncify(func=None):  # type: ignore
     """
     Decorator to convert a synchronous function to an asynchronous function.
 
-    :param func: Synchronous function to be decorated.
+    Used bare, the function runs in the default `asyncio.to_thread` pool; given the
+    name of an executor, e.g. `@asyncify("db")`, it runs in that executor.
+
+    :param func: Synchronous function to be decorated, or the name of an executor.
     :return: Asynchronous function.
     """
+    name = func if isinstance(func, str) or func is None else None
 
-    @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        return await asyncio.to_thread(func, *args, **kwargs)
+    def decorator(func_: Callable[P, T]) -> Callable[P, Coroutine[None, T, T]]:
+        qualname = getattr(func_, "__qualname__", repr(func_))
+        executor = name or "default"
 
-    return wrapper
+        @wraps(func_)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            start = time.perf_counter_ns()
+            try:
+                return await run_in_executor(name, func_, *args, **kwargs)
+            finally:
+                executor_duration.observe(
+                    time.perf_counter_ns() - start, qualname, executor
+                )
+
+        return wrapper
+
+    if callable(func):
+        return decorator(func)
+    return decorator
 
 
 def singleton(cls: Type[T]) -> Type[T]:
@@ -0,0 +1,33 @@
+"""
+This module contains the process-wide HTTP client used to call upstream services.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+import httpx
+
+MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared `httpx.AsyncClient`, keeping connections to upstream services
+    alive across requests instead of opening a new pool per call.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE
+        ),
+        timeout=httpx.Timeout(10.0),
+    )
+
+
+async def close_http_client() -> None:
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
@@ -0,0 +1,196 @@
+"""
+This module contains the in-process metrics exported at `/metrics` in the
+Prometheus text format.
+
+Latencies are recorded as `perf_counter_ns` durations into `Histogram`s. Every
+thread writes to its own shard of counters, so recording takes no lock; shards are
+only summed when the metrics are scraped. Components holding their own statistics
+(storage, queues, gates, models, breakers, executors) register a `collector`
+returning `(name, labels, value)` samples, read at scrape time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
+
+Sample = tuple[str, dict[str, str], float]
+
+BUCKETS: tuple[float, ...] = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+    return "{" + pairs + "}"
+
+
+class Histogram:
+    """
+    Latency histogram with per-thread shards.
+
+    Attributes:
+            name (str): The metric name, in seconds.
+            help (str): The metric description.
+            labels (tuple[str, ...]): The label names.
+            buckets (tuple[float, ...]): The upper bounds of the buckets in seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,  # pylint: disable=W0622
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self.bounds = [int(b * 1e9) for b in buckets]
+        self.local = threading.local()
+        self.shards: list[dict[tuple[str, ...], list[int]]] = []
+        self.lock = threading.Lock()
+
+    def _shard(self) -> dict[tuple[str, ...], list[int]]:
+        shard: dict[tuple[str, ...], list[int]] = {}
+        self.local.shard = shard
+        with self.lock:
+            self.shards.append(shard)
+        return shard
+
+    def observe(self, ns: int, *values: str) -> None:
+        """
+        Records a duration in nanoseconds for the given label values.
+        """
+        shard = getattr(self.local, "shard", None)
+        if shard is None:
+            shard = self._shard()
+        counts = shard.get(values)
+        if counts is None:
+            counts = shard[values] = [0] * (len(self.bounds) + 2)
+        counts[bisect_left(self.bounds, ns)] += 1
+        counts[-1] += ns
+
+    @contextmanager
+    def time(self, *values: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter_ns() - start, *values)
+
+    def merged(self) -> dict[tuple[str, ...], list[int]]:
+        merged: dict[tuple[str, ...], list[int]] = {}
+        with self.lock:
+            shards = list(self.shards)
+        for shard in shards:
+            for values, counts in list(shard.items()):
+                total = merged.setdefault(values, [0] * len(counts))
+                for i, count in enumerate(list(counts)):
+                    total[i] += count
+        return merged
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for values, counts in self.merged().items():
+            labels = dict(zip(self.labels, values))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = _labels({**labels, "le": str(bound)})
+                yield f"{self.name}_bucket{le} {cumulative}"
+            yield f"{self.name}_sum{_labels(labels)} {counts[-1] / 1e9}"
+            yield f"{self.name}_count{_labels(labels)} {cumulative}"
+
+
+histograms: dict[str, Histogram] = {}
+collectors: list[Callable[[], Iterable[Sample]]] = []
+_lock = threading.Lock()
+
+
+def histogram(
+    name: str, help: str, labels: tuple[str, ...] = ()  # pylint: disable=W0622
+) -> Histogram:
+    """
+    Returns the histogram registered under `name`, creating it on first use.
+    """
+    if name not in histograms:
+        with _lock:
+            histograms.setdefault(name, Histogram(name, help, labels))
+    return histograms[name]
+
+
+def collector(
+    func: Callable[[], Iterable[Sample]]
+) -> Callable[[], Iterable[Sample]]:
+    """
+    Decorator to register a function returning samples read at scrape time.
+    Samples whose name ends with `_total` are exported as counters, the rest as
+    gauges.
+    """
+    collectors.append(func)
+    return func
+
+
+def labelled(
+    prefix: str, label: str, stats: dict[str, dict[str, Any]]
+) -> Iterator[Sample]:
+    """
+    Turns `{entity: {field: number}}` statistics into `<prefix>_<field>` samples
+    labelled with the entity.
+    """
+    for entity, fields in stats.items():
+        for field, value in fields.items():
+            if isinstance(value, (int, float)):
+                yield f"{prefix}_{field}", {label: str(entity)}, float(value)
+
+
+def render() -> str:
+    """
+    Renders every histogram and collector in the Prometheus text format.
+    """
+    lines: list[str] = []
+    for hist in list(histograms.values()):
+        lines.extend(hist.render())
+    samples: dict[str, list[tuple[dict[str, str], float]]] = {}
+    for collect in collectors:
+        for name, labels, value in collect():
+            samples.setdefault(name, []).append((labels, value))
+    for name, values in samples.items():
+        kind = "counter" if name.endswith("_total") else "gauge"
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f"{name}{_labels(labels)} {value}" for labels, value in values)
+    return "\n".join(lines) + "\n"
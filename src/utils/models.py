@@ -0,0 +1,299 @@
+"""
+This module contains the `ModelRegistry` used to load ML models lazily.
+
+Heavy models (Whisper, MusicGen, tokenizers) are registered by name together with a
+loader function and are only materialized on first use, or eagerly at startup when
+listed in the `MODEL_WARMUP` environment variable (comma separated, `*` for all).
+
+The registry also manages residency: loaded models are tracked with their memory
+footprint and, when `MODEL_MEMORY_BUDGET` (in MB) is set, the least recently used
+models that are not in use are unloaded to make room for a new one.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from .handlers import asyncify, get_logger
+from .metrics import Sample, collector, labelled
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
+MB = 1024 * 1024
+
+
+def footprint(model: Any) -> int:
+    """
+    Estimates the memory held by a model in bytes.
+
+    Sums parameters and buffers of the model if it is a `torch.nn.Module`, or of the
+    modules it holds as attributes otherwise (e.g. `MusicGen.lm`).
+
+    :param model: The loaded model.
+    :return: The estimated size in bytes, 0 if it cannot be determined.
+    """
+    modules = [model] if hasattr(model, "parameters") else []
+    if not modules:
+        modules = [
+            value
+            for value in getattr(model, "__dict__", {}).values()
+            if hasattr(value, "parameters") and hasattr(value, "buffers")
+        ]
+    size = 0
+    for module in modules:
+        try:
+            tensors = list(module.parameters()) + list(module.buffers())
+        except TypeError:
+            continue
+        size += sum(t.numel() * t.element_size() for t in tensors)
+    return size
+
+
+@dataclass
+class ModelEntry:
+    """
+    A registered model and its residency statistics.
+
+    Attributes:
+            name (str): The name the model is registered under.
+            loader (Callable[[], Any]): Function that loads and returns the model.
+            size_hint (int): Expected size in bytes, used before the first load.
+            instance (Any): The loaded model, or None if it is not loaded.
+            size (int): Measured size in bytes of the loaded model.
+            load_time (float): Seconds spent in the last load.
+            loads (int): Number of times the model has been loaded.
+            evictions (int): Number of times the model has been unloaded.
+            hits (int): Number of accesses served by the resident model.
+            pins (int): Number of callers currently using the model.
+            last_used (float): Monotonic timestamp of the last access.
+            exclusive (threading.Lock): Held by callers of `use(exclusive=True)`.
+    """
+
+    name: str
+    loader: Callable[[], Any]
+    size_hint: int = 0
+    instance: Any = None
+    size: int = 0
+    load_time: float = 0.0
+    loads: int = 0
+    evictions: int = 0
+    hits: int = 0
+    pins: int = 0
+    last_used: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    exclusive: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def loaded(self) -> bool:
+        return self.instance is not None
+
+    @property
+    def expected_size(self) -> int:
+        return self.size or self.size_hint
+
+
+class ModelRegistry:
+    """
+    A process-wide registry of lazily loaded models with an optional memory budget.
+    """
+
+    def __init__(self, budget: int | None = None) -> None:
+        if budget is None:
+            budget = int(float(os.getenv("MODEL_MEMORY_BUDGET", "0")) * MB)
+        self.budget = budget
+        self.entries: dict[str, ModelEntry] = {}
+        self.lock = threading.RLock()
+
+    def register(
+        self, name: str, *, size_hint: int = 0
+    ) -> Callable[[Callable[[], T]], Callable[[], T]]:
+        """
+        Decorator to register a loader function under the given name.
+
+        :param name: Name of the model.
+        :param size_hint: Expected size of the model in MB, used before the first load.
+        :return: Decorator returning the loader unchanged.
+        """
+
+        def decorator(loader: Callable[[], T]) -> Callable[[], T]:
+            self.entries[name] = ModelEntry(
+                name=name, loader=loader, size_hint=size_hint * MB
+            )
+            return loader
+
+        return decorator
+
+    @property
+    def resident(self) -> int:
+        """
+        Total size in bytes of the loaded models.
+        """
+        return sum(e.size for e in self.entries.values() if e.loaded)
+
+    def get(self, name: str) -> Any:
+        """
+        Returns the model registered under `name`, loading it on first use.
+
+        :param name: Name of the model.
+        :return: The loaded model.
+        """
+        entry = self.entries.get(name)
+        if entry is None:
+            raise KeyError(f"Model {name} is not registered")
+        entry.last_used = time.monotonic()
+        instance = entry.instance
+        if instance is not None:
+            entry.hits += 1
+            return instance
+        with entry.lock:
+            if entry.instance is None:
+                self._reserve(entry)
+                logger.info("Loading model %s", name)
+                start = time.perf_counter()
+                entry.instance = entry.loader()
+                entry.load_time = time.perf_counter() - start
+                entry.size = footprint(entry.instance) or entry.size_hint
+                entry.loads += 1
+                logger.info(
+                    "Loaded model %s (%.0f MB) in %.2f seconds",
+                    name,
+                    entry.size / MB,
+                    entry.load_time,
+                )
+            return entry.instance
+
+    @asyncify("model")
+    def aget(self, name: str) -> Any:
+        """
+        Returns the model registered under `name` without blocking the event loop.
+        """
+        return self.get(name)
+
+    @contextmanager
+    def use(self, name: str, exclusive: bool = False) -> Iterator[Any]:
+        """
+        Context manager that pins the model so it is not unloaded while in use.
+
+        :param name: Name of the model.
+        :param exclusive: Whether to wait until no other exclusive caller uses the
+            model, for callers changing its shared state.
+        :return: The loaded model.
+        """
+        entry = self.entries[name]
+        with self.lock:
+            entry.pins += 1
+        try:
+            if exclusive:
+                with entry.exclusive:
+                    yield self.get(name)
+            else:
+                yield self.get(name)
+        finally:
+            with self.lock:
+                entry.pins -= 1
+            entry.last_used = time.monotonic()
+
+    def _reserve(self, entry: ModelEntry) -> None:
+        """
+        Unloads least recently used models until `entry` fits in the budget.
+        """
+        if not self.budget:
+            return
+        with self.lock:
+            candidates = sorted(
+                (
+                    e
+                    for e in self.entries.values()
+                    if e.loaded and e is not entry and not e.pins
+                ),
+                key=lambda e: e.last_used,
+            )
+            for candidate in candidates:
+                if self.resident + entry.expected_size <= self.budget:
+                    break
+                self.unload(candidate.name)
+            if self.resident + entry.expected_size > self.budget:
+                logger.warning(
+                    "Loading model %s exceeds the memory budget (%.0f/%.0f MB)",
+                    entry.name,
+                    (self.resident + entry.expected_size) / MB,
+                    self.budget / MB,
+                )
+
+    def unload(self, name: str) -> None:
+        """
+        Unloads the model registered under `name` and releases its memory.
+
+        :param name: Name of the model.
+        """
+        entry = self.entries[name]
+        with self.lock:
+            if entry.instance is None or entry.pins:
+                return
+            entry.instance = None
+            entry.evictions += 1
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        logger.info("Unloaded model %s (%.0f MB)", name, entry.size / MB)
+
+    def warmup(self, names: Iterable[str] | None = None) -> None:
+        """
+        Eagerly loads the given models, by default those listed in `MODEL_WARMUP`.
+
+        :param names: Names of the models to load, `*` loads every registered model.
+        """
+        if names is None:
+            names = [
+                n.strip() for n in os.getenv("MODEL_WARMUP", "").split(",") if n.strip()
+            ]
+        names = list(names)
+        if "*" in names:
+            names = list(self.entries)
+        for name in names:
+            self.get(name)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the residency and loading statistics of every registered model.
+        """
+        return {
+            "budget": self.budget,
+            "resident": self.resident,
+            "models": {
+                name: {
+                    "loaded": entry.loaded,
+                    "size": entry.size,
+                    "load_time": entry.load_time,
+                    "loads": entry.loads,
+                    "evictions": entry.evictions,
+                    "hits": entry.hits,
+                    "pins": entry.pins,
+                    "last_used": entry.last_used,
+                }
+                for name, entry in self.entries.items()
+            },
+        }
+
+
+models = ModelRegistry()
+
+
+@collector
+def model_samples() -> list[Sample]:
+    stats = models.stats()
+    return [
+        ("models_budget_bytes", {}, stats["budget"] or 0),
+        ("models_resident_bytes", {}, stats["resident"]),
+        *labelled("model", "model", stats["models"]),
+    ]
@@ -0,0 +1,143 @@
+"""
+This module contains the event loop blocking detector, enabled with `LOOP_MONITOR=1`.
+
+A heartbeat coroutine wakes up every `LOOP_MONITOR_INTERVAL` seconds and records how
+late it was in the `event_loop_lag_seconds` histogram. A watchdog thread checks the
+heartbeat: when it is older than `LOOP_MONITOR_THRESHOLD` seconds the loop is stuck
+in a callback, so the watchdog captures the stack of the loop thread, logs it once
+per blocking episode and counts it in `event_loop_blocks_total`, labelled with the
+innermost frame of our own code.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from .handlers import get_logger
+from .metrics import Sample, collector, histogram
+
+logger = get_logger(__name__)
+
+lag = histogram("event_loop_lag_seconds", "Delay of the event loop heartbeat.")
+blocked = histogram(
+    "event_loop_blocked_seconds",
+    "Duration of callbacks blocking the event loop over the threshold.",
+    ("site",),
+)
+
+
+def _site(frame: Any) -> str:
+    """
+    Returns the innermost frame of the application in a stack, or its leaf frame.
+    """
+    leaf = frame
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith("src."):
+            break
+        frame = frame.f_back
+    frame = frame or leaf
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_name}:{frame.f_lineno}"
+
+
+class LoopMonitor:
+    """
+    Detects callbacks blocking the event loop.
+
+    Attributes:
+            interval (float): Seconds between heartbeats.
+            threshold (float): Seconds without heartbeat after which the loop is
+                considered blocked.
+    """
+
+    def __init__(self, interval: float = 0.05, threshold: float = 0.1) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.beat = time.monotonic()
+        self.blocks: dict[str, int] = {}
+        self.loop_thread: int | None = None
+        self.heartbeat: asyncio.Task[None] | None = None
+        self.watchdog: threading.Thread | None = None
+        self.stopped = threading.Event()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            start = time.perf_counter_ns()
+            await asyncio.sleep(self.interval)
+            late = time.perf_counter_ns() - start - int(self.interval * 1e9)
+            lag.observe(max(0, late))
+            self.beat = time.monotonic()
+
+    def _watch(self) -> None:
+        site: str | None = None
+        since = 0.0
+        while not self.stopped.wait(self.interval):
+            stalled = time.monotonic() - self.beat
+            if stalled < self.threshold:
+                if site is not None:
+                    blocked.observe(int((time.monotonic() - since) * 1e9), site)
+                    site = None
+                continue
+            if site is not None or self.loop_thread is None:
+                continue
+            frame = sys._current_frames().get(self.loop_thread)  # pylint: disable=W0212
+            if frame is None:
+                continue
+            site, since = _site(frame), self.beat
+            self.blocks[site] = self.blocks.get(site, 0) + 1
+            logger.warning(
+                "Event loop blocked for %.3fs at %s:\n%s",
+                stalled,
+                site,
+                "".join(traceback.format_stack(frame)),
+            )
+
+    def start(self) -> None:
+        """
+        Starts the heartbeat on the running loop and the watchdog thread.
+        """
+        if self.heartbeat is not None:
+            return
+        self.loop_thread = threading.get_ident()
+        self.beat = time.monotonic()
+        self.stopped.clear()
+        self.heartbeat = asyncio.create_task(self._heartbeat())
+        self.watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self.watchdog.start()
+        logger.info("Monitoring the event loop, threshold %ss", self.threshold)
+
+    async def stop(self) -> None:
+        self.stopped.set()
+        if self.heartbeat is not None:
+            self.heartbeat.cancel()
+            await asyncio.gather(self.heartbeat, return_exceptions=True)
+            self.heartbeat = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "threshold": self.threshold,
+            "blocks": dict(self.blocks),
+        }
+
+
+monitor = LoopMonitor(
+    interval=float(os.getenv("LOOP_MONITOR_INTERVAL", "0.05")),
+    threshold=float(os.getenv("LOOP_MONITOR_THRESHOLD", "0.1")),
+)
+
+
+@collector
+def monitor_samples() -> list[Sample]:
+    return [
+        ("event_loop_blocks_total", {"site": site}, count)
+        for site, count in monitor.blocks.items()
+    ]
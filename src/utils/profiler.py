@@ -0,0 +1,130 @@
+"""
+This module contains a statistical profiler sampling the stacks of every thread of
+the running process, including the `asyncify` executors, and a probe of the event
+loop lag.
+
+Stacks are aggregated as collapsed stacks (`thread;module:function;... count`), the
+input format of flamegraph.pl and speedscope. In `wall` mode every thread is sampled
+at every tick; in `cpu` mode only threads that used CPU time since the previous tick
+are, so idle workers waiting for jobs do not drown the profile.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Literal
+
+Mode = Literal["wall", "cpu"]
+
+IDLE = frozenset(
+    {
+        "wait",
+        "select",
+        "poll",
+        "_worker",
+        "accept",
+        "recv",
+        "recv_into",
+        "sleep",
+    }
+)
+
+
+def _thread_names() -> dict[int, str]:
+    return {
+        t.ident: re.sub(r"_\d+$", "", t.name)
+        for t in threading.enumerate()
+        if t.ident is not None
+    }
+
+
+def _cpu_time(ident: int) -> float | None:
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError):
+        return None
+
+
+def _stack(frame: FrameType | None) -> list[str]:
+    stack: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        stack.append(f"{module}:{code.co_name}")
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def sample(
+    seconds: float, interval: float = 0.005, mode: Mode = "wall"
+) -> tuple[Counter[str], int]:
+    """
+    Samples the stacks of every other thread for `seconds`.
+
+    :param seconds: Duration of the profile.
+    :param interval: Seconds between samples.
+    :param mode: `wall` to sample every thread, `cpu` to sample only running ones.
+    :return: The collapsed stacks with their sample counts, and the number of ticks.
+    """
+    me = threading.get_ident()
+    stacks: Counter[str] = Counter()
+    cpu: dict[int, float | None] = {}
+    names = _thread_names()
+    ticks = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        ticks += 1
+        if ticks % 100 == 0:
+            names = _thread_names()
+        for ident, frame in sys._current_frames().items():  # pylint: disable=W0212
+            if ident == me:
+                continue
+            if mode == "cpu":
+                used, last = _cpu_time(ident), cpu.get(ident)
+                cpu[ident] = used
+                if used is None:
+                    if frame.f_code.co_name in IDLE:
+                        continue
+                elif last is None or used <= last:
+                    continue
+            name = names.get(ident, f"thread-{ident}")
+            stacks[";".join([name, *_stack(frame)])] += 1
+        time.sleep(interval)
+    return stacks, ticks
+
+
+def collapsed(stacks: Counter[str]) -> str:
+    """
+    Formats collapsed stacks, one `stack count` line per stack.
+    """
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+async def loop_lag(seconds: float, interval: float = 0.01) -> dict[str, Any]:
+    """
+    Measures how late the event loop wakes up from `interval` second sleeps.
+
+    :param seconds: Duration of the measure.
+    :param interval: Seconds between probes.
+    :return: The number of probes and the mean, p99 and max lag in seconds.
+    """
+    lags: list[float] = []
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - start - interval))
+    lags.sort()
+    return {
+        "probes": len(lags),
+        "mean": sum(lags) / len(lags) if lags else 0.0,
+        "p99": lags[int(len(lags) * 0.99)] if lags else 0.0,
+        "max": lags[-1] if lags else 0.0,
+    }
@@ -0,0 +1,124 @@
+"""
+This module contains the response classes of the API.
+
+JSON is rendered with orjson (`ORJSONResponse` is the app's default response class),
+documents read from RocksDB can be sent as their stored bytes with `RawJSONResponse`,
+and clients sending `Accept: application/msgpack` get msgpack instead of JSON from
+routes using `NegotiatedRoute`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Coroutine, Iterable
+
+import msgpack
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+class RawJSONResponse(Response):
+    """
+    A JSON response whose content is already serialized: a single document's bytes,
+    or an iterable of document bytes sent as a JSON array.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: bytes | Iterable[bytes]) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return b"[" + b",".join(content) + b"]"
+
+
+class MsgPackResponse(Response):
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+def accepted(accept: str) -> dict[str, float]:
+    """
+    Parses an `Accept` header into the quality of each media type.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept.split(","):
+        media_type, *params = (part.strip() for part in item.split(";"))
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type.lower()] = quality
+    return qualities
+
+
+def wants_msgpack(request: Request) -> bool:
+    """
+    Tells whether the client accepts msgpack at least as much as JSON.
+    """
+    qualities = accepted(request.headers.get("Accept", ""))
+    msgpack_q = max((qualities.get(t, 0.0) for t in MSGPACK_TYPES), default=0.0)
+    json_q = next(
+        (
+            qualities[t]
+            for t in ("application/json", "application/*", "*/*")
+            if t in qualities
+        ),
+        0.0,
+    )
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    A route answering with msgpack instead of JSON when the client asks for it.
+
+    The return value of the endpoint is packed directly. Only responses the endpoint
+    built itself, like `RawJSONResponse`, are decoded to be re-encoded; streaming
+    and non-JSON responses are sent unchanged.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        response_class = self.response_class
+        self.response_class = MsgPackResponse
+        try:
+            msgpack_handler = super().get_route_handler()
+        finally:
+            self.response_class = response_class
+
+        async def route_handler(request: Request) -> Response:
+            if not wants_msgpack(request):
+                response = await handler(request)
+                if response.media_type == "application/json":
+                    response.headers.append("Vary", "Accept")
+                return response
+            response = await msgpack_handler(request)
+            if response.media_type == "application/json" and hasattr(
+                response, "body"
+            ):
+                headers = {
+                    k: v
+                    for k, v in response.headers.items()
+                    if k not in ("content-length", "content-type")
+                }
+                response = MsgPackResponse(
+                    orjson.loads(response.body),
+                    status_code=response.status_code,
+                    headers=headers,
+                    background=response.background,
+                )
+            if response.media_type in (*MSGPACK_TYPES, "application/json"):
+                response.headers.append("Vary", "Accept")
+            return response
+
+        return route_handler
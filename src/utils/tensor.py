@@ -5,13 +5,15 @@ This module contains utility functions and decorators.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import numpy as np
-import torch
 from numpy import ndarray
 from typing_extensions import ParamSpec
 
+if TYPE_CHECKING:
+    import torch
+
 T = TypeVar("T")
 P = ParamSpec("P")
 
@@ -61,7 +63,23 @@ def detach(tensor: torch.Tensor) -> torch.Tensor:
             torch.Tensor: The detached tensor.
 
     """
-    return torch.Tensor(tensor.detach().cpu().numpy())
+    return tensor.detach().cpu()
+
+
+def to_tensor(samples: ndarray[np.float32, Any]) -> torch.Tensor:
+    """
+    Wraps float32 samples of shape (channels, samples) in a (1, channels, samples)
+    tensor sharing the same memory.
+
+    Args:
+            samples (ndarray): The float32 audio samples.
+
+    Returns:
+            torch.Tensor: The tensor view of the samples.
+    """
+    import torch  # pylint: disable=C0415,W0621
+
+    return torch.from_numpy(samples)[None]
 
 
 def flat(tensor: torch.Tensor) -> ndarray[np.float32, Any]:
@@ -0,0 +1,28 @@
+"""
+Shared fixtures of the tests.
+"""
+
+from typing import Callable
+
+import pytest
+
+
+class Streaming:
+    """
+    A streaming response whose `body_iterator` yields one chunk, then raises `error`
+    if given.
+    """
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.body_iterator = self.chunks(error)
+
+    @staticmethod
+    async def chunks(error: Exception | None):
+        yield b"chunk"
+        if error is not None:
+            raise error
+
+
+@pytest.fixture
+def streaming() -> Callable[..., Streaming]:
+    return Streaming
@@ -0,0 +1,122 @@
+"""
+Tests of the admission gates of tasks.
+"""
+
+import asyncio
+import gc
+
+import pytest
+from fastapi import HTTPException
+
+from src.utils.admission import Gate, admission
+
+
+def test_rejects_beyond_the_queue_cap():
+    async def main():
+        gate = Gate("test", limit=1, max_queue=0)
+        async with gate.admit():
+            with pytest.raises(HTTPException) as e:
+                async with gate.admit():
+                    pass
+        assert e.value.status_code == 429
+        assert "Retry-After" in e.value.headers
+        assert gate.active == 0
+
+    asyncio.run(main())
+
+
+def test_rejects_after_max_wait():
+    async def main():
+        gate = Gate("test", limit=1, max_queue=1, max_wait=0.01)
+        async with gate.admit():
+            with pytest.raises(HTTPException) as e:
+                async with gate.admit():
+                    pass
+        assert e.value.status_code == 503
+        assert gate.waiting == 0
+
+    asyncio.run(main())
+
+
+def test_unlimited_gate_admits_everything():
+    async def main():
+        gate = Gate("test", limit=0, max_queue=0)
+        async with gate.admit():
+            async with gate.admit():
+                assert gate.active == 0
+
+    asyncio.run(main())
+
+
+def test_slot_is_held_until_the_streaming_body_is_exhausted(streaming):
+    async def main():
+        gate = Gate("test", limit=1, max_queue=0)
+
+        @admission(gate)
+        async def handler():
+            return streaming()
+
+        response = await handler()
+        assert gate.active == 1
+        with pytest.raises(HTTPException):
+            await handler()
+        assert [c async for c in response.body_iterator] == [b"chunk"]
+        assert gate.active == 0
+
+    asyncio.run(main())
+
+
+def test_slot_is_released_when_the_body_fails(streaming):
+    async def main():
+        gate = Gate("test", limit=1, max_queue=0)
+
+        @admission(gate)
+        async def handler():
+            return streaming(RuntimeError("failed while streaming"))
+
+        response = await handler()
+        with pytest.raises(RuntimeError):
+            async for _ in response.body_iterator:
+                pass
+        assert gate.active == 0
+
+    asyncio.run(main())
+
+
+def test_slot_is_released_when_the_body_is_closed_or_dropped(streaming):
+    async def main():
+        gate = Gate("test", limit=1, max_queue=0)
+
+        @admission(gate)
+        async def handler():
+            return streaming()
+
+        response = await handler()
+        await response.body_iterator.aclose()
+        assert gate.active == 0
+        response = await handler()
+        assert gate.active == 1
+        del response
+        gc.collect()
+        assert gate.active == 0
+
+    asyncio.run(main())
+
+
+def test_slot_is_released_for_plain_responses_and_errors():
+    async def main():
+        gate = Gate("test", limit=1, max_queue=0)
+
+        @admission(gate)
+        async def handler(fail: bool):
+            if fail:
+                raise ValueError("bad request")
+            return {"ok": True}
+
+        assert await handler(False) == {"ok": True}
+        with pytest.raises(ValueError):
+            await handler(True)
+        assert gate.active == 0
+        assert gate.admitted == 2
+
+    asyncio.run(main())
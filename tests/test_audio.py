@@ -0,0 +1,79 @@
+"""
+Tests of the binary audio decoding and encoding.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.audio import chunked, decode, encode, pcm16, wav, wav_header
+
+
+def tone(n: int = 1600) -> np.ndarray:
+    return (0.5 * np.sin(np.linspace(0, 40 * np.pi, n))).astype(np.float32)
+
+
+def test_wav_round_trip():
+    samples = tone()
+    decoded, sample_rate = decode(wav(samples, sample_rate=16000))
+    assert sample_rate == 16000
+    assert decoded.shape == (1, len(samples))
+    assert decoded.dtype == np.float32
+    np.testing.assert_allclose(decoded[0], samples, atol=1 / 16384)
+
+
+def test_streamed_wav_segments_decode_as_one_file():
+    samples = tone()
+    data = encode(samples[:800], sample_rate=8000) + encode(
+        samples[800:], sample_rate=8000, header=False
+    )
+    decoded, sample_rate = decode(data)
+    assert sample_rate == 8000
+    np.testing.assert_allclose(decoded[0], samples, atol=1 / 16384)
+
+
+def test_raw_float32_is_decoded_to_a_writable_array():
+    samples = tone()
+    decoded, sample_rate = decode(samples.tobytes())
+    assert sample_rate is None
+    assert decoded.flags.writeable
+    np.testing.assert_array_equal(decoded[0], samples)
+
+
+@pytest.mark.parametrize("dtype, size", [("float32", 6), ("pcm16", 3)])
+def test_raw_bodies_of_partial_samples_are_rejected(dtype, size):
+    with pytest.raises(ValueError):
+        decode(bytes(size), dtype=dtype)
+
+
+def test_stereo_wav_is_downmixed_on_request():
+    left, right = tone(), np.zeros(1600, dtype=np.float32)
+    frames = pcm16(np.stack([left, right], axis=1).reshape(-1))
+    data = wav_header(sample_rate=16000, channels=2, data_size=len(frames)) + frames
+    decoded, _ = decode(data)
+    assert decoded.shape == (2, 1600)
+    mono, _ = decode(data, mono=True)
+    assert mono.shape == (1, 1600)
+    np.testing.assert_allclose(mono[0], left / 2, atol=1 / 16384)
+
+
+def test_invalid_wav_is_rejected():
+    with pytest.raises(ValueError):
+        decode(b"RIFF\x00\x00\x00\x00WAVEjunk")
+
+
+def test_raw_pcm16_round_trip():
+    samples = tone()
+    decoded, _ = decode(pcm16(samples), dtype="pcm16")
+    np.testing.assert_allclose(decoded[0], samples, atol=1 / 16384)
+
+
+def test_pcm16_clips_out_of_range_samples():
+    data = pcm16(np.array([-2.0, 2.0], dtype=np.float32))
+    assert np.frombuffer(data, dtype="<i2").tolist() == [-32767, 32767]
+
+
+def test_chunked_splits_without_losing_bytes():
+    data = bytes(range(256)) * 5
+    chunks = list(chunked(data, 300))
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert b"".join(chunks) == data
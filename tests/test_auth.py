@@ -0,0 +1,144 @@
+"""
+Tests of the access token cache and the local JWT verification.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+try:
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    from src import auth
+    from src.schemas import User
+except ImportError as e:  # the native extensions are not built
+    pytest.skip(str(e), allow_module_level=True)
+
+KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+OTHER_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+URL = "https://tenant.example"
+USER = User(sub="auth0|u", name="User")
+
+
+@pytest.fixture
+def authenticator(monkeypatch) -> "auth.Authenticator":
+    monkeypatch.setattr(auth, "AUTH0_URL", URL)
+    monkeypatch.setattr(auth, "AUTH0_AUDIENCE", "api")
+    authenticator = auth.Authenticator(maxsize=2, ttl=300)
+    authenticator.jwks.keys = {"k": KEY.public_key()}
+    authenticator.jwks.fetched_at = time.monotonic()
+    authenticator.remember(USER)
+    return authenticator
+
+
+def token(key=KEY, kid: str = "k", drop: tuple[str, ...] = (), **claims) -> str:
+    payload = {
+        "sub": USER.sub,
+        "aud": "api",
+        "iss": f"{URL}/",
+        "exp": int(time.time()) + 60,
+        **claims,
+    }
+    for claim in drop:
+        del payload[claim]
+    return jwt.encode(payload, key, algorithm="RS256", headers={"kid": kid})
+
+
+def cached(authenticator: "auth.Authenticator", value: str) -> tuple | None:
+    return authenticator.tokens.get(auth.hashlib.sha256(value.encode()).hexdigest())
+
+
+def test_cache_ttl_is_capped_by_token_expiry(authenticator):
+    async def main():
+        exp = int(time.time()) + 60
+        short = token(exp=exp)
+        assert await authenticator.authenticate(short) is USER
+        assert cached(authenticator, short)[1] == exp
+        long = token(exp=int(time.time()) + 3600)
+        await authenticator.authenticate(long)
+        assert cached(authenticator, long)[1] <= time.time() + 300
+        assert await authenticator.authenticate(short) is USER
+        assert (authenticator.hits, authenticator.misses) == (1, 2)
+
+    asyncio.run(main())
+
+
+def test_expired_entries_are_resolved_again(authenticator):
+    async def main():
+        value = token()
+        await authenticator.authenticate(value)
+        user, _ = cached(authenticator, value)
+        authenticator.tokens[next(iter(authenticator.tokens))] = (user, time.time())
+        await authenticator.authenticate(value)
+        assert authenticator.misses == 2
+
+    asyncio.run(main())
+
+
+def test_least_recently_used_tokens_are_evicted(authenticator):
+    async def main():
+        first, second, third = (token(jti=str(i)) for i in range(3))
+        await authenticator.authenticate(first)
+        await authenticator.authenticate(second)
+        await authenticator.authenticate(first)
+        await authenticator.authenticate(third)
+        assert cached(authenticator, first) is not None
+        assert cached(authenticator, second) is None
+        assert cached(authenticator, third) is not None
+
+    asyncio.run(main())
+
+
+def test_concurrent_resolves_of_a_token_are_coalesced(authenticator, monkeypatch):
+    calls = []
+
+    async def resolve(value: str):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return USER, time.time() + 60
+
+    monkeypatch.setattr(authenticator, "resolve", resolve)
+
+    async def main():
+        users = await asyncio.gather(
+            *(authenticator.authenticate("opaque") for _ in range(5))
+        )
+        assert users == [USER] * 5
+        assert calls == ["opaque"]
+        assert not authenticator.inflight
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        token(key=OTHER_KEY),
+        token(aud="other"),
+        token(iss="https://other.example/"),
+        token(exp=int(time.time()) - 60),
+        token(kid="unknown"),
+        token(drop=("exp",)),
+        token(drop=("sub",)),
+    ],
+    ids=["signature", "audience", "issuer", "expired", "kid", "no-exp", "no-sub"],
+)
+def test_invalid_tokens_are_unauthorized(authenticator, value):
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(authenticator.authenticate(value))
+    assert e.value.status_code == 401
+    assert not authenticator.tokens
+
+
+@pytest.mark.parametrize("authorization", [None, "Basic abc", "Bearer", "Bearer "])
+def test_requests_without_a_bearer_token_are_unauthorized(authorization):
+    headers = []
+    if authorization is not None:
+        headers.append((b"authorization", authorization.encode()))
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(auth.current_user(Request({"type": "http", "headers": headers})))
+    assert e.value.status_code == 401
@@ -0,0 +1,130 @@
+"""
+Tests of the `Batcher` grouping concurrent calls.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.batching import Batcher
+
+
+def recorder(fail: bool = False):
+    batches: list[tuple[str, list[int]]] = []
+
+    async def fn(key: str, items: list[int]) -> list[int]:
+        batches.append((key, items))
+        await asyncio.sleep(0)
+        if fail:
+            raise RuntimeError("batch failed")
+        return [item * 10 for item in items]
+
+    return fn, batches
+
+
+def test_groups_items_by_key():
+    async def main():
+        fn, batches = recorder()
+        batcher = Batcher(fn, window=0.01, max_size=8)
+        results = await asyncio.gather(
+            batcher.submit("a", 1),
+            batcher.submit("b", 2),
+            batcher.submit("a", 3),
+        )
+        assert results == [10, 20, 30]
+        assert sorted(batches) == [("a", [1, 3]), ("b", [2])]
+
+    asyncio.run(main())
+
+
+def test_splits_batches_at_max_size():
+    async def main():
+        fn, batches = recorder()
+        batcher = Batcher(fn, window=0.01, max_size=2)
+        results = await asyncio.gather(*(batcher.submit("a", i) for i in range(5)))
+        assert results == [0, 10, 20, 30, 40]
+        assert [items for _, items in batches] == [[0, 1], [2, 3], [4]]
+
+    asyncio.run(main())
+
+
+def test_full_batches_do_not_wait_for_the_window():
+    async def main():
+        fn, batches = recorder()
+        batcher = Batcher(fn, window=60, max_size=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a", 1), batcher.submit("a", 2)), 1
+        )
+        assert results == [10, 20]
+        assert len(batches) == 1
+
+    asyncio.run(main())
+
+
+def test_errors_reach_every_item_of_the_batch():
+    async def main():
+        fn, _ = recorder(fail=True)
+        batcher = Batcher(fn, window=0.01, max_size=4)
+        results = await asyncio.gather(
+            batcher.submit("a", 1), batcher.submit("a", 2), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.running == 0
+
+    asyncio.run(main())
+
+
+def test_missing_outputs_fail_every_item():
+    async def main():
+        async def fn(_: str, items: list[int]) -> list[int]:
+            return items[:1]
+
+        batcher = Batcher(fn, window=0.01, max_size=4)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit("a", 1), batcher.submit("a", 2), return_exceptions=True
+            ),
+            1,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    asyncio.run(main())
+
+
+def test_items_accumulate_while_busy():
+    async def main():
+        release = asyncio.Event()
+        batches: list[list[int]] = []
+
+        async def fn(_: str, items: list[int]) -> list[int]:
+            batches.append(items)
+            await release.wait()
+            return items
+
+        batcher = Batcher(fn, window=0, max_size=8, concurrency=1)
+        first = asyncio.ensure_future(batcher.submit("a", 0))
+        await asyncio.sleep(0.01)
+        rest = [asyncio.ensure_future(batcher.submit("a", i)) for i in (1, 2, 3)]
+        await asyncio.sleep(0.01)
+        assert batches == [[0]]
+        release.set()
+        assert await asyncio.gather(first, *rest) == [0, 1, 2, 3]
+        assert batches == [[0], [1, 2, 3]]
+
+    asyncio.run(main())
+
+
+def test_cancelled_items_are_skipped():
+    async def main():
+        fn, batches = recorder()
+        batcher = Batcher(fn, window=0.01, max_size=8)
+        cancelled = asyncio.ensure_future(batcher.submit("a", 1))
+        kept = asyncio.ensure_future(batcher.submit("a", 2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        assert await kept == 20
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert batches == [("a", [2])]
+
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+Tests of the Unix socket broker and its client.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.interfaces import broker
+
+
+@pytest.fixture(autouse=True)
+def no_spawn(monkeypatch):
+    monkeypatch.setattr(broker, "start", lambda path: None)
+
+
+async def serve(path: str) -> tuple[broker.Broker, asyncio.AbstractServer]:
+    if os.path.exists(path):
+        os.unlink(path)
+    b = broker.Broker(path)
+    return b, await asyncio.start_unix_server(b.handle, path=path)
+
+
+async def stop(b: broker.Broker, server: asyncio.AbstractServer) -> None:
+    server.close()
+    for writers in list(b.subscribers.values()):
+        for writer in writers:
+            writer.close()
+    await server.wait_closed()
+
+
+async def until(condition, timeout: float = 5.0) -> None:
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_messages_reach_subscribers_of_other_clients(tmp_path):
+    async def main():
+        path = str(tmp_path / "broker.sock")
+        b, server = await serve(path)
+        received = []
+
+        async def deliver(key, data):
+            received.append((key, data))
+
+        subscriber = broker.BrokerClient(deliver, path)
+        publisher = broker.BrokerClient(deliver, path)
+        await subscriber.subscribe("k")
+        await until(lambda: "k" in b.subscribers)
+        await publisher.publish("k", 1)
+        await publisher.publish("other", 2)
+        await until(lambda: received)
+        assert received == [("k", 1)]
+        await stop(b, server)
+
+    asyncio.run(main())
+
+
+def test_client_resubscribes_and_flushes_after_reconnecting(tmp_path):
+    async def main():
+        path = str(tmp_path / "broker.sock")
+        b, server = await serve(path)
+        received = []
+
+        async def deliver(key, data):
+            received.append((key, data))
+
+        subscriber = broker.BrokerClient(deliver, path)
+        await subscriber.subscribe("k")
+        await until(lambda: "k" in b.subscribers)
+        await stop(b, server)
+        await until(lambda: not subscriber.connected)
+        subscriber.buffer.append(b'["k",1]')
+        subscriber.buffer_size += 7
+        subscriber.flush()
+        assert subscriber.buffer
+        b, server = await serve(path)
+        await until(lambda: "k" in b.subscribers)
+        await until(lambda: received)
+        assert received == [("k", 1)]
+        assert not subscriber.buffer
+        await stop(b, server)
+
+    asyncio.run(main())
+
+
+def test_publish_buffers_when_the_socket_path_is_unusable(tmp_path):
+    async def main():
+        (tmp_path / "file").write_text("")
+        client = broker.BrokerClient(lambda *_: None, str(tmp_path / "file" / "sock"))
+        await client.publish("k", 1)
+        assert client.buffer == [b'["k",1]']
+
+    asyncio.run(main())
+
+
+def test_broker_runs_as_a_standalone_script(tmp_path):
+    path = str(tmp_path / "broker.sock")
+    process = subprocess.Popen(
+        [sys.executable, "-P", broker.__file__],
+        env={**os.environ, "QUEUE_SOCKET": path},
+    )
+
+    async def main():
+        received = []
+
+        async def deliver(key, data):
+            received.append((key, data))
+
+        subscriber = broker.BrokerClient(deliver, path)
+        await subscriber.subscribe("k")
+        await asyncio.sleep(0.05)
+        await broker.BrokerClient(deliver, path).publish("k", 1)
+        await until(lambda: received)
+        assert received == [("k", 1)]
+
+    try:
+        asyncio.run(main())
+    finally:
+        process.terminate()
+        process.wait(5)
@@ -0,0 +1,125 @@
+"""
+Tests of the circuit breaker state machine.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.circuit import CircuitBreaker, CircuitOpenError
+
+
+def breaker(**kwargs) -> CircuitBreaker:
+    settings = {"min_calls": 2, "failure_rate": 0.5, "open_for": 30, "probes": 1}
+    return CircuitBreaker("test", **{**settings, **kwargs})
+
+
+def expire(b: CircuitBreaker) -> None:
+    b.opened_at -= b.open_for
+
+
+def test_opens_once_failure_rate_is_reached():
+    b = breaker()
+    b.before()
+    b.record(False)
+    assert b.state == "closed"
+    b.before()
+    b.record(True)
+    assert b.state == "open"
+    with pytest.raises(CircuitOpenError) as e:
+        b.before()
+    assert e.value.status_code == 503
+    assert int(e.value.headers["Retry-After"]) >= 1
+    assert b.rejected == 1
+
+
+def test_stays_closed_below_min_calls():
+    b = breaker(min_calls=3)
+    for _ in range(2):
+        b.before()
+        b.record(True)
+    assert b.state == "closed"
+
+
+def test_half_open_probe_success_closes():
+    b = breaker()
+    b._open(0.0)  # pylint: disable=W0212
+    expire(b)
+    b.before()
+    assert b.state == "half-open"
+    with pytest.raises(CircuitOpenError):
+        b.before()
+    b.record(False)
+    assert b.state == "closed"
+    assert b.stats()["calls"] == 0
+
+
+def test_half_open_probe_failure_reopens():
+    b = breaker()
+    b._open(0.0)  # pylint: disable=W0212
+    expire(b)
+    b.before()
+    b.record(True)
+    assert b.state == "open"
+    assert b.trips == 2
+
+
+def test_cancelled_probe_gives_back_its_slot():
+    b = breaker()
+    b._open(0.0)  # pylint: disable=W0212
+    expire(b)
+    b.before()
+    b.settle(asyncio.CancelledError())
+    assert b.state == "half-open"
+    b.before()
+    assert b.probing == 1
+
+
+def test_decorator_ignores_non_failures():
+    b = breaker(is_failure=lambda e: isinstance(e, ConnectionError))
+
+    @b
+    async def call(error: Exception):
+        raise error
+
+    for _ in range(4):
+        with pytest.raises(ValueError):
+            asyncio.run(call(ValueError()))
+    assert b.state == "closed"
+    assert b.failures == 0
+
+
+def test_stream_failures_are_recorded_when_the_body_fails(streaming):
+    b = breaker()
+
+    @b
+    async def call():
+        return streaming(ConnectionError("upstream went away"))
+
+    async def consume():
+        calls = b.stats()["calls"]
+        response = await call()
+        assert b.stats()["calls"] == calls
+        with pytest.raises(ConnectionError):
+            async for _ in response.body_iterator:
+                pass
+
+    for _ in range(2):
+        asyncio.run(consume())
+    assert b.state == "open"
+
+
+def test_stream_success_is_recorded_once_the_body_is_exhausted(streaming):
+    b = breaker()
+
+    @b
+    async def call():
+        return streaming()
+
+    async def consume():
+        response = await call()
+        assert [c async for c in response.body_iterator] == [b"chunk"]
+
+    asyncio.run(consume())
+    assert b.stats()["calls"] == 1
+    assert b.failures == 0
@@ -0,0 +1,83 @@
+"""
+Tests of building documents read from the collection without validation.
+"""
+
+from typing import Optional, Union
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+try:
+    from src.data import database
+except ImportError as e:  # the native extensions are not built
+    pytest.skip(str(e), allow_module_level=True)
+
+
+class Message(BaseModel):
+    role: str
+    content: str
+
+
+class Conversation(BaseModel):
+    messages: list[Message]
+    instructions: str = ""
+
+
+class Document(database.RocksDBModel):
+    conversation: Conversation
+    replies: dict[str, Message] = {}
+    parent: Optional[Message] = None
+    either: Union[Message, Conversation, None] = None
+    tags: list[str] = []
+
+
+DATA = {
+    "id": "doc",
+    "conversation": {
+        "messages": [{"role": "user", "content": "hi"}],
+        "instructions": "be brief",
+    },
+    "replies": {"a": {"role": "assistant", "content": "hello"}},
+    "parent": {"role": "user", "content": "parent"},
+    "either": {"messages": [], "instructions": ""},
+    "tags": ["x"],
+}
+
+
+def test_construct_matches_validation():
+    built = database.construct(Document, DATA)
+    assert built == Document(**DATA)
+    assert isinstance(built.conversation, Conversation)
+    assert isinstance(built.conversation.messages[0], Message)
+    assert isinstance(built.replies["a"], Message)
+    assert isinstance(built.parent, Message)
+    assert isinstance(built.either, Conversation)
+
+
+def test_construct_ignores_unknown_keys_and_keeps_defaults():
+    built = database.construct(
+        Document, {"id": "doc", "conversation": {"messages": []}, "token_count": 3}
+    )
+    assert not hasattr(built, "token_count")
+    assert built.parent is None
+    assert built.replies == {}
+    assert built.conversation.instructions == ""
+
+
+def test_construct_keeps_null_nested_models():
+    built = database.construct(Document, {**DATA, "parent": None, "either": None})
+    assert built.parent is None
+    assert built.either is None
+
+
+def test_hydrate_validates_untrusted_documents():
+    with pytest.raises(ValidationError):
+        Document.hydrate({"id": "doc", "conversation": {}}, trusted=False)
+    assert Document.hydrate(DATA, trusted=False) == Document(**DATA)
+
+
+def test_hydrate_validates_documents_without_id():
+    data = {key: value for key, value in DATA.items() if key != "id"}
+    built = Document.hydrate(data, trusted=True)
+    assert built.id and built.id != "doc"
+    assert isinstance(built.conversation, Conversation)
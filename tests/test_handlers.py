@@ -0,0 +1,107 @@
+"""
+Tests of the retry engine and its predicates.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.utils import handlers
+from src.utils.handlers import backoff, is_transient, retry_after, retry_handler
+
+
+class Response:
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class UpstreamError(Exception):
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        super().__init__(status_code)
+        self.response = Response(status_code, headers)
+
+
+@pytest.fixture(autouse=True)
+def no_wait(monkeypatch):
+    waits: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        waits.append(seconds)
+
+    monkeypatch.setattr(handlers, "backoff", lambda *_: 0.0)
+    monkeypatch.setattr(handlers, "_sleep", sleep)
+    return waits
+
+
+def flaky(failures: list[Exception]):
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if failures:
+            raise failures.pop(0)
+        return len(calls)
+
+    return call, calls
+
+
+def test_backoff_is_bounded_by_the_cap():
+    for attempt in range(10):
+        assert 0 <= backoff(attempt, 1, 5) <= min(5, 2**attempt)
+
+
+def test_transient_errors():
+    assert is_transient(ConnectionError())
+    assert is_transient(asyncio.TimeoutError())
+    assert is_transient(HTTPException(status_code=503))
+    assert is_transient(UpstreamError(429))
+    assert not is_transient(UpstreamError(404))
+    assert not is_transient(ValueError())
+
+
+def test_retry_after_header():
+    assert retry_after(UpstreamError(429, {"Retry-After": "7"})) == 7.0
+    assert retry_after(UpstreamError(429, {"Retry-After": "soon"})) is None
+    assert retry_after(ValueError()) is None
+
+
+def test_idempotent_calls_are_retried_on_transient_errors():
+    call, calls = flaky([ConnectionError(), UpstreamError(502)])
+    assert asyncio.run(retry_handler(idempotent=True)(call)()) == 3
+    assert len(calls) == 3
+
+
+def test_non_idempotent_calls_are_not_retried():
+    call, calls = flaky([ConnectionError()])
+    with pytest.raises(ConnectionError):
+        asyncio.run(retry_handler(call)())
+    assert len(calls) == 1
+
+
+def test_permanent_errors_are_not_retried():
+    call, calls = flaky([UpstreamError(400)])
+    with pytest.raises(UpstreamError):
+        asyncio.run(retry_handler(idempotent=True)(call)())
+    assert len(calls) == 1
+
+
+def test_retries_are_bounded():
+    call, calls = flaky([ConnectionError() for _ in range(5)])
+    with pytest.raises(ConnectionError):
+        asyncio.run(retry_handler(retries=2, idempotent=True)(call)())
+    assert len(calls) == 3
+
+
+def test_retry_after_sets_a_floor_on_the_wait(no_wait):
+    call, _ = flaky([UpstreamError(503, {"Retry-After": "2"})])
+    asyncio.run(retry_handler(idempotent=True)(call)())
+    assert no_wait == [2.0]
+
+
+def test_max_elapsed_gives_up_before_waiting_too_long():
+    call, calls = flaky([UpstreamError(503, {"Retry-After": "60"})])
+    with pytest.raises(UpstreamError):
+        asyncio.run(retry_handler(idempotent=True, max_elapsed=10)(call)())
+    assert len(calls) == 1
@@ -0,0 +1,219 @@
+"""
+Tests of the durable job queue: ordering, concurrency, retries, claims and recovery.
+"""
+
+import asyncio
+import time
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+try:
+    from src.data.database import Store
+    from src.data.jobs import Job, JobQueue
+except ImportError as e:  # the native extensions are not built
+    pytest.skip(str(e), allow_module_level=True)
+
+
+class Request(BaseModel):
+    n: int
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(Job, "store", Store[Job](str(tmp_path / "jobs")))
+
+
+def queue(runner, concurrency: int = 1) -> JobQueue:
+    jobs = JobQueue()
+    jobs.backoff = 0.01
+    jobs.register("t", concurrency=concurrency, model=Request)(runner)
+    return jobs
+
+
+async def until(condition, timeout: float = 5.0) -> None:
+    async def poll():
+        while True:
+            done = condition()
+            if asyncio.iscoroutine(done):
+                done = await done
+            if done:
+                return
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def status(key: str) -> str:
+    return (await Job.find_one(key)).status
+
+
+async def settled(key: str, expected: str) -> bool:
+    return await status(key) == expected
+
+
+def test_higher_priority_jobs_run_first():
+    async def main():
+        release = asyncio.Event()
+        order: list[int] = []
+
+        async def runner(payload):
+            order.append(payload["n"])
+            await release.wait()
+
+        jobs = queue(runner)
+        await jobs.start(["t"])
+        await jobs.submit("t", {"n": 0})
+        await until(lambda: order)
+        for n, priority in ((1, 0), (2, 5), (3, 1)):
+            await jobs.submit("t", {"n": n}, priority=priority)
+        release.set()
+        await until(lambda: len(order) == 4)
+        assert order == [0, 2, 3, 1]
+        await jobs.stop()
+
+    asyncio.run(main())
+
+
+def test_concurrency_is_limited_per_task():
+    async def main():
+        running: list[int] = []
+        peak: list[int] = []
+
+        async def runner(payload):
+            running.append(payload["n"])
+            peak.append(len(running))
+            await asyncio.sleep(0.02)
+            running.remove(payload["n"])
+            return payload["n"] * 10
+
+        jobs = queue(runner, concurrency=2)
+        await jobs.start(["t"])
+        submitted = [await jobs.submit("t", {"n": n}) for n in range(5)]
+        for job in submitted:
+            await until(lambda: settled(job.id, "succeeded"))
+        assert max(peak) == 2
+        results = [(await Job.find_one(job.id)).result for job in submitted]
+        assert results == [0, 10, 20, 30, 40]
+        await jobs.stop()
+
+    asyncio.run(main())
+
+
+def test_failed_jobs_are_retried_with_backoff():
+    async def main():
+        calls: list[float] = []
+
+        async def runner(payload):
+            calls.append(time.monotonic())
+            if len(calls) < 3:
+                raise RuntimeError("flaky")
+            return "ok"
+
+        jobs = queue(runner)
+        await jobs.start(["t"])
+        job = await jobs.submit("t", {"n": 1})
+        await until(lambda: settled(job.id, "succeeded"))
+        stored = await Job.find_one(job.id)
+        assert stored.attempts == 3 and stored.error is None
+        assert calls[2] - calls[1] >= calls[1] - calls[0] >= 0.01
+        await jobs.stop()
+
+    asyncio.run(main())
+
+
+def test_jobs_fail_after_max_attempts():
+    async def main():
+        async def runner(payload):
+            raise RuntimeError("broken")
+
+        jobs = queue(runner)
+        await jobs.start(["t"])
+        job = await jobs.submit("t", {"n": 1})
+        await until(lambda: settled(job.id, "failed"))
+        stored = await Job.find_one(job.id)
+        assert stored.attempts == stored.max_attempts
+        assert stored.error == "RuntimeError: broken"
+        assert stored.owner is None
+        await jobs.stop()
+
+    asyncio.run(main())
+
+
+def test_unfinished_jobs_are_recovered_on_start():
+    async def main():
+        ran: list[int] = []
+
+        async def runner(payload):
+            ran.append(payload["n"])
+
+        queued = Job(task="t", payload={"n": 1})
+        crashed = Job(
+            task="t",
+            payload={"n": 2},
+            status="running",
+            owner="dead",
+            lease_until=time.time() - 1,
+        )
+        leased = Job(
+            task="t",
+            payload={"n": 3},
+            status="running",
+            owner="alive",
+            lease_until=time.time() + 0.3,
+        )
+        for job in (queued, crashed, leased):
+            await job.save()
+        jobs = queue(runner)
+        await jobs.start(["t"])
+        await until(lambda: len(ran) == 2)
+        assert sorted(ran) == [1, 2]
+        assert await status(leased.id) == "running"
+        await until(lambda: settled(leased.id, "succeeded"))
+        assert sorted(ran) == [1, 2, 3]
+        await jobs.stop()
+
+    asyncio.run(main())
+
+
+def test_a_job_is_claimed_by_a_single_queue():
+    async def main():
+        ran: list[str] = []
+
+        async def runner(payload):
+            ran.append(payload["owner"])
+            await asyncio.sleep(0.1)
+
+        first, second = queue(runner), queue(runner)
+        first.lease = second.lease = 0.03
+        await first.start(["t"])
+        await second.start(["t"])
+        job = Job(task="t", payload={"n": 1, "owner": "x"})
+        await job.save()
+        first.enqueue(job)
+        second.enqueue(job)
+        await until(lambda: settled(job.id, "succeeded"))
+        await asyncio.sleep(0.1)
+        assert ran == ["x"]
+        assert (await Job.find_one(job.id)).attempts == 1
+        await first.stop()
+        await second.stop()
+
+    asyncio.run(main())
+
+
+def test_invalid_payloads_are_rejected_on_submit():
+    async def main():
+        async def runner(payload):
+            return None
+
+        jobs = queue(runner)
+        await jobs.start(["t"])
+        with pytest.raises(ValidationError):
+            await jobs.submit("t", {"n": "not a number"})
+        assert await Job.count() == 0
+        with pytest.raises(RuntimeError):
+            await queue(runner).submit("t", {"n": 1})
+        await jobs.stop()
+
+    asyncio.run(main())
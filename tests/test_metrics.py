@@ -0,0 +1,73 @@
+"""
+Tests of the sharded histograms and the Prometheus rendering.
+"""
+
+import threading
+
+import pytest
+
+from src.utils import metrics
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(metrics, "histograms", {})
+    monkeypatch.setattr(metrics, "collectors", [])
+
+
+def test_shards_of_every_thread_are_merged():
+    hist = metrics.Histogram("h", "help", ("op",), buckets=(0.001, 0.01))
+
+    def record():
+        for _ in range(100):
+            hist.observe(500_000, "get")
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    hist.observe(20_000_000, "put")
+    assert len(hist.shards) == 5
+    merged = hist.merged()
+    assert merged[("get",)] == [400, 0, 0, 400 * 500_000]
+    assert merged[("put",)] == [0, 0, 1, 20_000_000]
+
+
+def test_bucket_bounds_are_inclusive():
+    hist = metrics.Histogram("h", "help", buckets=(0.001,))
+    hist.observe(1_000_000)
+    hist.observe(1_000_001)
+    assert hist.merged()[()] == [1, 1, 2_000_001]
+
+
+def test_render_is_cumulative():
+    hist = metrics.histogram("latency_seconds", "Latency.", ("op",))
+    assert metrics.histogram("latency_seconds", "Other.") is hist
+    hist.observe(1_000_000_000, 'a"b')
+    hist.observe(50_000, 'a"b')
+    lines = list(hist.render())
+    assert lines[:2] == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+    ]
+    assert 'latency_seconds_bucket{op="a\\"b",le="5e-05"} 1' in lines
+    assert 'latency_seconds_bucket{op="a\\"b",le="0.5"} 1' in lines
+    assert 'latency_seconds_bucket{op="a\\"b",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{op="a\\"b",le="+Inf"} 2' in lines
+    assert 'latency_seconds_sum{op="a\\"b"} 1.00005' in lines
+    assert 'latency_seconds_count{op="a\\"b"} 2' in lines
+
+
+def test_collectors_are_exported_as_counters_and_gauges():
+    @metrics.collector
+    def samples():
+        yield from metrics.labelled(
+            "queue", "key", {"k": {"depth": 3, "dropped_total": 1, "name": "k"}}
+        )
+
+    text = metrics.render()
+    assert text.endswith("\n")
+    assert "# TYPE queue_depth gauge\nqueue_depth{key=\"k\"} 3.0" in text
+    assert "# TYPE queue_dropped_total counter" in text
+    assert "queue_name" not in text
@@ -0,0 +1,69 @@
+"""
+Tests of the model registry residency and LRU unloading.
+"""
+
+import threading
+import time
+
+from src.utils.models import MB, ModelRegistry
+
+
+class Model:
+    pass
+
+
+def registry(budget_mb: int, sizes: dict[str, int]) -> ModelRegistry:
+    models = ModelRegistry(budget=budget_mb * MB)
+    for name, size in sizes.items():
+        models.register(name, size_hint=size)(Model)
+    return models
+
+
+def test_models_load_lazily_and_once():
+    models = registry(0, {"a": 10})
+    assert not models.entries["a"].loaded
+    first = models.get("a")
+    assert models.get("a") is first
+    stats = models.stats()["models"]["a"]
+    assert stats["loads"] == 1
+    assert stats["hits"] == 1
+
+
+def test_least_recently_used_model_is_unloaded_to_fit_the_budget():
+    models = registry(25, {"a": 10, "b": 10, "c": 10})
+    models.get("a")
+    models.get("b")
+    models.entries["a"].last_used = time.monotonic() - 60
+    models.get("c")
+    assert not models.entries["a"].loaded
+    assert models.entries["b"].loaded and models.entries["c"].loaded
+    assert models.entries["a"].evictions == 1
+    assert models.resident == 20 * MB
+
+
+def test_pinned_models_are_not_unloaded():
+    models = registry(15, {"a": 10, "b": 10})
+    with models.use("a"):
+        models.get("b")
+        assert models.entries["a"].loaded
+    assert models.entries["a"].pins == 0
+
+
+def test_exclusive_use_serialises_callers():
+    models = registry(0, {"a": 10})
+    inside: list[int] = []
+    overlaps: list[bool] = []
+
+    def use():
+        with models.use("a", exclusive=True):
+            inside.append(1)
+            overlaps.append(len(inside) > 1)
+            time.sleep(0.01)
+            inside.pop()
+
+    threads = [threading.Thread(target=use) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == [False] * 4
@@ -0,0 +1,96 @@
+"""
+Tests of the `IQueue` fan-out and overflow policies on the local backend.
+"""
+
+import asyncio
+
+import pytest
+
+from src.interfaces.queue import IQueue
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    IQueue.subscribers.clear()
+    IQueue.dropped.clear()
+    yield
+    IQueue.subscribers.clear()
+    IQueue.dropped.clear()
+
+
+async def subscribe(queue: IQueue, key: str):
+    stream = queue.sub(key=key)
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    return stream, pending
+
+
+async def drain(key: str) -> list[list[int]]:
+    return [
+        [s.queue.get_nowait() for _ in range(s.queue.qsize())]
+        for s in IQueue.subscribers[key]
+    ]
+
+
+def test_every_subscriber_gets_every_message():
+    async def main():
+        queue = IQueue[int](backend="local")
+        subscribers = [await subscribe(queue, "k") for _ in range(3)]
+        await queue.pub(key="k", data=1)
+        assert [await pending for _, pending in subscribers] == [1, 1, 1]
+        await queue.pub(key="other", data=2)
+        assert IQueue.stats()["k"]["depth"] == 0
+        for stream, _ in subscribers:
+            await stream.aclose()
+        assert "k" not in IQueue.subscribers
+
+    asyncio.run(main())
+
+
+def test_drop_oldest_keeps_the_latest_messages():
+    async def main():
+        queue = IQueue[int](maxsize=2, overflow="drop-oldest", backend="local")
+        stream, pending = await subscribe(queue, "k")
+        await queue.pub(key="k", data=0)
+        assert await pending == 0
+        for i in range(1, 5):
+            await queue.pub(key="k", data=i)
+        assert await drain("k") == [[3, 4]]
+        assert IQueue.dropped["k"] == 2
+        await stream.aclose()
+
+    asyncio.run(main())
+
+
+def test_drop_newest_keeps_the_first_messages():
+    async def main():
+        queue = IQueue[int](maxsize=2, overflow="drop-newest", backend="local")
+        stream, pending = await subscribe(queue, "k")
+        await queue.pub(key="k", data=0)
+        assert await pending == 0
+        for i in range(1, 5):
+            await queue.pub(key="k", data=i)
+        assert await drain("k") == [[1, 2]]
+        assert IQueue.dropped["k"] == 2
+        await stream.aclose()
+
+    asyncio.run(main())
+
+
+def test_block_applies_backpressure_to_the_publisher():
+    async def main():
+        queue = IQueue[int](maxsize=1, overflow="block", backend="local")
+        stream, pending = await subscribe(queue, "k")
+        await queue.pub(key="k", data=0)
+        await queue.pub(key="k", data=1)
+        blocked = asyncio.ensure_future(queue.pub(key="k", data=2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert await pending == 0
+        assert await stream.__anext__() == 1
+        await asyncio.wait_for(blocked, 1)
+        assert await stream.__anext__() == 2
+        assert IQueue.dropped.get("k", 0) == 0
+        await stream.aclose()
+
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""
+Tests of the msgpack content negotiation.
+"""
+
+import msgpack
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from src.utils.responses import (
+    NegotiatedRoute,
+    RawJSONResponse,
+    accepted,
+    wants_msgpack,
+)
+
+DOCUMENT = {"id": "a", "values": [1.5, 2], "nested": {"ok": True, "none": None}}
+
+
+def request(accept: str | None) -> Request:
+    headers = [] if accept is None else [(b"accept", accept.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+def test_accepted_parses_qualities():
+    assert accepted("application/json;q=0.5, application/msgpack, */*; q=0.1") == {
+        "application/json": 0.5,
+        "application/msgpack": 1.0,
+        "*/*": 0.1,
+    }
+    assert accepted("application/msgpack;q=oops") == {"application/msgpack": 0.0}
+    assert accepted("") == {}
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/x-msgpack", True),
+        ("application/msgpack;q=0", False),
+        ("application/json, application/msgpack;q=0.9", False),
+        ("application/json;q=0.5, application/msgpack", True),
+        ("application/msgpack;q=0.5, */*", False),
+        ("application/msgpack, */*;q=0.1", True),
+        ("application/msgpack, application/json", True),
+    ],
+)
+def test_wants_msgpack(accept, expected):
+    assert wants_msgpack(request(accept)) is expected
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.router.route_class = NegotiatedRoute
+
+    @app.get("/document")
+    def document():
+        return DOCUMENT
+
+    @app.get("/raw")
+    def raw():
+        return RawJSONResponse([orjson.dumps(DOCUMENT)], headers={"X-Count": "1"})
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("hello")
+
+    return TestClient(app)
+
+
+def test_json_by_default(client):
+    response = client.get("/document")
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["vary"] == "Accept"
+    assert response.json() == DOCUMENT
+
+
+def test_return_value_is_packed_directly(client):
+    response = client.get("/document", headers={"Accept": "application/msgpack"})
+    assert response.headers["content-type"] == "application/msgpack"
+    assert response.headers["vary"] == "Accept"
+    assert response.content == msgpack.packb(DOCUMENT, use_bin_type=True)
+
+
+def test_json_responses_are_re_encoded(client):
+    response = client.get("/raw", headers={"Accept": "application/msgpack"})
+    assert response.headers["content-type"] == "application/msgpack"
+    assert response.headers["x-count"] == "1"
+    assert msgpack.unpackb(response.content) == [DOCUMENT]
+
+
+def test_other_responses_are_sent_unchanged(client):
+    response = client.get("/text", headers={"Accept": "application/msgpack"})
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "vary" not in response.headers
+    assert response.text == "hello"
@@ -0,0 +1,60 @@
+"""
+Tests of the filtered scans of the RocksDB collection.
+"""
+
+import orjson
+import pytest
+
+try:
+    from src.integration import rocksdb
+except ImportError as e:  # the native extensions are not built
+    pytest.skip(str(e), allow_module_level=True)
+
+DOCUMENTS = [
+    {"id": "a", "kind": "note", "owner": "ana", "done": True},
+    {"id": "b", "kind": "note", "owner": "bo", "done": 1},
+    {"id": "c", "kind": "task", "owner": None, "done": False},
+    {"id": "d", "kind": "task", "text": 'said "kind":"note"'},
+    {"id": "e", "kind": "nöte ☃", "nested": {"kind": "note"}},
+    {"id": "f", "nested": {"kind": "task"}},
+]
+
+FILTERS = [
+    {},
+    {"kind": "note"},
+    {"kind": "task"},
+    {"kind": "nöte ☃"},
+    {"kind": "note", "owner": "bo"},
+    {"owner": None},
+    {"done": True},
+    {"done": 1},
+    {"kind": "missing"},
+    {"nested": {"kind": "note"}},
+]
+
+
+@pytest.fixture
+def collection(tmp_path):
+    col = rocksdb.Collection(str(tmp_path / "db"))
+    for document in DOCUMENTS:
+        col.create(document["id"], document)
+    return col
+
+
+def expected(col, kwargs):
+    return [
+        document
+        for document in col.find_all()
+        if all(document.get(k) == v for k, v in kwargs.items())
+    ]
+
+
+@pytest.mark.parametrize("kwargs", FILTERS, ids=repr)
+def test_find_many_raw_matches_decoded_filter(collection, kwargs):
+    raw = collection.find_many_raw(kwargs)
+    assert [orjson.loads(value) for value in raw] == expected(collection, kwargs)
+    assert collection.find_many(kwargs) == expected(collection, kwargs)
+
+
+def test_find_many_raw_returns_stored_bytes(collection):
+    assert collection.find_many_raw({"id": "a"}) == [collection.get_raw("a")]
@@ -0,0 +1,356 @@
+"""
+Tests of the object storage against an in-memory stand-in of the S3 client:
+multipart uploads, streamed downloads, presigned URLs, listings and deduplication.
+"""
+
+import asyncio
+import hashlib
+import io
+import threading
+import time
+import types
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+try:
+    from src.data import storage
+    from src.data.database import Store
+except ImportError as e:  # the native extensions are not built
+    pytest.skip(str(e), allow_module_level=True)
+
+
+class ClientError(Exception):
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class Body:
+    def __init__(self, data: bytes) -> None:
+        self.stream = io.BytesIO(data)
+        self.closed = False
+
+    def read(self, size: int = -1) -> bytes:
+        return self.stream.read(size)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeS3:
+    """
+    The subset of the boto3 S3 client used by `ObjectStorage`, keeping objects in
+    memory.
+    """
+
+    exceptions = types.SimpleNamespace(ClientError=ClientError)
+
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[bytes, str]] = {}
+        self.uploads: dict[str, dict] = {}
+        self.bodies: list[Body] = []
+        self.calls: Counter[str] = Counter()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.part_delay = 0.0
+        self.fail_part: int | None = None
+        self.fail_prefix: str | None = None
+        self.page_size = 1000
+
+    def put_object(self, *, Bucket, Key, Body, ContentType, ACL):
+        self.calls["put_object"] += 1
+        self.objects[Key] = (bytes(Body), ContentType)
+
+    def create_multipart_upload(self, *, Bucket, Key, ContentType, ACL):
+        upload_id = uuid4().hex
+        self.uploads[upload_id] = {"content_type": ContentType, "parts": {}}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, *, Bucket, Key, UploadId, PartNumber, Body):
+        with self.lock:
+            self.calls["upload_part"] += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.part_delay)
+            if PartNumber == self.fail_part:
+                raise ClientError("InternalError")
+            self.uploads[UploadId]["parts"][PartNumber] = Body
+            return {"ETag": f'"{PartNumber}"'}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def complete_multipart_upload(self, *, Bucket, Key, UploadId, MultipartUpload):
+        upload = self.uploads.pop(UploadId)
+        parts = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        assert parts == sorted(upload["parts"])
+        data = b"".join(upload["parts"][number] for number in parts)
+        self.objects[Key] = (data, upload["content_type"])
+
+    def abort_multipart_upload(self, *, Bucket, Key, UploadId):
+        self.calls["abort_multipart_upload"] += 1
+        del self.uploads[UploadId]
+
+    def get_object(self, *, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError("NoSuchKey")
+        data, content_type = self.objects[Key]
+        body = Body(data)
+        self.bodies.append(body)
+        return {"Body": body, "ContentType": content_type, "ContentLength": len(data)}
+
+    def head_object(self, *, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError("404")
+        return {}
+
+    def delete_object(self, *, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def generate_presigned_url(self, *, ClientMethod, Params, ExpiresIn):
+        self.calls["presign"] += 1
+        return f"https://s3/{Params['Key']}?signature={self.calls['presign']}"
+
+    def list_objects_v2(
+        self, *, Bucket, Prefix, ContinuationToken=None, Delimiter=None
+    ):
+        self.calls["list_objects_v2"] += 1
+        if self.fail_prefix and Prefix.startswith(self.fail_prefix):
+            raise ClientError("InternalError")
+        items: dict[str, tuple[str, str]] = {}
+        for key in self.objects:
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                common = Prefix + rest.split(Delimiter)[0] + Delimiter
+                items[common] = ("prefix", common)
+            else:
+                items[key] = ("object", key)
+        ordered = [items[name] for name in sorted(items)]
+        start = int(ContinuationToken or 0)
+        page = ordered[start : start + self.page_size]
+        response = {
+            "Contents": [{"Key": v} for kind, v in page if kind == "object"],
+            "CommonPrefixes": [{"Prefix": v} for kind, v in page if kind == "prefix"],
+            "IsTruncated": start + self.page_size < len(ordered),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + self.page_size)
+        return response
+
+
+@pytest.fixture
+def s3(monkeypatch, tmp_path) -> FakeS3:
+    fake = FakeS3()
+    monkeypatch.setattr(storage, "get_client", lambda: fake)
+    monkeypatch.setattr(storage, "presigned", storage.PresignedCache())
+    monkeypatch.setattr(storage, "PART_SIZE", 4)
+    monkeypatch.setattr(storage, "UPLOAD_CONCURRENCY", 3)
+    for model in (storage.Blob, storage.BlobRef):
+        path = str(tmp_path / model.__name__.lower())
+        monkeypatch.setattr(model, "store", Store[model](path))
+    return fake
+
+
+def upload_file(data: bytes, filename: str = "file.bin") -> UploadFile:
+    return UploadFile(io.BytesIO(data), filename=filename)
+
+
+def test_small_files_are_put_in_one_call(s3):
+    async def main():
+        size = await storage.ObjectStorage().upload(
+            key="k", file=upload_file(b"abc"), content_type="text/plain"
+        )
+        assert size == 3
+        assert s3.objects["k"] == (b"abc", "text/plain")
+        assert s3.calls["upload_part"] == 0
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("length", [4, 8, 42])
+def test_large_files_are_uploaded_in_concurrent_parts(s3, length):
+    async def main():
+        s3.part_delay = 0.01
+        data = bytes(range(length))
+        size = await storage.ObjectStorage().upload(
+            key="k", file=upload_file(data), content_type="audio/wav"
+        )
+        assert size == length
+        assert s3.objects["k"] == (data, "audio/wav")
+        assert s3.calls["upload_part"] == -(-length // 4)
+        assert s3.peak <= 3
+        if length > 8:
+            assert s3.peak > 1
+        assert not s3.uploads
+
+    asyncio.run(main())
+
+
+def test_failed_parts_abort_the_upload_early(s3):
+    async def main():
+        s3.part_delay = 0.01
+        s3.fail_part = 2
+        with pytest.raises(ClientError):
+            await storage.ObjectStorage().upload(
+                key="k", file=upload_file(bytes(400)), content_type="audio/wav"
+            )
+        assert s3.calls["abort_multipart_upload"] == 1
+        assert s3.calls["upload_part"] < 10
+        assert "k" not in s3.objects
+        assert not s3.uploads
+
+    asyncio.run(main())
+
+
+def test_objects_are_streamed_in_chunks(s3):
+    async def main():
+        s3.objects["k"] = (b"0123456789", "audio/wav")
+        stream = storage.ObjectStorage().stream(key="k", chunk_size=4)
+        chunks = [chunk async for chunk in stream]
+        assert chunks == [b"0123", b"4567", b"89"]
+        assert s3.bodies[-1].closed
+
+        stream = storage.ObjectStorage().stream(key="k", chunk_size=4)
+        assert await stream.__anext__() == b"0123"
+        await stream.aclose()
+        assert s3.bodies[-1].closed
+
+    asyncio.run(main())
+
+
+def test_download_streams_the_body(s3):
+    async def main():
+        s3.objects["song.wav"] = (bytes(3 * storage.CHUNKSIZE + 1), "audio/wav")
+        response = await storage.ObjectStorage().download(key="song.wav")
+        assert response.media_type == "audio/wav"
+        assert response.headers["content-length"] == str(3 * storage.CHUNKSIZE + 1)
+        chunks = [chunk async for chunk in response.body_iterator]
+        assert [len(chunk) for chunk in chunks] == [storage.CHUNKSIZE] * 3 + [1]
+        assert s3.bodies[-1].closed
+
+    asyncio.run(main())
+
+
+def test_download_of_a_missing_object_is_not_found(s3):
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(storage.ObjectStorage().download(key="missing"))
+    assert e.value.status_code == 404
+
+
+def test_presigned_urls_are_reused_until_half_their_ttl(s3):
+    bucket = storage.ObjectStorage()
+    url = bucket.presign(key="k", ttl=0.1)
+    assert bucket.presign(key="k", ttl=0.1) == url
+    assert bucket.presign(key="k", ttl=60) != url
+    assert s3.calls["presign"] == 2
+    time.sleep(0.06)
+    assert bucket.presign(key="k", ttl=0.1) != url
+    assert s3.calls["presign"] == 3
+
+
+def test_presigned_cache_is_bounded_and_discarded_on_removal(s3):
+    cache = storage.PresignedCache(maxsize=2)
+    cache.set("b", "k1", 60, "u1")
+    cache.set("b", "k2", 60, "u2")
+    assert cache.get("b", "k1", 60) == "u1"
+    cache.set("b", "k3", 60, "u3")
+    assert cache.get("b", "k2", 60) is None
+    assert cache.get("b", "k1", 60) == "u1"
+    cache.discard("b", "k1")
+    assert cache.get("b", "k1", 60) is None
+
+    bucket = storage.ObjectStorage()
+    url = bucket.presign(key="k")
+    asyncio.run(bucket.remove_object(key="k"))
+    assert bucket.presign(key="k") != url
+
+
+def test_listing_follows_continuation_tokens(s3):
+    async def main():
+        s3.page_size = 2
+        keys = ["p/a/1", "p/a/2", "p/b/1", "p/b/2", "p/b/3", "p/c", "q/x"]
+        for key in keys:
+            s3.objects[key] = (b"", "text/plain")
+        bucket = storage.ObjectStorage()
+        pages = [page async for page in bucket.iter_pages(prefix="p/")]
+        assert len(pages) == 3
+        listed = [obj["Key"] async for obj in bucket.iter_objects("p/")]
+        assert listed == keys[:-1]
+
+        s3.calls.clear()
+        sharded = [obj["Key"] async for obj in bucket.iter_objects("p/", shard=True)]
+        assert sorted(sharded) == keys[:-1]
+        assert s3.calls["list_objects_v2"] == 2 + 1 + 2
+
+    asyncio.run(main())
+
+
+def test_sharded_listing_raises_the_errors_of_a_shard(s3):
+    async def main():
+        for key in ["p/a/1", "p/b/1"]:
+            s3.objects[key] = (b"", "text/plain")
+        s3.fail_prefix = "p/b/"
+        with pytest.raises(ClientError):
+            async for _ in storage.ObjectStorage().iter_objects("p/", shard=True):
+                pass
+
+    asyncio.run(main())
+
+
+def test_blobs_are_deduplicated_and_reference_counted(s3):
+    async def main():
+        bucket = storage.ObjectStorage(dedup=True)
+        one = hashlib.sha256(b"one").hexdigest()
+        two = hashlib.sha256(b"two").hexdigest()
+
+        async def put(key: str, data: bytes) -> str:
+            return await bucket.put_blob(
+                key=key, file=upload_file(data), content_type="text/plain"
+            )
+
+        async def refcount(sha: str) -> int | None:
+            data = await storage._find(storage.Blob, sha)  # pylint: disable=W0212
+            return data["refcount"] if data else None
+
+        first = await put("a", b"one")
+        assert first == f"blobs/{one[:2]}/{one}"
+        assert await put("b", b"one") == first
+        assert await put("a", b"one") == first
+        assert s3.calls["put_object"] == 1
+        assert set(s3.objects) == {first}
+        assert await refcount(one) == 2
+
+        second = await put("a", b"two")
+        assert await refcount(one) == 1
+        assert await refcount(two) == 1
+
+        await bucket.remove(key="b")
+        assert await refcount(one) is None
+        assert set(s3.objects) == {second}
+
+        response = await bucket.download(key="a")
+        assert b"".join([c async for c in response.body_iterator]) == b"two"
+
+    asyncio.run(main())
+
+
+def test_blobs_already_in_the_bucket_are_not_uploaded_again(s3):
+    async def main():
+        sha = hashlib.sha256(b"data").hexdigest()
+        s3.objects[f"blobs/{sha[:2]}/{sha}"] = (b"data", "text/plain")
+        bucket = storage.ObjectStorage(dedup=True)
+        await bucket.put_blob(
+            key="a", file=upload_file(b"data"), content_type="text/plain"
+        )
+        assert s3.calls["put_object"] == 0
+        assert s3.calls["upload_part"] == 0
+        assert (await storage._find(storage.Blob, sha))["refcount"] == 1
+
+    asyncio.run(main())